@@ -18,18 +18,49 @@ Last Updated: 2026-01-04
 from textual.app import App, ComposeResult
 from textual.widgets import (
     Static, Button, Input, Label, DataTable,
-    Footer, Header, Tree, RichLog, Markdown, TextArea, Select
+    Footer, Header, Tree, RichLog, Markdown, TextArea, Select, ProgressBar
 )
 from textual.containers import Horizontal, Vertical, Container
 from textual.screen import ModalScreen, Screen
 from textual.binding import Binding
 from textual.reactive import reactive
 from textual import on
+from textual.widgets.markdown import MarkdownBlock
+from textual.worker import get_current_worker
+from markdown_it import MarkdownIt
+from rich.markup import escape, MarkupError
+from rich.text import Text
 import subprocess
+import shutil
 from pathlib import Path
 import sys
 import os
 import asyncio
+import multiprocessing
+import signal
+import re
+import time
+import json
+import hashlib
+import ctypes
+import select
+import struct
+import threading
+import bisect
+import inspect
+import itertools
+import math
+import resource
+from datetime import datetime, date, timezone
+from typing import NamedTuple
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from functools import partial
+from collections import deque
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
 
 
 # =============================================
@@ -37,7 +68,1137 @@ import asyncio
 # =============================================
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent
-CONTENT_DIR = PROJECT_ROOT / "content" / "routing"
+CONTENT_ROOT = PROJECT_ROOT / "content"
+CACHE_DIR = PROJECT_ROOT / ".cache"
+
+# Section scanned when hugo.toml lists no params.mainSections
+DEFAULT_SECTION = "routing"
+
+# Sweeps requested within this window reuse the previous stat pass
+INDEX_SWEEP_INTERVAL = 0.5
+
+# Threads used to list directories and read frontmatter during a sweep
+SCAN_WORKERS = int(os.environ.get("TUI_SCAN_WORKERS", "8"))
+
+# Directories scanned per worker task before the rest is handed back
+SCAN_BATCH_SIZE = 64
+
+# Minimum seconds between progress reports of a running sweep
+SCAN_PROGRESS_INTERVAL = 0.1
+
+# Target memory per indexed post in bytes (measured with tracemalloc on a
+# 100k-post corpus: ~950 B/post for records and listings, ~1400 B/post
+# with the secondary indexes and both rank maps built)
+POST_RECORD_BUDGET = 1536
+
+# Seconds between checks of the git HEAD (only stat calls unless it moved)
+GIT_POLL_INTERVAL = 30
+
+# Minimum seconds between progress updates of a running file operation
+OPERATION_PROGRESS_INTERVAL = 0.1
+
+# Long-lived bash workers kept with scripts/lib loaded (extra concurrent
+# script runs beyond this fall back to a fresh bash)
+SHELL_WORKER_MAX = 4
+
+# Libraries sourced once per shell worker; a change to any of these (or to
+# .env) retires the workers so the next run loads the new version
+SHELL_WORKER_LIBS = ("common.sh", "logger.sh", "error-handler.sh", "config.sh")
+
+# Scripts run in a shell worker: those sourcing every one of the libraries
+# at top level (others run in a plain bash, since the worker's preloaded
+# functions and traps would differ from what the script itself sets up)
+SHELL_WORKER_SCRIPT_RE = re.compile(rb'^source\s+\S*scripts/lib/([\w.-]+\.sh)', re.MULTILINE)
+
+# Seconds of editor idle time before the open post is revalidated
+LINT_IDLE_DELAY = 1.0
+
+# Seconds between live preview refreshes while typing (one frame budget;
+# keystrokes in between are coalesced)
+PREVIEW_FRAME_BUDGET = 1 / 30
+
+# Bytes read from a task's output pipe per read
+OUTPUT_CHUNK_SIZE = 64 * 1024
+
+# Seconds between flushes of buffered task output to a log (one frame), and
+# the rendering time one flush may use; a larger backlog is carried over to
+# the next frames instead of freezing the UI
+OUTPUT_FLUSH_INTERVAL = 1 / 30
+OUTPUT_FLUSH_BUDGET = 0.015
+
+# Background jobs (build, tests, quality gate, preview, AI scripts): jobs
+# running at once, per kind and overall; extra submissions wait in a queue
+# where interactive jobs go ahead of background ones
+JOB_LIMITS = {"hugo": 1, "tests": 1, "quality": 1, "preview": 1, "ai": 2}
+JOB_DEFAULT_LIMIT = 2
+JOB_MAX_RUNNING = int(os.environ.get("TUI_JOB_MAX", str(max(3, (os.cpu_count() or 1) // 2))))
+
+# Seconds a cancelled job gets to exit after SIGTERM before SIGKILL
+JOB_KILL_GRACE = 3.0
+
+# Finished jobs listed in the jobs window
+JOB_HISTORY = 20
+
+# Seconds between /proc samples of a running job's process tree
+JOB_SAMPLE_INTERVAL = 1.0
+
+# CPU time / wall time above which a finished job is reported CPU-bound
+JOB_CPU_BOUND = 0.5
+
+# Append-only record of finished jobs (start, duration, exit code,
+# resource summary, git HEAD), one JSON object per line
+JOB_HISTORY_FILE = CACHE_DIR / "job-history.jsonl"
+
+# Successful runs per job series behind the median/p95 trends
+JOB_TREND_WINDOW = 20
+
+# Runs needed before a series' median is used as a regression baseline
+JOB_BASELINE_MIN = 5
+
+# A run slower than the trailing median by this fraction is flagged
+JOB_REGRESSION_MARGIN = float(os.environ.get("TUI_JOB_REGRESSION", "0.25"))
+
+# Preview server health probe: seconds between probes while starting and
+# once running, seconds a probe may take, and seconds to wait for startup
+PREVIEW_START_PROBE = 0.2
+PREVIEW_PROBE_INTERVAL = 2.0
+PREVIEW_PROBE_TIMEOUT = 1.0
+PREVIEW_START_TIMEOUT = 60.0
+
+# Site configuration whose changes restart the preview server (content
+# edits are picked up by hugo's livereload); themes/ is watched as well
+PREVIEW_CONFIG_FILES = ["hugo.toml", "hugo.yaml", "hugo.json", "config.toml", "config.yaml", "config.json"]
+
+# Lines kept in memory by the automation and AI logs (rendered, and in the
+# history ring); older lines spill to rotating files under logs/
+LOG_RING_LINES = int(os.environ.get("TUI_LOG_LINES", "2000"))
+
+# Spill file size before rotation, and rotated files kept per log
+LOG_SPILL_BYTES = 1024 * 1024
+LOG_SPILL_FILES = 4
+
+# Every Nth spilled line's offset is indexed (a page read skips < N lines)
+LOG_INDEX_STRIDE = 64
+
+# Lines per page in the log history browser
+LOG_PAGE_LINES = 200
+
+# Worker processes used by the native quality gate for multi-post runs
+QUALITY_GATE_WORKERS = int(os.environ.get("TUI_QUALITY_WORKERS", str(min(8, os.cpu_count() or 1))))
+
+
+# =============================================
+# POST INDEX
+# =============================================
+
+class FrontMatter(NamedTuple):
+    """
+    Parsed post frontmatter.
+
+    Fields:
+        title: Post title ('' if missing)
+        date: Date as an ISO string ('' if missing)
+        draft: Draft flag (Hugo default: False)
+        summary: Summary ('' if missing)
+        tags: Tag names
+        categories: Category names
+        fields: All header fields as parsed
+        format: 'toml', 'yaml' or '' when the file has no frontmatter
+    """
+    title: str = ''
+    date: str = ''
+    draft: bool = False
+    summary: str = ''
+    tags: tuple = ()
+    categories: tuple = ()
+    fields: dict = {}
+    format: str = ''
+
+
+# Give up looking for a closing delimiter after this many header lines
+FRONTMATTER_MAX_LINES = 500
+
+FRONTMATTER_DELIMITERS = {'+++': 'toml', '---': 'yaml'}
+
+
+def read_frontmatter(path: Path) -> FrontMatter:
+    """
+    Read only the frontmatter block of a file.
+
+    Reading stops at the closing delimiter, so the body is never
+    loaded. Files without frontmatter yield an empty FrontMatter.
+
+    Args:
+        path: Markdown file to read
+
+    Returns:
+        FrontMatter record
+    """
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        opening = f.readline().strip()
+        fmt = FRONTMATTER_DELIMITERS.get(opening)
+        if fmt is None:
+            return FrontMatter()
+
+        header = []
+        for _ in range(FRONTMATTER_MAX_LINES):
+            line = f.readline()
+            if not line or line.strip() == opening:
+                break
+            header.append(line)
+
+    return _build_frontmatter(''.join(header), fmt)
+
+
+def parse_frontmatter_text(content: str) -> FrontMatter:
+    """
+    Parse the frontmatter block of an in-memory document.
+
+    Args:
+        content: Full document text
+
+    Returns:
+        FrontMatter record
+    """
+    lines = content.split('\n', FRONTMATTER_MAX_LINES + 1)
+    fmt = FRONTMATTER_DELIMITERS.get(lines[0].strip())
+    if fmt is None:
+        return FrontMatter()
+
+    header = []
+    for line in lines[1:FRONTMATTER_MAX_LINES + 1]:
+        if line.strip() == lines[0].strip():
+            break
+        header.append(line)
+
+    return _build_frontmatter('\n'.join(header), fmt)
+
+
+def _build_frontmatter(header: str, fmt: str) -> FrontMatter:
+    """Parse a frontmatter header and map it onto a FrontMatter record."""
+    fields = None
+    if fmt == 'toml' and tomllib is not None:
+        try:
+            fields = tomllib.loads(header)
+        except tomllib.TOMLDecodeError:
+            fields = None
+    if fields is None:
+        fields = _parse_simple_header(header, '=' if fmt == 'toml' else ':')
+
+    def text(value) -> str:
+        if value is None:
+            return ''
+        if hasattr(value, 'isoformat'):
+            return value.isoformat()
+        return str(value)
+
+    def names(value) -> tuple:
+        if isinstance(value, (list, tuple)):
+            return tuple(str(item) for item in value)
+        return (str(value),) if value else ()
+
+    draft = fields.get('draft', False)
+    if isinstance(draft, str):
+        draft = draft.lower() == 'true'
+
+    return FrontMatter(
+        title=text(fields.get('title')),
+        date=text(fields.get('date')),
+        draft=bool(draft),
+        summary=text(fields.get('summary')),
+        tags=names(fields.get('tags')),
+        categories=names(fields.get('categories')),
+        fields=fields,
+        format=fmt,
+    )
+
+
+def _parse_simple_header(header: str, separator: str) -> dict:
+    """
+    Best-effort `key = value` / `key: value` parser.
+
+    Used for YAML headers and for TOML that tomllib rejects. Handles
+    quoted strings, booleans and single-line lists.
+    """
+    fields = {}
+    for line in header.split('\n'):
+        if separator not in line or line[:1].isspace() or line.lstrip().startswith('#'):
+            continue
+        key, value = line.split(separator, 1)
+        value = value.strip()
+        if value.startswith('[') and value.endswith(']'):
+            value = [item.strip().strip("'\"") for item in value[1:-1].split(',') if item.strip()]
+        elif value.lower() in ('true', 'false'):
+            value = value.lower() == 'true'
+        else:
+            value = value.strip("'\"")
+        fields[key.strip()] = value
+    return fields
+
+
+def parse_post_date(value) -> float:
+    """
+    Convert a frontmatter date to a sortable POSIX timestamp.
+
+    Accepts ISO 8601 strings (with or without time and offset), date and
+    datetime objects. Naive values are taken as UTC.
+
+    Args:
+        value: Date string or object
+
+    Returns:
+        Timestamp in seconds, or -inf if the date is missing or invalid
+        (so undated posts sort as the oldest)
+    """
+    if isinstance(value, str):
+        value = value.strip()
+        if not value:
+            return float('-inf')
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            try:
+                value = datetime.fromisoformat(value[:10])
+            except ValueError:
+                return float('-inf')
+
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day, tzinfo=timezone.utc).timestamp()
+    return float('-inf')
+
+
+class PostRecord:
+    """
+    Compact metadata record for one post.
+
+    Uses __slots__ instead of a per-instance dict, keeps a single
+    absolute path string (Path objects are built on demand) and interns
+    category and tag strings so repeated values are stored once.
+    """
+
+    __slots__ = ('file', 'title', 'date', 'timestamp', 'draft', 'summary', 'tags', 'category',
+                 'mtime_ns', 'size')
+
+    def __init__(self, file: str, title: str = '', date: str = '', draft: bool = False,
+                 summary: str = '', tags: tuple = (), mtime_ns: int = 0, size: int = 0):
+        self.file = file
+        self.title = title
+        self.date = date
+        self.timestamp = parse_post_date(date)
+        self.draft = draft
+        self.summary = summary
+        self.tags = tuple(sys.intern(tag) for tag in tags)
+        # Name of the directory that holds the bundle (e.g. 'bgp')
+        self.category = sys.intern(os.path.basename(os.path.dirname(os.path.dirname(file))))
+        self.mtime_ns = mtime_ns
+        self.size = size
+
+    @property
+    def path(self) -> Path:
+        """Absolute path of the post's index.md."""
+        return Path(self.file)
+
+    @property
+    def signature(self) -> tuple:
+        """(mtime_ns, size) used to revalidate the record."""
+        return (self.mtime_ns, self.size)
+
+    def to_row(self, root: str) -> list:
+        """Serialize for the cache file (path relative to `root`)."""
+        return [os.path.relpath(self.file, root), self.title, self.date, self.draft,
+                self.summary, list(self.tags), self.mtime_ns, self.size]
+
+    @classmethod
+    def from_row(cls, root: str, row: list) -> "PostRecord":
+        """Rebuild a record serialized with to_row."""
+        rel, title, date, draft, summary, tags, mtime_ns, size = row
+        return cls(os.path.join(root, rel), title, date, draft, summary, tags, mtime_ns, size)
+
+
+def parse_post_metadata(index_file: str, st: os.stat_result) -> PostRecord:
+    """
+    Parse the frontmatter fields the TUI displays from a post file.
+
+    Args:
+        index_file: Absolute path to a post's index.md
+        st: stat result the record's signature is taken from
+
+    Returns:
+        PostRecord. Missing fields are empty (draft defaults to False).
+    """
+    fm = read_frontmatter(index_file)
+    return PostRecord(index_file, fm.title, fm.date, fm.draft, fm.summary,
+                      fm.tags, st.st_mtime_ns, st.st_size)
+
+
+def record_bytes(record: PostRecord) -> int:
+    """
+    Approximate memory held by one record and the values it owns.
+
+    Interned category/tag strings are shared across records and are not
+    counted; the record's tuple of references is.
+    """
+    size = sys.getsizeof(record) + sys.getsizeof(record.tags) + sys.getsizeof(record.timestamp)
+    for value in (record.file, record.title, record.date, record.summary):
+        size += sys.getsizeof(value)
+    return size
+
+
+class SortedPosts:
+    """
+    Post records kept in the order of a sort key.
+
+    Additions are buffered and merged on the next read, so a sweep that
+    adds thousands of posts costs one sort instead of one insertion
+    each. A rank map (record -> position) is built on demand so subsets
+    can be ordered without calling `key`.
+    """
+
+    __slots__ = ('key', '_records', '_pending', '_rank')
+
+    # Buffered additions merged by insertion rather than a full sort
+    INSORT_LIMIT = 32
+
+    def __init__(self, key):
+        """
+        Args:
+            key: Callable mapping a record to its (unique) sort key
+        """
+        self.key = key
+        self._records = []
+        self._pending = set()
+        self._rank = None
+
+    def add(self, record: PostRecord) -> None:
+        self._pending.add(record)
+        self._rank = None
+
+    def discard(self, record: PostRecord) -> None:
+        self._rank = None
+        if record in self._pending:
+            self._pending.discard(record)
+            return
+        i = bisect.bisect_left(self._records, self.key(record), key=self.key)
+        if i < len(self._records) and self._records[i] is record:
+            del self._records[i]
+
+    def clear(self) -> None:
+        self._records.clear()
+        self._pending.clear()
+        self._rank = None
+
+    def records(self) -> list:
+        """Return the ordered record list (shared, do not mutate)."""
+        if self._pending:
+            if len(self._pending) <= self.INSORT_LIMIT:
+                for record in self._pending:
+                    bisect.insort(self._records, record, key=self.key)
+            else:
+                self._records.extend(self._pending)
+                self._records.sort(key=self.key)
+            self._pending.clear()
+        return self._records
+
+    def order(self, records) -> list:
+        """Return the given records sorted in this index's order."""
+        if self._rank is None:
+            self._rank = {record: i for i, record in enumerate(self.records())}
+        return sorted(records, key=self._rank.__getitem__)
+
+    def nbytes(self) -> int:
+        """Memory held by the order list and rank map (records excluded)."""
+        size = sys.getsizeof(self.records())
+        if self._rank is not None:
+            size += sys.getsizeof(self._rank)
+        return size
+
+    def between(self, low, high) -> list:
+        """Return records with low <= key < high, in order."""
+        records = self.records()
+        start = bisect.bisect_left(records, low, key=self.key) if low is not None else 0
+        end = bisect.bisect_left(records, high, key=self.key) if high is not None else len(records)
+        return records[start:end]
+
+
+class PostIndex:
+    """
+    In-memory index of post metadata shared by every content view.
+
+    Features:
+        - Parses each index.md once and keeps the result per post
+        - Revalidates entries by (mtime, size) on every sweep
+        - Caches directory listings by mtime, so unchanged directories
+          are never re-listed
+        - Persists to a cache file so a cold start only re-reads the
+          posts that changed since the last session
+        - Scans each site section as an independent shard with its own
+          cache file; the section being viewed is swept first
+        - Repeated sweeps within INDEX_SWEEP_INTERVAL are coalesced
+        - Entries for deleted posts are dropped on the next sweep
+        - Stores compact PostRecords keyed by path string; see
+          POST_RECORD_BUDGET for the per-post memory target
+        - Maintains secondary indexes (category, tag, draft, date and
+          title order) incrementally, backing query()
+    """
+
+    CACHE_VERSION = 4
+
+    def __init__(self, content_root: Path, sections: list[str], cache_dir: Path = None):
+        """
+        Initialize an empty index.
+
+        Args:
+            content_root: Content directory the sections live in
+            sections: Section directories (shards) scanned for page
+                      bundles (index.md), in default scan order
+            cache_dir: Optional directory for the per-section JSON caches
+        """
+        self.content_root = content_root
+        self.cache_dir = cache_dir
+        self._root = str(content_root)
+        self._shards = {name: os.path.join(self._root, name) for name in sections}
+        self._entries = {}  # index.md path str -> PostRecord
+        self._dirs = {}     # directory path str -> (mtime_ns, subdir names, has index.md)
+        self._last_sweep = 0.0
+        self._loaded = False
+        self._dirty = False
+        self._dirty_shards = set()             # shards changed since their last save
+        self._lock = threading.RLock()         # guards _entries/_dirs mutations
+        self._sweep_lock = threading.Lock()    # held for the duration of a sweep
+        self._pending_changes = set()          # changes deferred during a sweep
+
+        # Secondary indexes over the records stored in _entries
+        self._by_category = {}  # category -> set of records
+        self._by_tag = {}       # tag -> set of records
+        self._drafts = set()
+        self._by_date = SortedPosts(self._date_key)
+        self._by_title = SortedPosts(self._title_key)
+
+    @property
+    def sweeping(self) -> bool:
+        """True while a sweep is running (possibly in another thread)."""
+        return self._sweep_lock.locked()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def sections(self) -> list[str]:
+        """Names of the sections (shards) this index covers."""
+        return list(self._shards)
+
+    def refresh(self, force: bool = False, on_progress=None, first: str = None) -> bool:
+        """
+        Revalidate the index against the filesystem.
+
+        Only files whose (mtime, size) changed since the last sweep are
+        re-read; everything else costs a single stat call. Sections are
+        swept one after another and each section's cache is saved as
+        soon as it is done. If a sweep is already running in another
+        thread, this returns immediately and callers see the partially
+        updated index.
+
+        Args:
+            force: Sweep even if the previous sweep is still fresh
+            on_progress: Optional callback(posts_scanned), called from the
+                         sweeping thread at most every SCAN_PROGRESS_INTERVAL
+                         and after each section that changed
+            first: Section to sweep before the others (the visible one)
+
+        Returns:
+            True if this call swept and any entry changed
+        """
+        now = time.monotonic()
+        if not force and now - self._last_sweep < INDEX_SWEEP_INTERVAL:
+            return False
+
+        if not self._sweep_lock.acquire(blocking=False):
+            return False
+        try:
+            if not self._loaded:
+                self.load()
+
+            order = sorted(self._shards, key=lambda name: name != first)
+            changed = False
+            scanned = 0
+            for name in order:
+                base = scanned
+                report = (lambda count: on_progress(base + count)) if on_progress else None
+
+                self._dirty = False
+                scanned += self._sweep(self._shards[name], report)
+                if self._dirty:
+                    changed = True
+                    self._dirty_shards.add(name)
+                    self.save()
+                    if on_progress:
+                        on_progress(scanned)
+            self._last_sweep = time.monotonic()
+
+            pending, self._pending_changes = self._pending_changes, set()
+            if pending:
+                changed = self._apply_changes(pending) or changed
+            return changed
+        finally:
+            self._sweep_lock.release()
+
+    def apply_changes(self, paths) -> bool:
+        """
+        Apply filesystem change notifications without a full sweep.
+
+        Changed index.md files are revalidated directly. Any other path
+        invalidates the cached listing of its directory and triggers a
+        sweep of just that subtree. Changes arriving while a full sweep
+        is running are applied when that sweep finishes.
+
+        Args:
+            paths: Iterable of changed paths below the content root
+                   (paths outside the indexed sections are ignored)
+
+        Returns:
+            True if any post metadata changed
+        """
+        paths = {os.fspath(path) for path in paths}
+        if not self._sweep_lock.acquire(blocking=False):
+            self._pending_changes.update(paths)
+            return False
+        try:
+            if not self._loaded:
+                self.load()
+            return self._apply_changes(paths)
+        finally:
+            self._sweep_lock.release()
+
+    def _apply_changes(self, paths) -> bool:
+        """Apply change notifications (caller holds the sweep lock)."""
+        self._dirty = False
+        touched = set()
+        sweep_roots = set()
+        for path in paths:
+            shard = self._shard_of(path)
+            if shard is None:
+                continue
+            touched.add(shard)
+
+            if os.path.basename(path) == "index.md":
+                self._revalidate(path)
+            else:
+                parent = os.path.dirname(path)
+                with self._lock:
+                    self._dirs.pop(path, None)
+                    self._dirs.pop(parent, None)
+                # Never sweep above the section (e.g. for the section itself)
+                shard_root = self._shards[shard]
+                sweep_roots.add(parent if _is_under(parent, shard_root) else shard_root)
+
+        # Sweep each affected subtree once, skipping nested duplicates
+        for root in sorted(sweep_roots, key=len):
+            if any(_is_under(root, done) for done in sweep_roots if done != root):
+                continue
+            self._sweep(root)
+
+        if not self._dirty:
+            return False
+        self._dirty_shards.update(touched)
+        self.save()
+        return True
+
+    def _shard_of(self, path: str):
+        """Return the name of the section containing `path`, or None."""
+        for name, shard_root in self._shards.items():
+            if _is_under(path, shard_root):
+                return name
+        return None
+
+    def _revalidate(self, index_file: str) -> None:
+        """
+        Bring a single entry up to date with its file on disk.
+
+        Args:
+            index_file: Path to the post's index.md
+        """
+        self._store_entry(index_file, self._load_entry(index_file, self._entries.get(index_file)))
+
+    def _load_entry(self, index_file: str, entry: PostRecord):
+        """
+        Return an up-to-date record for a post (safe to run in a worker).
+
+        Args:
+            index_file: Path to the post's index.md
+            entry: Current record, or None if the post is not indexed
+
+        Returns:
+            The unchanged record if its signature still matches, a freshly
+            parsed record if the file changed, or None if the file is gone
+        """
+        try:
+            st = os.stat(index_file)
+        except OSError:
+            return None
+
+        if entry is not None and entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+            return entry
+
+        try:
+            return parse_post_metadata(index_file, st)
+        except Exception:
+            return entry
+
+    def _store_entry(self, index_file: str, entry) -> None:
+        """Store a result of _load_entry, tracking whether anything changed."""
+        with self._lock:
+            current = self._entries.get(index_file)
+            if entry is current:
+                return
+            if current is not None:
+                self._unindex(current)
+            if entry is None:
+                del self._entries[index_file]
+            else:
+                self._entries[index_file] = entry
+                self._index(entry)
+            self._dirty = True
+
+    @staticmethod
+    def _date_key(record: PostRecord) -> tuple:
+        return (record.timestamp, record.file)
+
+    @staticmethod
+    def _title_key(record: PostRecord) -> tuple:
+        return (record.title.casefold(), record.file)
+
+    def _index(self, record: PostRecord) -> None:
+        """Add a stored record to the secondary indexes (caller holds _lock)."""
+        self._by_category.setdefault(record.category, set()).add(record)
+        for tag in record.tags:
+            self._by_tag.setdefault(tag, set()).add(record)
+        if record.draft:
+            self._drafts.add(record)
+        self._by_date.add(record)
+        self._by_title.add(record)
+
+    def _unindex(self, record: PostRecord) -> None:
+        """Remove a record from the secondary indexes (caller holds _lock)."""
+        for index, key in [(self._by_category, record.category)] + [
+                (self._by_tag, tag) for tag in record.tags]:
+            records = index.get(key)
+            if records is not None:
+                records.discard(record)
+                if not records:
+                    del index[key]
+        self._drafts.discard(record)
+        self._by_date.discard(record)
+        self._by_title.discard(record)
+
+    def _list_dir(self, dir_path: str):
+        """
+        Return a directory's (mtime_ns, subdir names, has index.md).
+
+        The cached listing is reused while the directory's mtime is
+        unchanged. Safe to run in a worker thread.
+
+        Returns:
+            Listing tuple, or None if the directory cannot be read
+        """
+        try:
+            mtime = os.stat(dir_path).st_mtime_ns
+        except OSError:
+            return None
+
+        cached = self._dirs.get(dir_path)
+        if cached is not None and cached[0] == mtime:
+            return cached
+
+        subdirs = []
+        has_index = False
+        try:
+            with os.scandir(dir_path) as it:
+                for item in it:
+                    if item.name == "index.md" and item.is_file():
+                        has_index = True
+                    elif item.is_dir() and not item.name.startswith('.'):
+                        subdirs.append(sys.intern(item.name))
+        except OSError:
+            return None
+        return (mtime, tuple(sorted(subdirs)), has_index)
+
+    def _scan_batch(self, dirs: list) -> tuple:
+        """
+        Scan directories depth-first in a worker thread.
+
+        Lists each directory and, for page bundles, loads the entry.
+        At most SCAN_BATCH_SIZE directories are handled per task so the
+        work spreads across the pool without one future per directory.
+
+        Args:
+            dirs: Directories to start from
+
+        Returns:
+            Tuple of ([(dir, listing or None, entry or None)], directories
+            left unscanned)
+        """
+        results = []
+        stack = list(dirs)
+        while stack and len(results) < SCAN_BATCH_SIZE:
+            dir_path = stack.pop()
+            listing = self._list_dir(dir_path)
+            entry = None
+            if listing is not None:
+                if listing[2]:
+                    index_file = os.path.join(dir_path, "index.md")
+                    entry = self._load_entry(index_file, self._entries.get(index_file))
+                else:
+                    stack.extend(os.path.join(dir_path, name) for name in reversed(listing[1]))
+            results.append((dir_path, listing, entry))
+        return results, stack
+
+    def _sweep(self, start: str, on_progress=None) -> int:
+        """
+        Revalidate every entry and directory listing below `start`.
+
+        Directory listings and frontmatter reads are fanned out across a
+        pool of SCAN_WORKERS threads; results are merged in the calling
+        thread as they complete. Page bundles are leaves in Hugo, so
+        directories that contain an index.md are not descended into.
+
+        Args:
+            start: Directory to sweep (a section root for a full sweep)
+            on_progress: Optional callback(posts_scanned)
+
+        Returns:
+            Number of posts found below `start`
+        """
+        seen = set()
+        seen_dirs = set()
+        last_report = time.monotonic()
+
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS, thread_name_prefix="post-scan") as pool:
+            pending = {pool.submit(self._scan_batch, [start])}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results, leftover = future.result()
+                    for dir_path, listing, entry in results:
+                        if listing is None:
+                            continue
+
+                        seen_dirs.add(dir_path)
+                        with self._lock:
+                            if self._dirs.get(dir_path) != listing:
+                                self._dirs[dir_path] = listing
+                                self._dirty = True
+
+                        if listing[2]:
+                            index_file = os.path.join(dir_path, "index.md")
+                            seen.add(index_file)
+                            self._store_entry(index_file, entry)
+
+                    # Hand unfinished directories back out across the pool
+                    chunk = max(1, -(-len(leftover) // SCAN_WORKERS))
+                    for i in range(0, len(leftover), chunk):
+                        pending.add(pool.submit(self._scan_batch, leftover[i:i + chunk]))
+
+                if on_progress and time.monotonic() - last_report >= SCAN_PROGRESS_INTERVAL:
+                    last_report = time.monotonic()
+                    on_progress(len(seen))
+
+        prefix = os.path.join(start, "")
+        with self._lock:
+            for stale in [p for p in self._entries if p.startswith(prefix) and p not in seen]:
+                self._unindex(self._entries[stale])
+                del self._entries[stale]
+                self._dirty = True
+            for stale in [p for p in self._dirs
+                          if (p == start or p.startswith(prefix)) and p not in seen_dirs]:
+                del self._dirs[stale]
+                self._dirty = True
+
+        return len(seen)
+
+    def _cache_file(self, name: str) -> Path:
+        """Cache file for one section."""
+        return self.cache_dir / f"post-index-{name}.json"
+
+    def load(self) -> None:
+        """
+        Load previously persisted sections from their cache files.
+
+        Each section is validated on its own: a missing, unreadable or
+        outdated cache only leaves that section empty, and the next sweep
+        rebuilds it from disk.
+        """
+        self._loaded = True
+        if not self.cache_dir:
+            return
+        for name in self._shards:
+            self._load_shard(name)
+
+    def _load_shard(self, name: str) -> None:
+        """Load one section's cache file, if it is present and current."""
+        cache_file = self._cache_file(name)
+        if not cache_file.exists():
+            return
+
+        try:
+            with open(cache_file) as f:
+                data = json.load(f)
+            if data.get('version') != self.CACHE_VERSION or data.get('section') != name:
+                return
+
+            dirs = {}
+            for rel, mtime, subdirs, has_index in data['dirs']:
+                dir_path = os.path.normpath(os.path.join(self._root, rel))
+                dirs[dir_path] = (mtime, tuple(sys.intern(sub) for sub in subdirs), has_index)
+            records = [PostRecord.from_row(self._root, row) for row in data['entries']]
+        except Exception:
+            return
+
+        with self._lock:
+            self._dirs.update(dirs)
+            for record in records:
+                self._entries[record.file] = record
+                self._index(record)
+
+    def save(self) -> None:
+        """Persist every changed section to its cache file (atomic replace)."""
+        self._dirty = False
+        dirty, self._dirty_shards = self._dirty_shards, set()
+        if not self.cache_dir:
+            return
+        for name in dirty:
+            self._save_shard(name)
+
+    def _save_shard(self, name: str) -> None:
+        """Write one section's entries and listings to its cache file."""
+        shard_root = self._shards[name]
+        with self._lock:
+            data = {
+                'version': self.CACHE_VERSION,
+                'section': name,
+                'dirs': [
+                    [os.path.relpath(dir_path, self._root), mtime, list(subdirs), has_index]
+                    for dir_path, (mtime, subdirs, has_index) in self._dirs.items()
+                    if _is_under(dir_path, shard_root)
+                ],
+                'entries': [
+                    record.to_row(self._root)
+                    for file, record in self._entries.items()
+                    if _is_under(file, shard_root)
+                ],
+            }
+
+        try:
+            cache_file = self._cache_file(name)
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_file, cache_file)
+        except Exception:
+            pass
+
+    def entries(self, under: Path = None, depth: int = None, refresh: bool = True) -> list[PostRecord]:
+        """
+        Return indexed posts, optionally restricted to a subtree.
+
+        Args:
+            under: Only include posts below this directory
+            depth: Only include posts exactly this many path parts
+                   below `under` (index.md included)
+            refresh: Revalidate first; pass False to read the current
+                     snapshot (e.g. the persisted cache) without any I/O
+                     beyond loading the cache file
+
+        Returns:
+            List of PostRecords (shared, do not mutate)
+        """
+        self._ensure_current(refresh)
+
+        with self._lock:
+            records = list(self._entries.values())
+
+        if under is None:
+            return records
+
+        in_subtree = _subtree_filter(under, depth)
+        return [record for record in records if in_subtree(record.file)]
+
+    def query(self, under: Path = None, depth: int = None, category: str = None,
+              tag: str = None, draft: bool = None, since=None, until=None,
+              sort: str = 'date', reverse: bool = False, refresh: bool = False) -> list[PostRecord]:
+        """
+        Return posts matching all given filters, in sorted order.
+
+        Filters are answered from the secondary indexes: category and tag
+        narrow to record sets, the date range is a bisection of the date
+        order, and the result is read off the requested sort order
+        rather than sorted per call.
+
+        Args:
+            under: Only include posts below this directory
+            depth: Path depth below `under` (see entries())
+            category: Category (directory above the bundle), e.g. 'bgp'
+            tag: Tag the post must carry
+            draft: True for drafts only, False for published only
+            since: Earliest date, inclusive (str, date or datetime)
+            until: Latest date, exclusive (str, date or datetime)
+            sort: 'date' or 'title'
+            reverse: Descending order (newest or Z first)
+            refresh: Revalidate first (default: use the current snapshot)
+
+        Returns:
+            List of PostRecords (shared, do not mutate)
+        """
+        if sort not in ('date', 'title'):
+            raise ValueError(f"Unknown sort order: {sort}")
+
+        self._ensure_current(refresh)
+
+        with self._lock:
+            # Narrow to the intersection of the record sets, smallest first
+            sets = []
+            if category is not None:
+                sets.append(self._by_category.get(category, frozenset()))
+            if tag is not None:
+                sets.append(self._by_tag.get(tag, frozenset()))
+            if draft:
+                sets.append(self._drafts)
+            candidates = None
+            if sets:
+                sets.sort(key=len)
+                candidates = sets[0].intersection(*sets[1:]) if len(sets) > 1 else sets[0]
+
+            order = self._by_date if sort == 'date' else self._by_title
+            ordered = order.records()
+            if since is not None or until is not None:
+                low = (parse_post_date(since), '') if since is not None else None
+                high = (parse_post_date(until), '') if until is not None else None
+                in_range = self._by_date.between(low, high)
+                if sort == 'date':
+                    # The range slice is already in order; only filter it
+                    ordered = in_range
+                    if candidates is not None:
+                        candidates = frozenset(filter(candidates.__contains__, in_range))
+                else:
+                    in_range = set(in_range)
+                    candidates = in_range if candidates is None else in_range.intersection(candidates)
+
+            if candidates is None:
+                records = list(ordered)
+            elif len(candidates) * 4 < len(ordered):
+                # Few matches: ordering them by rank beats walking the order
+                records = order.order(candidates)
+            else:
+                records = list(filter(candidates.__contains__, ordered))
+
+        if draft is False:
+            records = [record for record in records if not record.draft]
+        if under is not None:
+            in_subtree = _subtree_filter(under, depth)
+            records = [record for record in records if in_subtree(record.file)]
+        if reverse:
+            records.reverse()
+        return records
+
+    def categories(self, refresh: bool = False) -> list[str]:
+        """Return the names of all categories that contain posts, sorted."""
+        self._ensure_current(refresh)
+        with self._lock:
+            return sorted(self._by_category)
+
+    def tags(self, refresh: bool = False) -> dict:
+        """Return a mapping of tag -> number of posts carrying it."""
+        self._ensure_current(refresh)
+        with self._lock:
+            return {tag: len(ids) for tag, ids in sorted(self._by_tag.items())}
+
+    def _ensure_current(self, refresh: bool) -> None:
+        """Refresh the index, or just make sure the cache was loaded."""
+        if refresh:
+            self.refresh()
+        elif not self._loaded:
+            with self._sweep_lock:
+                if not self._loaded:
+                    self.load()
+
+    def bytes_per_post(self) -> float:
+        """
+        Average memory per indexed post (record, its strings, key,
+        directory listing and secondary indexes), for comparison with
+        POST_RECORD_BUDGET.
+        """
+        with self._lock:
+            records = list(self._entries.values())
+            dir_bytes = sum(sys.getsizeof(key) + sys.getsizeof(value)
+                            for key, value in self._dirs.items())
+            index_bytes = sys.getsizeof(self._drafts) + sum(
+                sys.getsizeof(members)
+                for index in (self._by_category, self._by_tag)
+                for members in index.values()
+            ) + self._by_date.nbytes() + self._by_title.nbytes()
+        if not records:
+            return 0.0
+        total = sum(record_bytes(record) for record in records)
+        # Entry keys are the record's own path string (shared, not copied)
+        return (total + dir_bytes + index_bytes) / len(records)
+
+
+def _is_under(path: str, root: str) -> bool:
+    """True if `path` is `root` or lies below it (string paths)."""
+    return path == root or path.startswith(os.path.join(root, ""))
+
+
+def _subtree_filter(under: Path, depth: int = None):
+    """
+    Build a predicate for post files below `under`.
+
+    Args:
+        under: Directory the file must lie below
+        depth: Required number of path parts below `under`, or None
+
+    Returns:
+        Callable taking a path string and returning bool
+    """
+    prefix = os.path.join(os.fspath(under), "")
+
+    def in_subtree(file: str) -> bool:
+        if not file.startswith(prefix):
+            return False
+        return depth is None or file.count(os.sep, len(prefix)) + 1 == depth
+
+    return in_subtree
+
+
+def get_site_sections() -> list[str]:
+    """
+    Read the site's main sections from hugo.toml.
+
+    Returns:
+        Section names (params.mainSections), or just the default
+        section if the config cannot be read
+    """
+    try:
+        with open(PROJECT_ROOT / "hugo.toml", 'rb') as f:
+            if tomllib is not None:
+                sections = tomllib.load(f).get('params', {}).get('mainSections')
+            else:
+                match = re.search(r'mainSections\s*=\s*\[([^\]]*)\]', f.read().decode())
+                sections = re.findall(r'["\']([^"\']+)["\']', match.group(1)) if match else None
+        if sections:
+            return [str(name) for name in sections]
+    except Exception:
+        pass
+    return [DEFAULT_SECTION]
+
+
+POST_INDEX = PostIndex(CONTENT_ROOT, get_site_sections(), CACHE_DIR)
+
+# Section that bare category names belong to: the first main section
+CONTENT_DIR = CONTENT_ROOT / POST_INDEX.sections[0]
 
 
 # =============================================
@@ -75,7 +1236,7 @@ def run_command(cmd: list, cwd: str = None) -> tuple[int, str, str]:
 
 def get_draft_posts() -> list[dict]:
     """
-    Scan content directory for draft posts.
+    Scan all site sections for draft posts.
     
     Returns:
         List of dictionaries containing post metadata:
@@ -83,35 +1244,25 @@ def get_draft_posts() -> list[dict]:
         - title: Post title
         - path: Relative path from project root
     """
-    drafts = []
     try:
-        for cat_dir in CONTENT_DIR.iterdir():
-            if cat_dir.is_dir():
-                for post_dir in cat_dir.iterdir():
-                    index_file = post_dir / "index.md"
-                    if index_file.exists():
-                        with open(index_file) as f:
-                            content = f.read()
-                            if 'draft = true' in content:
-                                title = "Untitled"
-                                for line in content.split('\n'):
-                                    if line.strip().startswith('title ='):
-                                        title = line.split('=')[1].strip().strip("'\"")
-                                        break
-
-                                drafts.append({
-                                    'category': cat_dir.name,
-                                    'title': title,
-                                    'path': str(index_file.relative_to(PROJECT_ROOT))
-                                })
+        return [
+            {
+                'category': entry.category,
+                'title': entry.title or "Untitled",
+                'path': os.path.relpath(entry.file, PROJECT_ROOT),
+            }
+            for entry in POST_INDEX.query(draft=True, sort='title', refresh=True)
+        ]
     except Exception as e:
-        pass
-    return drafts
+        return []
 
 
-def get_all_posts() -> list[dict]:
+def get_all_posts(refresh: bool = True) -> list[dict]:
     """
-    Scan content directory for all posts (drafts and published).
+    Scan all site sections for posts (drafts and published).
+
+    Args:
+        refresh: Revalidate the post index first (False: use snapshot)
     
     Returns:
         List of dictionaries containing post metadata:
@@ -123,27 +1274,14 @@ def get_all_posts() -> list[dict]:
     """
     posts = []
     try:
-        for cat_dir in CONTENT_DIR.iterdir():
-            if cat_dir.is_dir():
-                for post_dir in cat_dir.iterdir():
-                    index_file = post_dir / "index.md"
-                    if index_file.exists():
-                        with open(index_file) as f:
-                            content = f.read()
-                            is_draft = 'draft = true' in content
-                            title = "Untitled"
-                            for line in content.split('\n'):
-                                if line.strip().startswith('title ='):
-                                    title = line.split('=')[1].strip().strip("'\"")
-                                    break
-
-                            posts.append({
-                                'category': cat_dir.name,
-                                'title': title,
-                                'path': str(index_file.relative_to(PROJECT_ROOT)),
-                                'is_draft': is_draft,
-                                'full_path': str(index_file)
-                            })
+        for entry in POST_INDEX.entries(refresh=refresh):
+            posts.append({
+                'category': entry.category,
+                'title': entry.title or "Untitled",
+                'path': os.path.relpath(entry.file, PROJECT_ROOT),
+                'is_draft': entry.draft,
+                'full_path': entry.file
+            })
     except Exception as e:
         pass
     return posts
@@ -151,18 +1289,27 @@ def get_all_posts() -> list[dict]:
 
 def get_categories() -> list[str]:
     """
-    Get list of all category directories.
-    
+    Get list of all category directories across the site sections.
+
+    Categories are the directories inside a section that are not page
+    bundles themselves; sections holding bundles directly are listed
+    under their own name.
+
     Returns:
         Sorted list of category names
     """
-    categories = []
-    try:
-        for cat_dir in CONTENT_DIR.iterdir():
-            if cat_dir.is_dir():
-                categories.append(cat_dir.name)
-    except Exception as e:
-        pass
+    categories = set()
+    for section in POST_INDEX.sections:
+        try:
+            for cat_dir in (CONTENT_ROOT / section).iterdir():
+                if not cat_dir.is_dir():
+                    continue
+                if (cat_dir / "index.md").exists():
+                    categories.add(section)
+                else:
+                    categories.add(cat_dir.name)
+        except Exception as e:
+            pass
     return sorted(categories)
 
 
@@ -214,13 +1361,17 @@ def create_category(category_name: str) -> tuple[bool, str]:
     Create a new category directory.
     
     Args:
-        category_name: Name of the category to create
+        category_name: "section/name" for one of the site sections, or a
+                       bare name created in the first section
         
     Returns:
         Tuple of (success: bool, message: str)
     """
     try:
-        cat_path = CONTENT_DIR / category_name.lower()
+        section, _, name = category_name.lower().partition('/')
+        if not name or section not in POST_INDEX.sections:
+            section, name = CONTENT_DIR.name, category_name.lower()
+        cat_path = CONTENT_ROOT / section / name
         if cat_path.exists():
             return False, f"Category '{category_name}' already exists"
 
@@ -250,119 +1401,3755 @@ def read_post_content(post_path: str) -> str:
         return f"# Error\n\n{str(e)}"
 
 
-def get_stats() -> dict:
+def get_post_counts(refresh: bool = True) -> dict:
+    """
+    Count draft and published posts, overall and per category.
+
+    Args:
+        refresh: Revalidate the post index first (False: use snapshot)
+
+    Returns:
+        Dictionary containing:
+        - drafts: Total number of draft posts
+        - published: Total number of published posts
+        - categories: Dict mapping category names to post counts
+    """
+    counts = {
+        'drafts': 0,
+        'published': 0,
+        'categories': {}
+    }
+
+    try:
+        # Empty categories are listed too
+        for cat_name in get_categories():
+            counts['categories'][cat_name] = {'drafts': 0, 'published': 0}
+
+        for post in get_all_posts(refresh=refresh):
+            cat_counts = counts['categories'].setdefault(post['category'], {'drafts': 0, 'published': 0})
+            if post['is_draft']:
+                counts['drafts'] += 1
+                cat_counts['drafts'] += 1
+            else:
+                counts['published'] += 1
+                cat_counts['published'] += 1
+    except Exception as e:
+        pass
+
+    return counts
+
+
+def get_stats(refresh: bool = True) -> dict:
+    """
+    Calculate blog statistics.
+
+    Args:
+        refresh: Revalidate the post index first (False: use snapshot)
+    
+    Returns:
+        Dictionary containing:
+        - drafts: Total number of draft posts
+        - published: Total number of published posts
+        - categories: Dict mapping category names to post counts
+        - last_commit: Human-readable time of last git commit (from the
+          GIT_INFO cache; a placeholder until it has been fetched)
+    """
+    stats = get_post_counts(refresh=refresh)
+    stats['last_commit'] = GIT_INFO.last_commit
+    return stats
+
+
+# =============================================
+# POST SCAFFOLDING
+# =============================================
+
+# Index.md body for homelab posts: failure-first "journey" template
+HOMELAB_POST_TEMPLATE = """## TL;DR
+[One paragraph: what broke, what fixed it, the one thing to remember.]
+
+## The setup
+[What you were trying to do. Version-stamp it — these stacks drift fast:
+e.g. NixOS 26.05, k3s v1.35.6, as of YYYY-MM. Link the real config/commit.]
+
+## What actually happened
+[Narrate the failure chronologically. Paste logs and exact error messages.]
+
+## The fix
+[What worked, with the smallest reproducible snippet.]
+
+## What I tried that didn't work
+[The graveyard — this is the part readers can't get anywhere else.]
+
+## Lessons
+[Generalizable takeaways — what to check first next time.]
+
+## References
+- [Docs, commits, dotfiles]
+"""
+
+# Index.md body for everything else: routing/Junos study template
+STUDY_POST_TEMPLATE = """## Overview
+[Provide a brief introduction to the topic]
+
+## Background
+[Explain the context and why this topic matters]
+
+## Key Concepts
+
+### Concept 1
+[Detailed explanation]
+
+### Concept 2
+[Detailed explanation]
+
+## Configuration Examples
+
+```junos
+# Add configuration examples here
+
+```
+
+## Verification
+
+```bash
+# Add verification commands here
+
+```
+
+## Troubleshooting
+
+[Common issues and solutions]
+
+## Exam Tips
+
+[JNCIE-SP specific tips]
+
+## Summary
+
+[Key takeaways]
+
+## References
+
+- [Juniper Documentation](https://www.juniper.net/documentation/)
+"""
+
+
+def generate_slug(title: str) -> str:
+    """
+    Turn a post title into a directory name (same rules as create-post.sh).
+
+    Args:
+        title: Post title
+
+    Returns:
+        Lowercase slug of [a-z0-9] runs joined by single hyphens
+    """
+    return re.sub(r'[^a-z0-9]+', '-', title.lower()).strip('-')
+
+
+def _toml_string(value: str) -> str:
+    """Quote a value as a TOML string (literal if possible, like the script)."""
+    if "'" not in value and '\n' not in value:
+        return f"'{value}'"
+    return json.dumps(value)
+
+
+def get_post_dir(category: str, slug: str) -> Path:
+    """
+    Return the bundle directory for a new post.
+
+    Homelab posts sit directly under content/homelab; a 'section/category'
+    path is used as is below content/; a bare category nests under the
+    first main section that has a directory of that name (the first
+    main section if none does, which create_post reports as invalid).
+
+    Args:
+        category: 'homelab', 'section/category' or a bare category name
+        slug: Post slug
+
+    Returns:
+        Path of the post's bundle directory
+    """
+    if category == "homelab":
+        return CONTENT_ROOT / "homelab" / slug
+    if "/" in category:
+        return CONTENT_ROOT / category / slug
+    for section in POST_INDEX.sections:
+        if (CONTENT_ROOT / section / category).is_dir():
+            return CONTENT_ROOT / section / category / slug
+    return CONTENT_DIR / category / slug
+
+
+def create_post(category: str, title: str, body: str = None, force: bool = False) -> tuple[bool, str, Path]:
+    """
+    Create a post bundle in-process (mirrors create-post.sh).
+
+    Creates <post_dir>/index.md with draft frontmatter and the category's
+    template, plus a featured.png placeholder (rendered with ImageMagick
+    if it is installed).
+
+    Args:
+        category: 'homelab', 'section/category' or a bare category name
+        title: Post title
+        body: Markdown to use instead of the template; if it carries its
+              own frontmatter it is written unchanged
+        force: Overwrite an existing post with the same slug
+
+    Returns:
+        Tuple of (success: bool, message: str, index file or None)
+    """
+    title = title.strip()
+    slug = generate_slug(title)
+    if not title or not slug:
+        return False, "Title must contain letters or digits", None
+
+    post_dir = get_post_dir(category, slug)
+    if not post_dir.parent.is_dir():
+        return False, f"Invalid category: {category} (no directory {post_dir.parent.relative_to(PROJECT_ROOT)})", None
+    if post_dir.exists() and not force:
+        return False, f"Post already exists: {post_dir.relative_to(PROJECT_ROOT)}", None
+
+    is_homelab = category == "homelab" or category.startswith("homelab/")
+    if is_homelab:
+        tags = ["Homelab", "NixOS", "Kubernetes"]
+        summary = "One or two sentences — lead with the failure or the question."
+        template = HOMELAB_POST_TEMPLATE
+    else:
+        tags = [category, "Routing", "Networking"]
+        summary = "Add a 2-3 sentence summary of this post"
+        template = STUDY_POST_TEMPLATE
+
+    if body and body.lstrip().startswith(("+++", "---")):
+        text = body
+    else:
+        text = (
+            "+++\n"
+            f"title = {_toml_string(title)}\n"
+            f"date = {datetime.now().astimezone().isoformat(timespec='seconds')}\n"
+            "draft = true\n"
+            f"tags = {json.dumps(tags, ensure_ascii=False)}\n"
+            "featured_image = 'featured.png'\n"
+            f"summary = {_toml_string(summary)}\n"
+            "+++\n\n"
+            + (body if body and body.strip() else template)
+        )
+
+    try:
+        post_dir.mkdir(parents=True, exist_ok=True)
+        index_file = post_dir / "index.md"
+        index_file.write_text(text)
+        _create_featured_image(post_dir / "featured.png", title)
+    except OSError as e:
+        return False, f"Failed to create post: {e}", None
+
+    return True, f"Post created: {index_file.relative_to(PROJECT_ROOT)}", index_file
+
+
+def _create_featured_image(image_file: Path, title: str) -> None:
+    """Render a placeholder featured image, or create an empty file."""
+    convert = shutil.which("convert")
+    if convert:
+        width = os.environ.get("IMAGE_DEFAULT_WIDTH", "1200")
+        height = os.environ.get("IMAGE_DEFAULT_HEIGHT", "630")
+        color = os.environ.get("IMAGE_PLACEHOLDER_COLOR", "#5e81ac")
+        try:
+            result = subprocess.run(
+                [convert, "-size", f"{width}x{height}", f"xc:{color}",
+                 "-pointsize", "48", "-fill", "white", "-gravity", "center",
+                 "-annotate", "0", title, str(image_file)],
+                capture_output=True,
+                timeout=60
+            )
+            if result.returncode == 0:
+                return
+        except Exception:
+            pass
+    image_file.touch()
+
+
+# =============================================
+# DOCUMENT MODEL
+# =============================================
+
+# Matched per line the way `grep -oE` does in the shell validators
+MARKDOWN_IMAGE_RE = re.compile(r'!\[.*\]\([^)]+\)')
+MARKDOWN_LINK_RE = re.compile(r'\[.*\]\([^)]+\)')
+MARKDOWN_HEADING_RE = re.compile(r'(#{1,6})[ \t]+(.*?)[ \t#]*$')
+
+# Parsed documents kept in memory (least recently used dropped first)
+DOCUMENT_CACHE_SIZE = 256
+
+
+def content_digest(data: bytes) -> str:
+    """Hash of a post's content for the document and quality result caches."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class PostDocument(NamedTuple):
+    """
+    Everything the analyzers read from a post, built in one pass.
+
+    Fields:
+        digest: Content hash the model was built from
+        lines: Text lines (final newline dropped)
+        frontmatter: Parsed FrontMatter
+        header: Lines inside `sed -n '/^+++/,/^+++/p'` ranges, delimiters included
+        body: Lines after the closing '+++' (up to any further '+++')
+        headings: (line index, level, text) of body headings outside code
+        code_blocks: (start, end, language) of body code fences; end is -1 if unclosed
+        fence_lines: Lines anywhere in the file containing a ``` fence
+        images: Image targets in document order
+        links: Link targets in document order (images included, as grep matches them)
+        word_count: Body words with code blocks excluded
+    """
+    digest: str
+    lines: tuple
+    frontmatter: FrontMatter
+    header: tuple
+    body: tuple
+    headings: tuple
+    code_blocks: tuple
+    fence_lines: int
+    images: tuple
+    links: tuple
+    word_count: int
+
+
+def _link_target(text: str) -> str:
+    """Target of a matched `[text](target)`, as `sed 's/.*](\\(.*\\))/\\1/'`."""
+    return text[text.rfind('](') + 2:-1]
+
+
+def build_document(text: str, digest: str = '') -> PostDocument:
+    """
+    Build the document model of a post in a single pass over its lines.
+
+    Args:
+        text: Full post content
+        digest: Content hash to record (computed when empty)
+
+    Returns:
+        PostDocument
+    """
+    if not digest:
+        digest = content_digest(text.encode('utf-8', errors='replace'))
+    lines = text.split('\n')
+    if lines and lines[-1] == '':
+        lines.pop()
+
+    opening = lines[0].strip() if lines else ''
+    fmt = FRONTMATTER_DELIMITERS.get(opening)
+    fm_lines = []
+    fm_open = fmt is not None
+    header = []
+    in_header = False
+    body = []
+    delimiters = 0
+    headings = []
+    code_blocks = []
+    code_start = -1
+    code_lang = ''
+    fences = 0
+    images = []
+    links = []
+    words = 0
+
+    for index, line in enumerate(lines):
+        if fm_open and index:
+            if line.strip() == opening or index > FRONTMATTER_MAX_LINES:
+                fm_open = False
+            else:
+                fm_lines.append(line)
+
+        if in_header:
+            header.append(line)
+            if line.startswith('+++'):
+                in_header = False
+        elif line.startswith('+++'):
+            header.append(line)
+            in_header = True
+
+        fence = '```' in line
+        if fence:
+            fences += 1
+        if '](' in line:
+            links.extend(_link_target(match.group(0)) for match in MARKDOWN_LINK_RE.finditer(line))
+            if '![' in line:
+                images.extend(_link_target(match.group(0)) for match in MARKDOWN_IMAGE_RE.finditer(line))
+
+        if line == '+++':
+            delimiters += 1
+            if delimiters == 2:
+                continue
+        if delimiters != 2:
+            continue
+
+        body.append(line)
+        if fence:
+            if code_start < 0:
+                code_start = len(body) - 1
+                code_lang = line.strip().lstrip('`').strip()
+            else:
+                code_blocks.append((code_start, len(body) - 1, code_lang))
+                code_start = -1
+            continue
+        if code_start >= 0:
+            continue
+        words += len(line.encode('utf-8', errors='replace').split())
+        if line.startswith('#'):
+            match = MARKDOWN_HEADING_RE.match(line)
+            if match:
+                headings.append((len(body) - 1, len(match.group(1)), match.group(2)))
+
+    if code_start >= 0:
+        code_blocks.append((code_start, -1, code_lang))
+    for targets in (images, links):
+        while targets and not targets[-1]:
+            targets.pop()
+
+    return PostDocument(
+        digest=digest,
+        lines=tuple(lines),
+        frontmatter=_build_frontmatter('\n'.join(fm_lines), fmt) if fmt else FrontMatter(),
+        header=tuple(header),
+        body=tuple(body),
+        headings=tuple(headings),
+        code_blocks=tuple(code_blocks),
+        fence_lines=fences,
+        images=tuple(images),
+        links=tuple(links),
+        word_count=words,
+    )
+
+
+class DocumentCache:
+    """
+    Per-file cache of PostDocument models.
+
+    Features:
+        - Entries are keyed by path and reused while the content hash
+          matches, so unchanged files are never re-tokenized
+        - Works on disk content or on in-memory text (editor buffers)
+        - Bounded LRU; thread-safe
+    """
+
+    def __init__(self, limit: int = DOCUMENT_CACHE_SIZE):
+        """
+        Initialize the cache.
+
+        Args:
+            limit: Maximum number of documents kept
+        """
+        self.limit = limit
+        self._documents = {}  # path -> PostDocument
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, path, data: bytes = None, digest: str = None) -> PostDocument:
+        """
+        Document model of a file on disk.
+
+        Args:
+            path: File to read
+            data: File content if already read
+            digest: content_digest(data) if already computed
+
+        Returns:
+            PostDocument
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        if data is None:
+            with open(path, 'rb') as f:
+                data = f.read()
+        return self._get(str(path), digest or content_digest(data),
+                         lambda: data.decode('utf-8', errors='replace'))
+
+    def parse(self, path, text: str) -> PostDocument:
+        """
+        Document model of in-memory text for a file (e.g. an editor buffer).
+
+        Args:
+            path: File the text belongs to
+            text: Current content
+
+        Returns:
+            PostDocument
+        """
+        return self._get(str(path), content_digest(text.encode('utf-8', errors='replace')),
+                         lambda: text)
+
+    def _get(self, key: str, digest: str, text) -> PostDocument:
+        """Return the cached model for key if its hash matches, else build it."""
+        with self._lock:
+            document = self._documents.pop(key, None)
+            if document is not None and document.digest == digest:
+                self._documents[key] = document
+                self.hits += 1
+                return document
+        document = build_document(text(), digest)
+        with self._lock:
+            self.misses += 1
+            self._documents[key] = document
+            while len(self._documents) > self.limit:
+                del self._documents[next(iter(self._documents))]
+        return document
+
+
+DOCUMENTS = DocumentCache()
+
+
+# =============================================
+# QUALITY GATE
+# =============================================
+
+# Rules follow scripts/quality-gate.sh line for line (including its quirks:
+# prefix matches on field names, only double quotes stripped from values,
+# tags counted only in multi-line arrays) so both report the same findings.
+QUALITY_SEPARATOR = "=" * 41
+
+# Version of the rule set; bump whenever a rule changes so cached results
+# from older rules are discarded
+QUALITY_RULES_VERSION = 1
+
+QUALITY_DIVIDER = "-" * 40
+QUALITY_SPACE = " \t\n\r\f\v"
+QUALITY_DATE_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}T')
+QUALITY_TAG_ITEM_RE = re.compile(r'[ \t\n\r\f\v]+"')
+QUALITY_EXTERNAL_RE = re.compile(r'https?://')
+
+
+class QualityConfig(NamedTuple):
+    """
+    Quality gate settings (same keys and defaults as quality-gate.sh).
+
+    Fields:
+        strict_mode: QUALITY_STRICT_MODE - missing sections are errors and
+                     warnings fail the post
+        min_word_count: QUALITY_MIN_WORD_COUNT
+        require_featured_image: QUALITY_REQUIRE_FEATURED_IMAGE
+        validate_links: CONTENT_VALIDATE_LINKS
+        validate_images: CONTENT_VALIDATE_IMAGES
+        required_sections: QUALITY_REQUIRED_SECTIONS, split on whitespace
+    """
+    strict_mode: bool = True
+    min_word_count: int = 500
+    require_featured_image: bool = True
+    validate_links: bool = True
+    validate_images: bool = True
+    required_sections: tuple = ("Overview", "Key", "Concepts", "Configuration", "Summary")
+
+
+def read_env_file(env_file: Path) -> dict:
+    """
+    Read KEY=VALUE assignments from a .env file.
+
+    Args:
+        env_file: Path to the file
+
+    Returns:
+        Dictionary of assignments (empty if the file is missing)
+    """
+    values = {}
+    try:
+        lines = env_file.read_text(encoding='utf-8', errors='replace').splitlines()
+    except OSError:
+        return values
+
+    for line in lines:
+        line = line.strip()
+        if line.startswith('export '):
+            line = line[7:].lstrip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        key, _, value = line.partition('=')
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+            value = value[1:-1]
+        values[key.strip()] = value
+    return values
+
+
+def load_quality_config(root: Path) -> QualityConfig:
+    """
+    Load quality gate settings the way quality-gate.sh does (.env over
+    the environment, then the script defaults).
+
+    Args:
+        root: Project root containing .env
+
+    Returns:
+        QualityConfig
+    """
+    values = {**os.environ, **read_env_file(root / ".env")}
+    defaults = QualityConfig()
+
+    def get(key, default):
+        return values.get(key) or default
+
+    try:
+        min_words = int(get("QUALITY_MIN_WORD_COUNT", "500"))
+    except ValueError:
+        min_words = defaults.min_word_count
+
+    return QualityConfig(
+        strict_mode=get("QUALITY_STRICT_MODE", "true") == "true",
+        min_word_count=min_words,
+        require_featured_image=get("QUALITY_REQUIRE_FEATURED_IMAGE", "true") == "true",
+        validate_links=get("CONTENT_VALIDATE_LINKS", "true") == "true",
+        validate_images=get("CONTENT_VALIDATE_IMAGES", "true") == "true",
+        required_sections=tuple(get("QUALITY_REQUIRED_SECTIONS", " ".join(defaults.required_sections)).split())
+    )
+
+
+class QualityResult(NamedTuple):
+    """
+    Outcome of validating one post.
+
+    Fields:
+        file: Path as given to the validator
+        entries: Log entries (component, level, message); an empty
+                 component stands for a blank output line. None if the
+                 post was skipped (not a draft in a drafts-only run)
+        ok: True if the post passed
+        errors: Number of errors
+        warnings: Number of warnings
+        signature: (mtime_ns, size) of the file when it was read
+        digest: Hash of the file content
+        draft: True if the file contains 'draft = true'
+        probes: (path, kind, exists) for every file ('f') or directory
+                ('d') existence check the rules made
+    """
+    file: str
+    entries: tuple
+    ok: bool
+    errors: int = 0
+    warnings: int = 0
+    signature: tuple = None
+    digest: str = ''
+    draft: bool = False
+    probes: tuple = ()
+
+
+def _field_values(lines: list, field: str, strip: bool = False) -> str:
+    """Values of `<field> = ...` lines with double quotes removed, joined like grep | sed."""
+    pattern = re.compile(re.escape(field) + r' *= *')
+    values = [pattern.sub('', line, count=1).replace('"', '') for line in lines if line.startswith(field)]
+    if strip:
+        values = [re.sub(r' *$', '', value, count=1) for value in values]
+    return '\n'.join(values).rstrip('\n')
+
+
+def _quality_inputs(file: str, document: PostDocument) -> dict:
+    """
+    What each rule section reads, per section name. A section's findings
+    can only change when its inputs (or the files it probes) change.
+    """
+    featured = [re.sub(r'.*= *', '', line, count=1).replace('"', '')
+                for line in document.header if 'featured_image' in line]
+    return {
+        "frontmatter": (file, document.header[1:-1]),
+        "content": (document.body, document.fence_lines),
+        "word_count": (document.word_count,),
+        "images": (os.path.dirname(file) or '.',
+                   '\n'.join(re.sub(r' *$', '', value, count=1) for value in featured).rstrip('\n'),
+                   document.images),
+        "links": (document.links,),
+    }
+
+
+def _check_frontmatter(inputs, config: QualityConfig, root: str, exists):
+    """Frontmatter rules (validate_frontmatter)."""
+    file, frontmatter = inputs
+    entries = [("ContentManager", "INFO", "Validating frontmatter...")]
+
+    def quality(level, message):
+        entries.append(("QualityGate", level, message))
+
+    if not '\n'.join(frontmatter).rstrip('\n'):
+        quality("ERROR", f"No frontmatter found in {file}")
+        return entries, 0
+
+    for field in ("title", "date", "draft", "tags"):
+        if not any(line.startswith(field) for line in frontmatter):
+            quality("ERROR", f"Missing required field: {field}")
+
+    draft_value = _field_values(frontmatter, "draft", strip=True)
+    if draft_value not in ("true", "false"):
+        quality("ERROR", f"Invalid draft status: {draft_value} (must be true or false)")
+
+    date_value = _field_values(frontmatter, "date")
+    if date_value and not QUALITY_DATE_RE.match(date_value):
+        quality("ERROR", f"Invalid date format: {date_value} (expected ISO 8601)")
+
+    if not any(line.startswith("summary") for line in frontmatter):
+        quality("WARNING", "Missing recommended field: summary")
+
+    if not any(line.startswith("featured_image") for line in frontmatter):
+        if config.require_featured_image:
+            quality("ERROR", "Missing required field: featured_image")
+        else:
+            quality("WARNING", "Missing recommended field: featured_image")
+
+    tag_lines = set()
+    for index, line in enumerate(frontmatter):
+        if line.startswith("tags"):
+            tag_lines.update(range(index, index + 11))
+    if not any(QUALITY_TAG_ITEM_RE.match(frontmatter[i]) for i in tag_lines if i < len(frontmatter)):
+        quality("WARNING", "No tags defined")
+
+    if _count_level(entries, "ERROR"):
+        return entries, 0
+    quality("INFO", "✓ Frontmatter validation passed")
+    return entries, 1
+
+
+def _check_content(inputs, config: QualityConfig, root: str, exists):
+    """Content structure rules (validate_content)."""
+    body, fences = inputs
+    entries = [("ContentManager", "INFO", "Validating content structure...")]
+
+    def quality(level, message):
+        entries.append(("QualityGate", level, message))
+
+    if not '\n'.join(body).rstrip('\n'):
+        quality("ERROR", "No content found")
+        return entries, 0
+
+    for section in config.required_sections:
+        heading = re.compile(r'##[ \t\n\r\f\v]*' + re.escape(section), re.IGNORECASE)
+        if not any(heading.match(line) for line in body):
+            if config.strict_mode:
+                quality("ERROR", f"Missing required section: {section}")
+            else:
+                quality("WARNING", f"Missing recommended section: {section}")
+
+    first_heading = next((line for line in body if line.startswith('#')), '')
+    first_heading = first_heading.lstrip('#').strip(QUALITY_SPACE)
+    if first_heading not in ("Overview", "overview"):
+        quality("WARNING", f"First heading should be 'Overview', found: {first_heading}")
+
+    if fences % 2:
+        quality("ERROR", "Unclosed code block detected")
+
+    if _count_level(entries, "ERROR"):
+        return entries, 0
+    quality("INFO", "✓ Content structure validation passed")
+    return entries, 1
+
+
+def _check_word_count(inputs, config: QualityConfig, root: str, exists):
+    """Word count rule, code blocks excluded (validate_word_count)."""
+    word_count, = inputs
+    entries = [("ContentManager", "INFO", "Checking word count...")]
+    if word_count < config.min_word_count:
+        entries.append(("QualityGate", "ERROR", f"Word count ({word_count}) below minimum ({config.min_word_count})"))
+        return entries, 0
+    entries.append(("QualityGate", "INFO", f"✓ Word count: {word_count} (minimum: {config.min_word_count})"))
+    return entries, 1
+
+
+def _check_images(inputs, config: QualityConfig, root: str, exists):
+    """Featured and inline image rules (validate_images)."""
+    if not config.validate_images:
+        return [("ContentManager", "INFO", "Image validation disabled")], 0
+
+    post_dir, featured, images = inputs
+    entries = [("ContentManager", "INFO", "Validating images...")]
+
+    def quality(level, message):
+        entries.append(("QualityGate", level, message))
+
+    if featured:
+        image_path = f"{post_dir}/{featured}"
+        if not exists(image_path, 'f'):
+            quality("ERROR", f"Featured image not found: {image_path}")
+        else:
+            quality("INFO", f"✓ Featured image exists: {featured}")
+
+    for image in images:
+        if QUALITY_EXTERNAL_RE.match(image):
+            continue
+        image_path = os.path.join(root, image[1:]) if image.startswith('/') else f"{post_dir}/{image}"
+        if not exists(image_path, 'f'):
+            quality("ERROR", f"Referenced image not found: {image}")
+
+    if _count_level(entries, "ERROR"):
+        return entries, 0
+    quality("INFO", "✓ Image validation passed")
+    return entries, 1
+
+
+def _check_links(inputs, config: QualityConfig, root: str, exists):
+    """Internal link rule; broken links are warnings only (validate_links)."""
+    if not config.validate_links:
+        return [("ContentManager", "INFO", "Link validation disabled")], 0
+
+    links, = inputs
+    entries = [("ContentManager", "INFO", "Validating links...")]
+    for link in links:
+        if QUALITY_EXTERNAL_RE.match(link) or not link.startswith('/'):
+            continue
+        link_path = f"{root}/content{link}"
+        if not exists(link_path, 'f') and not exists(link_path, 'd'):
+            entries.append(("QualityGate", "WARNING", f"Broken internal link: {link}"))
+    entries.append(("QualityGate", "INFO", "✓ Link validation passed"))
+    return entries, 1
+
+
+# Rule sections in the order quality-gate.sh runs them
+QUALITY_CHECKS = {
+    "frontmatter": _check_frontmatter,
+    "content": _check_content,
+    "word_count": _check_word_count,
+    "images": _check_images,
+    "links": _check_links,
+}
+
+
+def _count_level(entries, level: str) -> int:
+    """Number of QualityGate findings at a level."""
+    return sum(1 for component, entry_level, _ in entries
+               if component == "QualityGate" and entry_level == level)
+
+
+def _quality_summary(file: str, outcomes: list, config: QualityConfig):
+    """
+    Assemble section outcomes into the validate_post output.
+
+    Returns:
+        (entries, ok, errors, warnings)
+    """
+    entries = [
+        ("ContentManager", "INFO", QUALITY_SEPARATOR),
+        ("ContentManager", "INFO", f"Validating: {file}"),
+        ("ContentManager", "INFO", QUALITY_SEPARATOR),
+    ]
+    passed = 0
+    for section_entries, section_passed in outcomes:
+        entries.extend(section_entries)
+        passed += section_passed
+    errors = _count_level(entries, "ERROR")
+    warnings = _count_level(entries, "WARNING")
+
+    entries.append(("", "", ""))
+    entries.append(("QualityGate", "INFO", QUALITY_SEPARATOR))
+    entries.append(("QualityGate", "INFO", "VALIDATION SUMMARY"))
+    entries.append(("QualityGate", "INFO", QUALITY_SEPARATOR))
+    entries.append(("QualityGate", "INFO", f"Passed:  {passed}"))
+    entries.append(("QualityGate", "WARNING", f"Warnings: {warnings}"))
+    entries.append(("QualityGate", "ERROR", f"Errors:   {errors}"))
+    if errors:
+        entries.append(("QualityGate", "ERROR", "Status: FAILED"))
+        ok = False
+    elif warnings and config.strict_mode:
+        entries.append(("QualityGate", "WARNING", "Status: FAILED (strict mode - warnings treated as errors)"))
+        ok = False
+    else:
+        entries.append(("QualityGate", "INFO", "Status: PASSED"))
+        ok = True
+    return tuple(entries), ok, errors, warnings
+
+
+def quality_findings(result: QualityResult) -> list:
+    """
+    Errors and warnings of a result, without the summary block.
+
+    Args:
+        result: QualityResult with entries
+
+    Returns:
+        List of (level, message)
+    """
+    findings = []
+    for component, level, message in result.entries or ():
+        if not component:
+            break
+        if component == "QualityGate" and level in ("ERROR", "WARNING"):
+            findings.append((level, message))
+    return findings
+
+
+def validate_post_file(file: str, config: QualityConfig, root: str, drafts_only: bool = False,
+                       documents: DocumentCache = None):
+    """
+    Run every quality gate rule on one post (the `validate_post` of
+    quality-gate.sh). All rules read the file's document model, so it is
+    read and tokenized once. Safe to call in a worker process (leave
+    documents unset there: the shared cache and its lock stay in the TUI).
+
+    Args:
+        file: Path to the post's index.md
+        config: Quality gate settings
+        root: Project root (for site-absolute images and links)
+        drafts_only: Return None unless the file contains 'draft = true'
+        documents: Cache to take the document model from; None parses
+            the file directly
+
+    Returns:
+        QualityResult (entries None if skipped by drafts_only)
+    """
+    probes = []
+
+    def exists(path, kind):
+        found = os.path.isfile(path) if kind == 'f' else os.path.isdir(path)
+        probes.append((path, kind, found))
+        return found
+
+    data = None
+    signature = None
+    if os.path.isfile(file):
+        try:
+            with open(file, 'rb') as f:
+                st = os.fstat(f.fileno())
+                data = f.read()
+            signature = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            data = None
+    digest = content_digest(data) if data is not None else ''
+    draft = data is not None and b'draft = true' in data
+    if drafts_only and not draft:
+        return QualityResult(file, None, False, signature=signature, digest=digest)
+
+    if data is None:
+        return QualityResult(file, (
+            ("ContentManager", "INFO", QUALITY_SEPARATOR),
+            ("ContentManager", "INFO", f"Validating: {file}"),
+            ("ContentManager", "INFO", QUALITY_SEPARATOR),
+            ("QualityGate", "ERROR", f"File not found: {file}"),
+        ), False)
+
+    if documents is not None:
+        document = documents.load(file, data, digest)
+    else:
+        document = build_document(data.decode('utf-8', errors='replace'), digest)
+    inputs = _quality_inputs(file, document)
+    outcomes = [check(inputs[name], config, root, exists) for name, check in QUALITY_CHECKS.items()]
+    entries, ok, errors, warnings = _quality_summary(file, outcomes, config)
+    return QualityResult(file, entries, ok, errors, warnings,
+                         signature, digest, draft, tuple(probes))
+
+
+def find_index_files(top: str) -> list:
+    """
+    List index.md files below a directory in `find` order (directory
+    entries in on-disk order, subdirectories visited as they are met).
+
+    Args:
+        top: Directory to search
+
+    Returns:
+        List of paths
+    """
+    found = []
+
+    def walk(path):
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            return
+        for entry in entries:
+            if entry.name == "index.md" and entry.is_file():
+                found.append(entry.path)
+            if entry.is_dir(follow_symlinks=False):
+                walk(entry.path)
+
+    walk(top)
+    return found
+
+
+class QualityGate:
+    """
+    Native implementation of scripts/quality-gate.sh.
+
+    Features:
+        - validate, validate-drafts and validate-all commands
+        - Each post read and parsed once for all rules
+        - Posts validated in a process pool, results emitted in order
+        - Results cached per file by content hash and rule-set version;
+          unchanged posts are not revalidated
+        - Same output lines, log files and exit codes as the shell script
+    """
+
+    COMMANDS = ("validate", "validate-drafts", "validate-all")
+
+    def __init__(self, root: Path, workers: int = QUALITY_GATE_WORKERS, cache_dir: Path = None):
+        """
+        Initialize the quality gate.
+
+        Args:
+            root: Project root
+            workers: Maximum worker processes for multi-post commands
+            cache_dir: Directory for the result cache (None to disable)
+        """
+        self.root = root
+        self.workers = workers
+        self.log_dir = root / "logs"
+        self.cache_file = cache_dir / "quality-gate.json" if cache_dir else None
+        self._results = {}     # file -> QualityResult of its last validation
+        self._messages = {}    # shared (component, level, message) entries
+        self._cache_key = None
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def format_entries(self, entries) -> list:
+        """
+        Render log entries as quality-gate.sh prints them and append them
+        to its log files.
+
+        Args:
+            entries: (component, level, message) tuples
+
+        Returns:
+            Output lines
+        """
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        output = []
+        logs = {"QualityGate": [], "ContentManager": []}
+        for component, level, message in entries:
+            if not component:
+                output.append("")
+                continue
+            line = f"[{timestamp}] [INFO] [{component}] [{level}] {message}"
+            output.append(line)
+            logs[component].append(line)
+
+        try:
+            self.log_dir.mkdir(exist_ok=True)
+            for component, name in (("QualityGate", "quality-gate.log"), ("ContentManager", "automation.log")):
+                if logs[component]:
+                    with open(self.log_dir / name, 'a', encoding='utf-8') as f:
+                        f.write('\n'.join(logs[component]) + '\n')
+        except OSError:
+            pass
+        return output
+
+    def _cache_key_for(self, config: QualityConfig) -> str:
+        """Cache key covering the rule-set version and the settings."""
+        return json.dumps([QUALITY_RULES_VERSION, list(config)])
+
+    def _use_config(self, config: QualityConfig) -> None:
+        """Load the cache for these settings, dropping results from others."""
+        key = self._cache_key_for(config)
+        if key == self._cache_key:
+            return
+        self._results = {}
+        self._messages = {}
+        self._cache_key = key
+        self._load_cache()
+
+    def _intern(self, entries) -> tuple:
+        """Share identical log entries between cached results."""
+        messages = self._messages
+        return tuple(messages.setdefault(entry, entry) for entry in entries)
+
+    def _load_cache(self) -> None:
+        """Load cached results if the cache file matches the current key."""
+        if not self.cache_file or not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file) as f:
+                data = json.load(f)
+            if data.get('key') != self._cache_key:
+                return
+            table = [tuple(entry) for entry in data['messages']]
+            results = {}
+            for file, (mtime, size, digest, draft, ok, errors, warnings, entries, probes) in data['files'].items():
+                results[file] = QualityResult(
+                    file,
+                    tuple(table[index] for index in entries) if entries is not None else None,
+                    ok, errors, warnings, (mtime, size), digest, draft,
+                    tuple(tuple(probe) for probe in probes)
+                )
+        except Exception:
+            return
+        self._messages = {entry: entry for entry in table}
+        self._results = results
+
+    def _save_cache(self) -> None:
+        """Write cached results (atomic replace), if any changed."""
+        if not self.cache_file or not self._dirty:
+            return
+        self._dirty = False
+        table = {}
+        files = {}
+        for file, result in self._results.items():
+            entries = None
+            if result.entries is not None:
+                entries = [table.setdefault(entry, len(table)) for entry in result.entries]
+            files[file] = [result.signature[0], result.signature[1], result.digest, result.draft,
+                           result.ok, result.errors, result.warnings, entries,
+                           [list(probe) for probe in result.probes]]
+        data = {'key': self._cache_key, 'messages': list(table), 'files': files}
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_file, self.cache_file)
+        except Exception:
+            pass
+
+    def _cached(self, file: str, drafts_only: bool):
+        """
+        Look up a still-valid cached result.
+
+        The file's stat signature is checked first; if it moved, the
+        content is hashed and compared, so touching a file keeps its
+        result. Existence checks the rules made are repeated.
+
+        Returns:
+            QualityResult, or None if the file must be validated
+        """
+        result = self._results.get(file)
+        if result is None:
+            return None
+        try:
+            st = os.stat(file)
+        except OSError:
+            return None
+        signature = (st.st_mtime_ns, st.st_size)
+        if signature != result.signature:
+            try:
+                with open(file, 'rb') as f:
+                    digest = content_digest(f.read())
+            except OSError:
+                return None
+            if digest != result.digest:
+                return None
+            result = result._replace(signature=signature)
+            self._results[file] = result
+            self._dirty = True
+
+        if drafts_only and not result.draft:
+            return result
+        if result.entries is None:
+            return None
+        for path, kind, found in result.probes:
+            if (os.path.isfile(path) if kind == 'f' else os.path.isdir(path)) != found:
+                return None
+        return result
+
+    def _store(self, result: QualityResult) -> None:
+        """Remember a fresh result (files that could not be read are not cached)."""
+        if result.signature is None:
+            return
+        if result.entries is None:
+            previous = self._results.get(result.file)
+            if previous is not None and previous.digest == result.digest:
+                return
+        else:
+            result = result._replace(entries=self._intern(result.entries))
+        self._results[result.file] = result
+        self._dirty = True
+
+    def prune(self, files) -> None:
+        """
+        Drop cached results below content/ for posts no longer present.
+
+        Args:
+            files: Every index.md currently below content/
+        """
+        content_dir = str(self.root / "content") + os.sep
+        keep = set(files)
+        with self._lock:
+            for file in [f for f in self._results if f.startswith(content_dir) and f not in keep]:
+                del self._results[file]
+                self._dirty = True
+
+    def _check(self, files: list, check, cancelled=None):
+        """Run check over files in a process pool (or in-process), in order,
+        stopping early once cancelled() is true."""
+        cancelled = cancelled or (lambda: False)
+        done = 0
+        workers = min(self.workers, len(files))
+        if workers > 1:
+            try:
+                # Never fork the TUI itself: a child would inherit its threads'
+                # held locks (document cache, Textual) and could hang on them
+                with ProcessPoolExecutor(max_workers=workers, mp_context=self._pool_context()) as pool:
+                    chunksize = max(1, len(files) // (workers * 4))
+                    for result in pool.map(check, files, chunksize=chunksize):
+                        if cancelled():
+                            # Drop queued chunks; running ones finish their file
+                            pool.shutdown(wait=False, cancel_futures=True)
+                            return
+                        done += 1
+                        yield result
+                return
+            except Exception:
+                # No usable process pool here; finish in this process
+                pass
+
+        # In-process runs share the TUI's document models
+        check = partial(check, documents=DOCUMENTS)
+        for file in files[done:]:
+            if cancelled():
+                return
+            yield check(file)
+
+    @staticmethod
+    def _pool_context():
+        """Start method for worker processes: forkserver where available, else spawn."""
+        methods = multiprocessing.get_all_start_methods()
+        return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+    def validate_files(self, files: list, drafts_only: bool = False, config: QualityConfig = None,
+                       cancelled=None):
+        """
+        Validate posts, reusing cached results for unchanged files and
+        fanning the rest out to worker processes.
+
+        Args:
+            files: Paths to validate
+            drafts_only: Skip files that are not drafts
+            config: Settings (loaded from .env if None)
+            cancelled: Callable checked between files; once it returns
+                True no further files are validated
+
+        Yields:
+            QualityResult per validated file, in the order of files
+        """
+        config = config or load_quality_config(self.root)
+        check = partial(validate_post_file, config=config, root=str(self.root), drafts_only=drafts_only)
+
+        with self._lock:
+            self._use_config(config)
+            cached = [self._cached(file, drafts_only) for file in files]
+        dirty = [file for file, result in zip(files, cached) if result is None]
+        self.hits += len(files) - len(dirty)
+        self.misses += len(dirty)
+
+        fresh = self._check(dirty, check, cancelled)
+        try:
+            for result in cached:
+                if result is None:
+                    result = next(fresh, None)
+                    if result is None:
+                        return  # cancelled
+                    with self._lock:
+                        self._store(result)
+                if result.entries is not None and (result.draft or not drafts_only):
+                    yield result
+        finally:
+            fresh.close()
+            with self._lock:
+                self._save_cache()
+
+    def run(self, args: list, emit=None, cancelled=None) -> int:
+        """
+        Run a quality-gate.sh command.
+
+        Args:
+            args: Command and arguments, e.g. ["validate-drafts"]
+            emit: Callback(lines) receiving output, once per post and
+                  once for the summary
+            cancelled: Callable checked between posts; once it returns
+                True the run stops without a summary
+
+        Returns:
+            Exit code the shell script would return (-SIGTERM if cancelled)
+        """
+        emit = emit or (lambda lines: None)
+        command = args[0] if args else ""
+
+        if command == "validate":
+            if len(args) < 2 or not args[1]:
+                emit(self.format_entries([("QualityGate", "ERROR", "Usage: quality-gate.sh validate <file>")]))
+                return 1
+            result, = self.validate_files([args[1]])
+            emit(self.format_entries(result.entries))
+            return 0 if result.ok else 1
+
+        if command not in self.COMMANDS:
+            raise ValueError(f"Unsupported quality gate command: {command}")
+
+        drafts = command == "validate-drafts"
+        files = find_index_files(str(self.root / "content"))
+        self.prune(files)
+        total = passed = 0
+        for result in self.validate_files(files, drafts_only=drafts, cancelled=cancelled):
+            total += 1
+            passed += result.ok
+            emit(self.format_entries((("QualityGate", "INFO", QUALITY_DIVIDER),) + result.entries))
+        if cancelled and cancelled():
+            return -signal.SIGTERM
+
+        if not total:
+            emit(self.format_entries([("QualityGate", "INFO", "No draft posts found" if drafts else "No posts found")]))
+            return 0
+
+        failed = total - passed
+        emit(self.format_entries([
+            ("", "", ""),
+            ("QualityGate", "INFO", QUALITY_SEPARATOR),
+            ("QualityGate", "INFO", "DRAFTS VALIDATION SUMMARY" if drafts else "ALL POSTS VALIDATION SUMMARY"),
+            ("QualityGate", "INFO", QUALITY_SEPARATOR),
+            ("QualityGate", "INFO", f"Total:   {total}"),
+            ("QualityGate", "INFO", f"Passed:  {passed}"),
+            ("QualityGate", "ERROR", f"Failed:  {failed}"),
+        ]))
+        return 1 if failed else 0
+
+
+QUALITY_GATE = QualityGate(PROJECT_ROOT, cache_dir=CACHE_DIR)
+
+
+class QualityLinter:
+    """
+    Incremental quality gate for the post open in the editor.
+
+    Features:
+        - Validates editor text (saved or not) with the quality gate rules
+        - Re-runs only rule sections whose inputs changed since the last
+          run (frontmatter edits skip the body rules and vice versa);
+          image and link sections also re-run when a probed file appears
+          or disappears
+        - Cooperative cancellation between sections for superseded runs
+    """
+
+    def __init__(self, root: Path):
+        """
+        Initialize the linter.
+
+        Args:
+            root: Project root
+        """
+        self.root = root
+        self._memo = {}  # section -> (inputs, config, outcome, probes)
+        self._lock = threading.Lock()
+        self.runs = {name: 0 for name in QUALITY_CHECKS}
+
+    def lint(self, file: str, text: str, cancelled=None):
+        """
+        Validate a post's text.
+
+        Args:
+            file: Path of the post (used in messages and for relative images)
+            text: Current content
+            cancelled: Callable returning True once this run is superseded
+
+        Returns:
+            QualityResult, or None if cancelled
+        """
+        config = load_quality_config(self.root)
+        root = str(self.root)
+        with self._lock:
+            inputs = _quality_inputs(file, DOCUMENTS.parse(file, text))
+            outcomes = []
+            for name, check in QUALITY_CHECKS.items():
+                if cancelled and cancelled():
+                    return None
+                memo = self._memo.get(name)
+                if (memo and memo[0] == inputs[name] and memo[1] == config
+                        and all((os.path.isfile(path) if kind == 'f' else os.path.isdir(path)) == found
+                                for path, kind, found in memo[3])):
+                    outcomes.append(memo[2])
+                    continue
+
+                probes = []
+
+                def exists(path, kind):
+                    found = os.path.isfile(path) if kind == 'f' else os.path.isdir(path)
+                    probes.append((path, kind, found))
+                    return found
+
+                outcome = check(inputs[name], config, root, exists)
+                self._memo[name] = (inputs[name], config, outcome, tuple(probes))
+                self.runs[name] += 1
+                outcomes.append(outcome)
+
+        entries, ok, errors, warnings = _quality_summary(file, outcomes, config)
+        return QualityResult(file, entries, ok, errors, warnings)
+
+
+QUALITY_LINTER = QualityLinter(PROJECT_ROOT)
+
+
+# =============================================
+# GIT METADATA
+# =============================================
+
+def format_relative_time(timestamp: float, now: float = None) -> str:
+    """
+    Format a timestamp like git's relative dates (%cr).
+
+    Args:
+        timestamp: POSIX timestamp
+        now: Reference time (default: current time)
+
+    Returns:
+        String such as "5 minutes ago" or "2 years, 3 months ago"
+    """
+    def plural(count: int, unit: str) -> str:
+        return f"{count} {unit}" + ("" if count == 1 else "s")
+
+    diff = int((now if now is not None else time.time()) - timestamp)
+    if diff < 0:
+        return "in the future"
+    if diff < 90:
+        return plural(diff, "second") + " ago"
+    diff = (diff + 30) // 60
+    if diff < 90:
+        return plural(diff, "minute") + " ago"
+    diff = (diff + 30) // 60
+    if diff < 36:
+        return plural(diff, "hour") + " ago"
+    diff = (diff + 12) // 24
+    if diff < 14:
+        return plural(diff, "day") + " ago"
+    if diff < 70:
+        return plural((diff + 3) // 7, "week") + " ago"
+    if diff < 365:
+        return plural((diff + 15) // 30, "month") + " ago"
+    years = (diff + 183) // 365
+    if diff < 1825:
+        months = (diff - years * 365 + 15) // 30
+        if months > 0:
+            return f"{plural(years, 'year')}, {plural(months, 'month')} ago"
+    return plural(years, "year") + " ago"
+
+
+class GitInfo:
+    """
+    Last-commit metadata, fetched off the UI thread and cached.
+
+    Features:
+        - Last commit time, branch and HEAD commit id
+        - Cache key is the mtime of .git/HEAD plus the mtime of the ref
+          it points to (or packed-refs), so git only runs after a
+          commit, checkout or fetch that moved HEAD
+        - Stores the commit timestamp and formats the relative time on
+          every read, so a cached value never goes stale
+        - Readers never block: last_commit is a placeholder until the
+          first fetch has completed
+    """
+
+    PLACEHOLDER = "…"
+
+    def __init__(self, repo_root: Path):
+        """
+        Args:
+            repo_root: Working tree of the repository
+        """
+        self.repo_root = repo_root
+        self.branch = None
+        self.head = None
+        self._key = None
+        self._commit_time = None
+        self._fetched = False
+        self._lock = threading.Lock()
+
+    @property
+    def last_commit(self) -> str:
+        """Relative time of the last commit, 'N/A', or a placeholder."""
+        if not self._fetched:
+            return self.PLACEHOLDER
+        if self._commit_time is None:
+            return 'N/A'
+        return format_relative_time(self._commit_time)
+
+    def _git_dir(self) -> Path:
+        """Locate the git directory (also for worktrees, where .git is a file)."""
+        dot_git = self.repo_root / ".git"
+        if dot_git.is_file():
+            text = dot_git.read_text().strip()
+            if text.startswith("gitdir:"):
+                return (self.repo_root / text[len("gitdir:"):].strip()).resolve()
+        return dot_git
+
+    def _state_key(self) -> tuple:
+        """
+        Return (cache key, branch) describing where HEAD points.
+
+        Raises:
+            OSError: If HEAD cannot be read (not a repository)
+        """
+        git_dir = self._git_dir()
+        head = git_dir / "HEAD"
+        head_mtime = os.stat(head).st_mtime_ns
+        head_text = head.read_text().strip()
+
+        branch = None
+        ref_state = None
+        if head_text.startswith("ref:"):
+            ref = head_text[len("ref:"):].strip()
+            branch = ref.removeprefix("refs/heads/")
+            for candidate in (git_dir / ref, git_dir / "packed-refs"):
+                try:
+                    ref_state = (str(candidate), os.stat(candidate).st_mtime_ns)
+                    break
+                except OSError:
+                    continue
+
+        return (head_mtime, head_text, ref_state), branch
+
+    def refresh(self) -> bool:
+        """
+        Fetch commit metadata if HEAD moved (blocking; run in a worker).
+
+        Returns:
+            True if the cached metadata changed
+        """
+        with self._lock:
+            try:
+                key, branch = self._state_key()
+            except OSError:
+                key, branch = None, None
+
+            if self._fetched and key == self._key:
+                return False
+
+            commit_time = None
+            head = None
+            if key is not None:
+                code, out, _ = run_command(['git', 'log', '-1', '--format=%ct %H'], cwd=str(self.repo_root))
+                fields = out.split()
+                if code == 0 and len(fields) == 2 and fields[0].isdigit():
+                    commit_time = int(fields[0])
+                    head = fields[1]
+
+            changed = not self._fetched or (commit_time, head, branch) != (self._commit_time, self.head, self.branch)
+            self._key = key
+            self.branch = branch
+            self.head = head
+            self._commit_time = commit_time
+            self._fetched = True
+            return changed
+
+
+GIT_INFO = GitInfo(PROJECT_ROOT)
+
+
+# =============================================
+# BACKGROUND TASK SYSTEM
+# =============================================
+
+# Bootstrap run by each shell worker: load the libraries once, then serve
+# jobs. A job is a header line "<id>\t<argc>" followed by argc NUL-terminated
+# fields (working directory, script, arguments). The script is sourced in a
+# forked subshell, so it starts from the freshly loaded library state each
+# time and its exit/traps/set options never reach the worker. Job control
+# (set -m) puts every job in its own process group.
+SHELL_WORKER_BOOTSTRAP = r'''
+__tui_token="$1"
+readonly() { builtin declare -g "$@"; }
+{
+  source scripts/lib/common.sh
+  source scripts/lib/logger.sh
+  source scripts/lib/error-handler.sh
+  source scripts/lib/config.sh
+} 2>&1
+unset -f readonly
+trap - EXIT INT TERM
+set -m
+printf '\036%s ready\n' "$__tui_token"
+while IFS=$'\t' read -r __tui_id __tui_argc; do
+  __tui_argv=()
+  for ((__tui_i = 0; __tui_i < __tui_argc; __tui_i++)); do
+    IFS= read -r -d '' __tui_arg
+    __tui_argv+=("$__tui_arg")
+  done
+  (
+    trap cleanup EXIT
+    trap handle_interrupt INT
+    trap handle_terminate TERM
+    cd "${__tui_argv[0]}" || exit 1
+    set -- "${__tui_argv[@]:1}"
+    unset __tui_token __tui_id __tui_argc __tui_argv __tui_i __tui_arg
+    BASH_ARGV0="$1"
+    source "$@"
+  ) </dev/null 2>&1 &
+  printf '\036%s start %s %s\n' "$__tui_token" "$__tui_id" "$!"
+  wait "$!"
+  printf '\036%s end %s %s\n' "$__tui_token" "$__tui_id" "$?"
+done
+'''
+
+
+class PipeLines:
+    """
+    Line reader over a subprocess pipe that reads in large chunks.
+
+    Features:
+        - One read per OUTPUT_CHUNK_SIZE bytes instead of one per line
+        - Yields to the event loop after every chunk, so a job flooding
+          its pipe cannot starve timers and screen updates
+        - No line length limit (StreamReader.readline raises on very
+          long lines)
+    """
+
+    def __init__(self, stream, chunk_size: int = OUTPUT_CHUNK_SIZE):
+        """
+        Initialize the reader.
+
+        Args:
+            stream: asyncio StreamReader (a process's stdout)
+            chunk_size: Bytes requested per read
+        """
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self._lines = deque()
+        self._partial = b""
+        self._eof = False
+
+    async def readline(self) -> bytes:
+        """
+        Next line, like StreamReader.readline.
+
+        Returns:
+            The line including its newline (not for an unterminated last
+            line); b"" at end of stream
+        """
+        while not self._lines:
+            if self._eof:
+                return b""
+            chunk = await self.stream.read(self.chunk_size)
+            if not chunk:
+                self._eof = True
+                line, self._partial = self._partial, b""
+                return line
+            parts = (self._partial + chunk).split(b"\n")
+            self._partial = parts.pop()
+            self._lines.extend(part + b"\n" for part in parts)
+            # A busy pipe never suspends read(); give the UI a turn per chunk
+            await asyncio.sleep(0)
+        return self._lines.popleft()
+
+
+class ShellWorker:
+    """
+    A long-lived bash process with the scripts/lib libraries loaded.
+
+    Features:
+        - Libraries parsed once, not once per script run
+        - Scripts run in a forked subshell with the same output, traps and
+          exit code as `bash scripts/<name>.sh`
+        - Output streamed back line by line; start/end frames are lines
+          beginning with \\x1e and a per-worker token
+        - Library load output (e.g. .env warnings) kept in preamble; the
+          pool reports it once per worker, not in every job
+    """
+
+    def __init__(self, root: Path, state_key):
+        """
+        Initialize a worker (call start() before use).
+
+        Args:
+            root: Project root the libraries are loaded from
+            state_key: Library/.env state the worker was started with
+        """
+        self.root = root
+        self.state_key = state_key
+        self.token = os.urandom(8).hex()
+        self.marker = b"\x1e" + self.token.encode()
+        self.process = None
+        self.stdout = None
+        self.preamble = []
+        self.busy = False
+        self.job_pid = None
+        self._next_id = 0
+
+    @property
+    def alive(self) -> bool:
+        """True while the bash process is running."""
+        return self.process is not None and self.process.returncode is None
+
+    async def start(self) -> bool:
+        """
+        Spawn bash and wait until the libraries are loaded.
+
+        Returns:
+            True if the worker is ready for jobs
+        """
+        try:
+            self.process = await asyncio.create_subprocess_exec(
+                "bash", "--noprofile", "--norc", "-c", SHELL_WORKER_BOOTSTRAP,
+                "tui-shell-worker", self.token,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                cwd=str(self.root),
+                start_new_session=True
+            )
+            self.stdout = PipeLines(self.process.stdout)
+            while True:
+                item = await self._read()
+                if item is None:
+                    return False
+                text, frame = item
+                if text is not None:
+                    self.preamble.append(text)
+                if frame and frame[0] == "ready":
+                    return True
+        except Exception:
+            self.close()
+            return False
+
+    async def _read(self):
+        """
+        Read one line of worker output.
+
+        Returns:
+            (text, frame) where text is output (or None) and frame the
+            fields of a protocol frame (or None); None at end of stream
+        """
+        line = await self.stdout.readline()
+        if not line:
+            return None
+        index = line.find(self.marker)
+        if index < 0:
+            return line.decode('utf-8', errors='ignore').rstrip(), None
+        # Output without a trailing newline runs into the frame
+        text = line[:index].decode('utf-8', errors='ignore').rstrip() if index else None
+        frame = line[index + len(self.marker):].decode('utf-8', errors='ignore').split()
+        return text, frame
+
+    async def run(self, command: list, cwd: str, on_output=None, on_start=None) -> int:
+        """
+        Run a script in the worker.
+
+        Args:
+            command: Script path followed by its arguments
+            cwd: Working directory for the script
+            on_output: Callback for output lines
+            on_start: Callback(pid) once the job runs; the pid is also its
+                process group id
+
+        Returns:
+            Exit code of the script (-1 if the worker died)
+        """
+        self._next_id += 1
+        job_id = str(self._next_id)
+        fields = [str(cwd)] + [str(arg) for arg in command]
+        payload = f"{job_id}\t{len(fields)}\n".encode()
+        payload += b"".join(field.encode() + b"\0" for field in fields)
+        try:
+            self.process.stdin.write(payload)
+            await self.process.stdin.drain()
+            while True:
+                item = await self._read()
+                if item is None:
+                    self.close()
+                    return -1
+                text, frame = item
+                if text is not None and on_output:
+                    on_output(text)
+                if not frame or len(frame) < 3 or frame[1] != job_id:
+                    continue
+                if frame[0] == "start":
+                    self.job_pid = int(frame[2])
+                    if on_start:
+                        on_start(self.job_pid)
+                elif frame[0] == "end":
+                    return int(frame[2])
+        finally:
+            self.job_pid = None
+
+    def close(self):
+        """Kill the running job (if any) and the worker."""
+        for pid in (self.job_pid, self.process.pid if self.alive else None):
+            if pid:
+                try:
+                    os.killpg(pid, signal.SIGTERM)
+                except Exception:
+                    pass
+        self.job_pid = None
+
+
+class ShellWorkerPool:
+    """
+    Shell workers for `bash scripts/<name>.sh` commands.
+
+    Features:
+        - Idle workers reused; up to SHELL_WORKER_MAX run concurrently
+        - Workers retired when scripts/lib or .env change
+        - Only scripts that source all of scripts/lib at top level run in
+          a worker
+        - Library load output of each new worker goes to on_preamble
+        - Returns None when no worker is available so callers can fall
+          back to spawning bash
+    """
+
+    def __init__(self, root: Path, max_workers: int = SHELL_WORKER_MAX):
+        """
+        Initialize the pool.
+
+        Args:
+            root: Project root (workers run in it and load its libraries)
+            max_workers: Maximum number of workers kept
+        """
+        self.root = root
+        self.max_workers = max_workers
+        self.on_preamble = None  # Callback(lines) for library load output
+        self._workers = []
+        self._disabled = False
+        self._scripts = {}  # script path -> (mtime, sources the libraries)
+
+    def _state_key(self) -> tuple:
+        """Modification times of the worker libraries and .env."""
+        key = []
+        for path in [self.root / "scripts" / "lib" / name for name in SHELL_WORKER_LIBS] + [self.root / ".env"]:
+            try:
+                key.append(path.stat().st_mtime_ns)
+            except OSError:
+                key.append(None)
+        return tuple(key)
+
+    def handles(self, command: list) -> bool:
+        """
+        Check whether a command can run in a worker.
+
+        Args:
+            command: Command list as given to BackgroundTask
+
+        Returns:
+            True for `bash <script>.sh ...` of a library-based script while
+            workers are usable
+        """
+        return (not self._disabled and len(command) >= 2
+                and command[0] == "bash" and str(command[1]).endswith(".sh")
+                and self._uses_libraries(str(command[1])))
+
+    def _uses_libraries(self, script: str) -> bool:
+        """Check (cached by mtime) whether a script sources all of SHELL_WORKER_LIBS at top level."""
+        path = Path(script) if os.path.isabs(script) else self.root / script
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            return False
+        cached = self._scripts.get(path)
+        if cached is None or cached[0] != mtime:
+            try:
+                sourced = {name.decode() for name in SHELL_WORKER_SCRIPT_RE.findall(path.read_bytes())}
+                found = sourced.issuperset(SHELL_WORKER_LIBS)
+            except OSError:
+                found = False
+            cached = self._scripts[path] = (mtime, found)
+        return cached[1]
+
+    def _retire(self, worker: ShellWorker):
+        """Close a worker and drop it from the pool."""
+        worker.close()
+        if worker in self._workers:
+            self._workers.remove(worker)
+
+    async def _acquire(self):
+        """Reserve an idle worker, starting one if needed (None if none)."""
+        key = self._state_key()
+        for worker in list(self._workers):
+            if not worker.busy and (not worker.alive or worker.state_key != key):
+                self._retire(worker)
+        for worker in self._workers:
+            if not worker.busy:
+                worker.busy = True
+                return worker
+        if len(self._workers) >= self.max_workers:
+            return None
+
+        worker = ShellWorker(self.root, key)
+        worker.busy = True
+        self._workers.append(worker)
+        if not await worker.start():
+            self._retire(worker)
+            self._disabled = True
+            return None
+        if worker.preamble and self.on_preamble:
+            self.on_preamble(worker.preamble)
+        return worker
+
+    async def run(self, command: list, cwd: str, on_output=None, on_start=None):
+        """
+        Run `bash <script> args...` in a worker.
+
+        Args:
+            command: Command list starting with "bash"
+            cwd: Working directory for the script
+            on_output: Callback for output lines
+            on_start: Callback(pid) once the job runs (see ShellWorker.run)
+
+        Returns:
+            Exit code, or None if no worker was available
+        """
+        worker = await self._acquire()
+        if worker is None:
+            return None
+        try:
+            return await worker.run(command[1:], cwd, on_output, on_start)
+        finally:
+            worker.busy = False
+            if not worker.alive or worker.state_key != self._state_key():
+                self._retire(worker)
+
+    async def warm(self):
+        """Start one worker ahead of the first script run."""
+        if not self._workers and not self._disabled:
+            worker = await self._acquire()
+            if worker is not None:
+                worker.busy = False
+
+    def close(self):
+        """Stop all workers and their running jobs."""
+        for worker in list(self._workers):
+            self._retire(worker)
+
+
+SHELL_WORKERS = ShellWorkerPool(PROJECT_ROOT)
+
+
+def format_bytes(size: float) -> str:
+    """Format a byte count with a binary unit (e.g. '12.3 MB')."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+class ProcessUsage:
+    """
+    CPU, memory and I/O of a job's process group, sampled from /proc.
+
+    Features:
+        - CPU time (user + system, including reaped children), current and
+          peak RSS, disk bytes read and written
+        - Processes that exit between samples keep their last values; ones
+          reaped by a parent in the group are counted through its cutime
+        - Live CPU rate between samples
+        - Summary and CPU-/I/O-bound verdict once the job finishes
+        - Values are sampled, so very short-lived processes can be missed;
+          without /proc (non-Linux) everything stays zero
+    """
+
+    CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+    PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.ended = None
+        self.cpu = 0.0
+        self.cpu_rate = 0.0
+        self.rss = 0
+        self.peak_rss = 0
+        self.read_bytes = 0
+        self.write_bytes = 0
+        self.samples = 0
+        self._seen = {}  # (pid, starttime) -> [ppid, cpu, read, write, alive]
+        self._last = None
+
+    @property
+    def wall(self) -> float:
+        """Seconds since the job started (until it finished)."""
+        return (self.ended or time.monotonic()) - self.started
+
+    def _read_process(self, pid: str, pgid: int):
+        """
+        Read (ppid, starttime, cpu, child cpu, rss, read, write) of a pid.
+
+        Returns None for processes outside the group; their io file is
+        never opened, so the cost per process elsewhere is one stat read.
+        """
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read()
+        # comm may contain spaces and parentheses; fields follow the last ')'
+        fields = stat[stat.rindex(b")") + 2:].split()
+        if int(fields[2]) != pgid:
+            return None
+        ticks = self.CLOCK_TICKS
+        io = {}
+        try:
+            with open(f"/proc/{pid}/io", "rb") as f:
+                for line in f:
+                    name, _, value = line.partition(b":")
+                    io[name] = int(value)
+        except Exception:
+            pass
+        return (int(fields[1]), int(fields[19]),
+                (int(fields[11]) + int(fields[12])) / ticks,
+                (int(fields[13]) + int(fields[14])) / ticks,
+                int(fields[21]) * self.PAGE_SIZE,
+                io.get(b"read_bytes", 0), io.get(b"write_bytes", 0))
+
+    def sample(self, pgid: int) -> None:
+        """
+        Take a sample of every process in a process group.
+
+        Args:
+            pgid: Process group of the job
+        """
+        try:
+            pids = [entry.name for entry in os.scandir("/proc") if entry.name.isdigit()]
+        except Exception:
+            return
+        live = {}
+        rss = 0
+        for pid in pids:
+            try:
+                process = self._read_process(pid, pgid)
+            except Exception:
+                continue  # exited meanwhile
+            if process is None:
+                continue
+            ppid, start, cpu, child_cpu, resident, read, write = process
+            live[int(pid)] = start
+            self._seen[(int(pid), start)] = [ppid, cpu + child_cpu, read, write, True]
+            rss += resident
+
+        for (pid, start), entry in self._seen.items():
+            entry[4] = live.get(pid) == start
+        # A reaped process is now part of its (still running) parent's cutime
+        for key in [key for key, entry in self._seen.items() if not entry[4] and entry[0] in live]:
+            del self._seen[key]
+
+        if self.ended is not None:
+            return  # finished while this sample was being taken
+        cpu = sum(entry[1] for entry in self._seen.values())
+        now = time.monotonic()
+        if self._last is not None and now > self._last[0]:
+            self.cpu_rate = max(cpu - self._last[1], 0.0) / (now - self._last[0])
+        self._last = (now, cpu)
+        self.cpu = max(self.cpu, cpu)
+        self.rss = rss
+        self.peak_rss = max(self.peak_rss, rss)
+        self.read_bytes = max(self.read_bytes, sum(entry[2] for entry in self._seen.values()))
+        self.write_bytes = max(self.write_bytes, sum(entry[3] for entry in self._seen.values()))
+        self.samples += 1
+
+    async def watch(self, pgid: int, interval: float = JOB_SAMPLE_INTERVAL) -> None:
+        """
+        Sample a process group until finish() is called.
+
+        Args:
+            pgid: Process group of the job
+            interval: Seconds between samples
+        """
+        while self.ended is None:
+            await asyncio.to_thread(self.sample, pgid)
+            await asyncio.sleep(interval)
+
+    def finish(self) -> None:
+        """Stop sampling and freeze the wall time."""
+        if self.ended is None:
+            self.ended = time.monotonic()
+            self.rss = 0
+            self.cpu_rate = 0.0
+
+    @property
+    def bound(self) -> str:
+        """'CPU-bound', 'I/O-bound' or 'waiting' for a finished job."""
+        if self.wall > 0 and self.cpu / self.wall >= JOB_CPU_BOUND:
+            return "CPU-bound"
+        if self.read_bytes + self.write_bytes >= 1024 * 1024 * max(self.wall, 1.0):
+            return "I/O-bound"
+        return "waiting"
+
+    def live_text(self) -> str:
+        """Short line for the status bar while the job runs."""
+        return (f"CPU {self.cpu_rate * 100:.0f}% · RSS {format_bytes(self.rss)} · "
+                f"R {format_bytes(self.read_bytes)} W {format_bytes(self.write_bytes)}")
+
+    def summary(self) -> dict:
+        """Totals of a finished job (e.g. for job history)."""
+        return {
+            "wall": round(self.wall, 3),
+            "cpu": round(self.cpu, 3),
+            "peak_rss": self.peak_rss,
+            "read_bytes": self.read_bytes,
+            "write_bytes": self.write_bytes,
+            "bound": self.bound,
+        }
+
+    def summary_text(self) -> str:
+        """One-line summary of a finished job."""
+        share = self.cpu / self.wall * 100 if self.wall > 0 else 0.0
+        parts = [f"{self.wall:.1f}s wall", f"CPU {self.cpu:.1f}s ({share:.0f}%)"]
+        if self.peak_rss:
+            parts += [f"peak RSS {format_bytes(self.peak_rss)}", f"read {format_bytes(self.read_bytes)}",
+                      f"written {format_bytes(self.write_bytes)}"]
+        return " · ".join(parts + [self.bound])
+
+
+class BackgroundTask:
+    """
+    Async background task runner for non-blocking operations.
+
+    Features:
+        - Run shell commands asynchronously
+        - Stream output to callback (pipe read in large chunks)
+        - Update status during execution
+        - Handle timeouts
+        - `bash scripts/<name>.sh` commands reuse a ShellWorker
+        - Every run gets its own process group, so terminate() reaches
+          the whole process tree (e.g. hugo started by a script)
+        - CPU, RSS and I/O of that process group sampled while it runs
+          (usage), with a summary line when it finishes
+    """
+
+    def __init__(self, command: list, cwd: str = None, on_output=None, on_complete=None):
+        """
+        Initialize background task.
+
+        Args:
+            command: Command list to execute
+            cwd: Working directory
+            on_output: Callback for output lines (stdout, stderr)
+            on_complete: Callback when task completes (exit_code)
+        """
+        self.command = command
+        self.cwd = cwd or str(PROJECT_ROOT)
+        self.on_output = on_output
+        self.on_complete = on_complete
+        self.process = None
+        self.running = False
+        self.cancelled = False
+        self.returncode = None
+        self.pgid = None
+        self.usage = ProcessUsage()
+        self._sampler = None
+
+    async def run(self):
+        """Run the command asynchronously."""
+        self.running = True
+        self.usage = ProcessUsage()
+
+        try:
+            # Library-based scripts run in a preloaded shell worker
+            if SHELL_WORKERS.handles(self.command):
+                code = await SHELL_WORKERS.run(self.command, self.cwd, self.on_output, self._started)
+                if code is not None:
+                    self._complete(code)
+                    return
+
+            self.process = await asyncio.create_subprocess_exec(
+                *self.command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                cwd=self.cwd,
+                start_new_session=True
+            )
+            self._started(self.process.pid)
+
+            stdout = PipeLines(self.process.stdout)
+            while True:
+                line = await stdout.readline()
+                if not line:
+                    break
+
+                output = line.decode('utf-8', errors='ignore')
+                if self.on_output:
+                    self.on_output(output.rstrip())
+
+            # Output closed: the process is usually still there to be sampled
+            self.usage.sample(self.process.pid)
+            await self.process.wait()
+            self._complete(self.process.returncode)
+
+        except Exception as e:
+            if self.on_output:
+                self.on_output(f"[red]Error: {str(e)}[/red]")
+            self._complete(-1)
+        finally:
+            # Also on cancellation of run() itself: no sampling after this
+            await self._stop_sampler()
+            self.pgid = None
+            self.running = False
+
+    async def _stop_sampler(self) -> None:
+        """Cancel the /proc sampler and wait until it has exited."""
+        sampler, self._sampler = self._sampler, None
+        if sampler is not None:
+            sampler.cancel()
+            await asyncio.wait([sampler])
+        self.usage.finish()
+
+    def _started(self, pgid: int) -> None:
+        """Record the process group; a terminate() that came first applies now."""
+        self.pgid = pgid
+        if self.cancelled:
+            self._signal(signal.SIGTERM)
+        self.usage.sample(pgid)
+        self._sampler = asyncio.ensure_future(self.usage.watch(pgid))
+
+    def _complete(self, code: int) -> None:
+        """Report the exit code (noting a cancellation first) and resource summary."""
+        self.returncode = code
+        self.usage.finish()
+        if self._sampler is not None:
+            self._sampler.cancel()  # run() waits for it to exit
+        if self.on_output:
+            if self.cancelled:
+                self.on_output("[yellow]⏹ Cancelled[/yellow]")
+            if self.usage.samples:
+                self.on_output(f"[dim]⏱ {self.usage.summary_text()}[/dim]")
+        if self.on_complete:
+            self.on_complete(code)
+
+    def _signal(self, sig) -> None:
+        """Send a signal to the task's process group."""
+        if self.pgid:
+            try:
+                os.killpg(self.pgid, sig)
+            except Exception:
+                pass
+
+    def terminate(self, kill: bool = False) -> None:
+        """
+        Stop the running command and everything it started.
+
+        Args:
+            kill: SIGKILL right away instead of SIGTERM (SIGKILL follows
+                after JOB_KILL_GRACE seconds if the group is still running)
+        """
+        self.cancelled = True
+        self._signal(signal.SIGKILL if kill else signal.SIGTERM)
+        if not kill and self.pgid:
+            # Children may outlive the group leader, so check the group itself
+            pgid = self.pgid
+
+            def escalate():
+                try:
+                    os.killpg(pgid, signal.SIGKILL)
+                except Exception:
+                    pass
+            asyncio.get_running_loop().call_later(JOB_KILL_GRACE, escalate)
+
+    def skip(self) -> None:
+        """Report the task as cancelled without running it."""
+        self.cancelled = True
+        self._complete(-signal.SIGTERM)
+
+
+class ThreadTask(BackgroundTask):
+    """
+    BackgroundTask counterpart for in-process work run in a thread.
+
+    func(emit, cancelled) runs in a worker thread and returns an exit code;
+    emit(lines) delivers output lines on the event loop. Terminating stops
+    delivery and makes cancelled() return True; func must check it between
+    steps and return, since Python threads cannot be killed.
+    """
+
+    def __init__(self, func, on_output=None, on_complete=None):
+        """
+        Initialize the task.
+
+        Args:
+            func: Callable(emit, cancelled) -> exit code, run in a thread
+            on_output: Callback for output lines
+            on_complete: Callback when the task completes (exit_code)
+        """
+        super().__init__([], on_output=on_output, on_complete=on_complete)
+        self.func = func
+
+    async def run(self):
+        """Run func in a thread and report its output and exit code."""
+        self.running = True
+        self.usage = ProcessUsage()
+        loop = asyncio.get_running_loop()
+
+        def deliver(lines):
+            if not self.cancelled and self.on_output:
+                for line in lines:
+                    self.on_output(line)
+
+        def emit(lines):
+            loop.call_soon_threadsafe(deliver, list(lines))
+
+        def call():
+            # CPU of this thread plus child processes reaped meanwhile (the
+            # quality gate's worker pool); RSS and I/O belong to the whole TUI
+            start = time.thread_time()
+            children = resource.getrusage(resource.RUSAGE_CHILDREN)
+            try:
+                return self.func(emit, lambda: self.cancelled)
+            finally:
+                after = resource.getrusage(resource.RUSAGE_CHILDREN)
+                self.usage.cpu = (time.thread_time() - start
+                                  + after.ru_utime - children.ru_utime
+                                  + after.ru_stime - children.ru_stime)
+                self.usage.samples += 1
+
+        try:
+            code = await asyncio.to_thread(call)
+            await asyncio.sleep(0)  # output queued by emit() goes first
+        except Exception as e:
+            deliver([f"[red]Error: {str(e)}[/red]"])
+            code = -1
+        finally:
+            self.running = False
+        self._complete(-signal.SIGTERM if self.cancelled else code)
+
+    def terminate(self, kill: bool = False) -> None:
+        """Stop delivering output and ask func to stop; reported as cancelled."""
+        self.cancelled = True
+
+
+def percentile(values: list, fraction: float) -> float:
+    """
+    Nearest-rank percentile.
+
+    Args:
+        values: Non-empty list of numbers
+        fraction: Percentile as a fraction (0.5 = median)
+
+    Returns:
+        The smallest value with at least `fraction` of values at or below it
+    """
+    ordered = sorted(values)
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+
+class JobHistory:
+    """
+    Append-only store of finished jobs, grouped into series.
+
+    Features:
+        - One JSON object per line: series, kind, start time, wall time,
+          exit code, state, resource summary and git HEAD
+        - Never rewritten; records are only appended
+        - Durations of the last JOB_TREND_WINDOW successful runs per
+          series kept in memory for median/p95 and regression checks
+        - File read once, on first use
+    """
+
+    def __init__(self, path: Path, window: int = JOB_TREND_WINDOW):
+        """
+        Args:
+            path: JSON Lines file
+            window: Successful runs per series kept for trends
+        """
+        self.path = path
+        self.window = window
+        self._durations = None  # series -> deque of wall times
+
+    def _load(self) -> dict:
+        """Read the durations of successful runs (once)."""
+        if self._durations is None:
+            self._durations = {}
+            try:
+                with open(self.path) as f:
+                    for line in f:
+                        try:
+                            self._add(json.loads(line))
+                        except Exception:
+                            continue  # e.g. a line cut short by a crash
+            except OSError:
+                pass
+        return self._durations
+
+    def _add(self, record: dict) -> None:
+        """Track the duration of a successful run."""
+        if record.get("state") == "done" and record.get("exit") == 0:
+            series = self._durations.setdefault(record["series"], deque(maxlen=self.window))
+            series.append(float(record["wall"]))
+
+    def append(self, record: dict) -> None:
+        """
+        Add a finished run.
+
+        Args:
+            record: Dict with at least series, wall, exit and state
+        """
+        self._load()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a") as f:
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+        except OSError:
+            pass
+        self._add(record)
+
+    def stats(self, series: str):
+        """
+        Trend of a series.
+
+        Returns:
+            Dict with count, median and p95 of recent successful runs,
+            or None if there are none
+        """
+        durations = list(self._load().get(series, ()))
+        if not durations:
+            return None
+        return {"count": len(durations), "median": percentile(durations, 0.5),
+                "p95": percentile(durations, 0.95)}
+
+    def regression(self, series: str, wall: float):
+        """
+        Compare a run against the trailing baseline (call before append).
+
+        Args:
+            series: Series of the run
+            wall: Duration of the run in seconds
+
+        Returns:
+            The baseline stats if the run is more than JOB_REGRESSION_MARGIN
+            slower than their median, else None
+        """
+        stats = self.stats(series)
+        if stats and stats["count"] >= JOB_BASELINE_MIN and wall > stats["median"] * (1 + JOB_REGRESSION_MARGIN):
+            return stats
+        return None
+
+
+JOB_HISTORY_STORE = JobHistory(JOB_HISTORY_FILE)
+
+
+class Job:
+    """
+    A keyed BackgroundTask run by JobManager.
+
+    Features:
+        - Identified by key (e.g. "build", "ai-tags:<post>"); submitting a
+          key that is queued or running returns the existing job
+        - Belongs to a kind with its own concurrency cap (JOB_LIMITS)
+        - Interactive jobs are started before queued background jobs
+        - Jobs with a series are recorded in the job history when they
+          finish (or earlier, via JobManager.record)
+    """
+
+    def __init__(self, key: str, kind: str, title: str, task: BackgroundTask,
+                 interactive: bool = True, series: str = None):
+        """
+        Initialize a job.
+
+        Args:
+            key: Identity used to coalesce duplicate submissions
+            kind: Concurrency class (see JOB_LIMITS)
+            title: Label shown in the jobs window
+            task: Task to run
+            interactive: Started ahead of background jobs when queued
+            series: Job history series (e.g. "build"); None to not record
+        """
+        self.key = key
+        self.kind = kind
+        self.title = title
+        self.task = task
+        self.interactive = interactive
+        self.series = series
+        self.recorded = False
+        self.state = "queued"  # queued, running, done, failed, cancelled
+        self.submitted = time.monotonic()
+        self.started_at = None
+        self.started = None
+        self.ended = None
+        self.future = None
+
+    @property
+    def finished(self) -> bool:
+        """True once the job has completed, failed or been cancelled."""
+        return self.state in ("done", "failed", "cancelled")
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds running (or waiting, while queued)."""
+        start = self.started or self.submitted
+        return (self.ended or time.monotonic()) - start
+
+
+class JobManager:
+    """
+    Runs Jobs on the event loop with deduplication and concurrency caps.
+
+    A job starts once its kind is below its JOB_LIMITS cap and fewer than
+    JOB_MAX_RUNNING jobs run overall; otherwise it waits, interactive jobs
+    first, then in submission order. Every job keeps its asyncio task
+    handle and can be cancelled (SIGTERM to its process group, SIGKILL
+    after a grace period) or killed outright. Call from the UI thread.
+    """
+
+    def __init__(self, app: App, limits: dict = None, max_running: int = JOB_MAX_RUNNING,
+                 history: JobHistory = JOB_HISTORY_STORE):
+        """
+        Args:
+            app: Application used for notifications
+            limits: Running jobs allowed per kind
+            max_running: Running jobs allowed overall
+            history: Store finished jobs with a series are recorded in
+        """
+        self.app = app
+        self.limits = JOB_LIMITS if limits is None else limits
+        self.max_running = max_running
+        self.history = history
+        self.jobs = []  # unfinished jobs and the last JOB_HISTORY finished ones
+
+    def get(self, key: str):
+        """
+        Find the unfinished job with a key.
+
+        Returns:
+            Job, or None
+        """
+        return next((job for job in self.jobs if job.key == key and not job.finished), None)
+
+    def submit(self, job: Job) -> Job:
+        """
+        Queue a job, or return the queued/running job with the same key.
+
+        Args:
+            job: Job to run
+
+        Returns:
+            The job that will produce the result
+        """
+        existing = self.get(job.key)
+        if existing is not None:
+            self._notify(f"{existing.title} is already {existing.state}")
+            return existing
+        self.jobs.append(job)
+        self._schedule()
+        if job.state == "queued" and job.task.on_output:
+            job.task.on_output(f"[dim]Queued: waiting for a free {job.kind} slot…[/dim]")
+        return job
+
+    def cancel(self, job: Job, kill: bool = False) -> None:
+        """
+        Cancel a job: drop it if queued, stop its process group if running.
+
+        Args:
+            job: Job to cancel
+            kill: SIGKILL immediately instead of SIGTERM first
+        """
+        if job.state == "queued":
+            job.state = "cancelled"
+            job.ended = time.monotonic()
+            job.task.skip()
+            self._trim()
+        elif job.state == "running":
+            job.task.terminate(kill)
+
+    def cancel_all(self) -> None:
+        """Cancel every unfinished job (used on exit)."""
+        for job in list(self.jobs):
+            try:
+                self.cancel(job)
+            except Exception:
+                pass
+
+    def _schedule(self) -> None:
+        """Start queued jobs while capacity allows."""
+        running = [job for job in self.jobs if job.state == "running"]
+        queued = sorted((job for job in self.jobs if job.state == "queued"),
+                        key=lambda job: not job.interactive)
+        for job in queued:
+            if len(running) >= self.max_running:
+                break
+            if sum(1 for other in running if other.kind == job.kind) >= self.limits.get(job.kind, JOB_DEFAULT_LIMIT):
+                continue
+            job.state = "running"
+            job.started = time.monotonic()
+            job.started_at = datetime.now(timezone.utc)
+            job.future = asyncio.ensure_future(self._run(job))
+            running.append(job)
+
+    async def _run(self, job: Job) -> None:
+        """Run a job's task, then record the outcome and start waiting jobs."""
+        try:
+            await job.task.run()
+        finally:
+            if job.task.cancelled:
+                job.state = "cancelled"
+            else:
+                job.state = "done" if job.task.returncode == 0 else "failed"
+            job.ended = time.monotonic()
+            self.record(job)
+            self._trim()
+            self._schedule()
+
+    def record(self, job: Job) -> None:
+        """
+        Add a job to the history once, warning if it was a slow run.
+
+        Called when a job finishes; long-running jobs (the preview server)
+        call it when they are ready instead, recording their startup time.
+
+        Args:
+            job: Running or finished job with a series
+        """
+        if not job.series or job.recorded or self.history is None:
+            return
+        job.recorded = True
+        wall = job.elapsed
+        state = "done" if job.state == "running" else job.state
+        code = 0 if job.state == "running" else job.task.returncode
+        if state == "done":
+            baseline = self.history.regression(job.series, wall)
+            if baseline:
+                slower = (wall / baseline["median"] - 1) * 100
+                message = (f"{job.title} took {wall:.1f}s, {slower:.0f}% slower than the "
+                           f"median of the last {baseline['count']} runs ({baseline['median']:.1f}s)")
+                if job.task.on_output:
+                    job.task.on_output(f"[yellow]⚠ {escape(message)}[/yellow]")
+                self._notify(message, severity="warning")
+        self.history.append({
+            "series": job.series,
+            "kind": job.kind,
+            "start": job.started_at.isoformat(timespec="seconds") if job.started_at else None,
+            "wall": round(wall, 3),
+            "exit": code,
+            "state": state,
+            "usage": job.task.usage.summary(),
+            "head": GIT_INFO.head,
+        })
+
+    def _trim(self) -> None:
+        """Forget the oldest finished jobs beyond JOB_HISTORY."""
+        finished = [job for job in self.jobs if job.finished]
+        for job in finished[:-JOB_HISTORY] if len(finished) > JOB_HISTORY else ():
+            self.jobs.remove(job)
+
+    def _notify(self, message: str, **kwargs) -> None:
+        """Show a toast (ignored without a running app)."""
+        try:
+            self.app.notify(message, **kwargs)
+        except Exception:
+            pass
+
+
+class OutputSink:
+    """
+    Buffered, frame-rate limited output for a RichLog.
+
+    Features:
+        - write() only buffers; pending text reaches the log at most once
+          per OUTPUT_FLUSH_INTERVAL, rendered in batches (one RichLog.write
+          each), so a task printing thousands of lines costs a few renders
+          instead of thousands
+        - A flush renders for at most OUTPUT_FLUSH_BUDGET; any backlog is
+          carried over to the following frames
+        - Each buffered write keeps its own markup (an unclosed or bad tag
+          cannot affect other lines) and renders like a separate write
+        - Text the log would trim anyway (beyond max_lines) is dropped
+          before rendering
+        - Route a task's completion messages through the sink too, so
+          they land after its output
+    """
+
+    # Buffered writes rendered per RichLog.write
+    BATCH_SIZE = 64
+
+    def __init__(self, log: RichLog, interval: float = OUTPUT_FLUSH_INTERVAL,
+                 budget: float = OUTPUT_FLUSH_BUDGET):
+        """
+        Initialize the sink.
+
+        Args:
+            log: Log to write to
+            interval: Seconds between flushes
+            budget: Rendering time per scheduled flush
+        """
+        self.log = log
+        self.interval = interval
+        self.budget = budget
+        self._pending = []
+        self._timer = None
+
+    def write(self, text: str) -> None:
+        """
+        Queue text for the log (same meaning as RichLog.write(text)).
+
+        Args:
+            text: Text with optional markup
+        """
+        self._pending.append(text)
+        if self._timer is None:
+            self._timer = self.log.set_timer(self.interval, self._on_timer)
+
+    def _on_timer(self) -> None:
+        """Scheduled flush, limited to the frame budget."""
+        self._timer = None
+        self.flush(self.budget)
+
+    def flush(self, budget: float = None) -> None:
+        """
+        Write pending text to the log.
+
+        Args:
+            budget: Seconds of rendering allowed (None writes everything);
+                whatever is left is flushed on the next frame
+        """
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+        if self.log.max_lines and len(self._pending) > self.log.max_lines:
+            # Not rendered, but still kept in the log's history if it has one
+            record = getattr(self.log, "record", None)
+            if record:
+                for text in self._pending[:-self.log.max_lines]:
+                    record(text)
+            self._pending = self._pending[-self.log.max_lines:]
+
+        deadline = time.perf_counter() + budget if budget is not None else None
+        index = 0
+        while index < len(self._pending):
+            texts = []
+            for text in self._pending[index:index + self.BATCH_SIZE]:
+                try:
+                    texts.append(Text.from_markup(text) if self.log.markup else Text(text))
+                except MarkupError:
+                    texts.append(Text(text))
+            index += self.BATCH_SIZE
+            try:
+                self.log.write(Text("\n").join(texts))
+            except Exception:
+                pass
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+        del self._pending[:index]
+        if self._pending:
+            self._timer = self.log.set_timer(self.interval, self._on_timer)
+
+
+class LogHistory:
+    """
+    Line history behind a log widget: a fixed-size ring in memory, with
+    older lines spilled to rotating files.
+
+    Features:
+        - The newest `ring_size` lines are kept in memory
+        - Lines pushed out of the ring are appended (one JSON string per
+          line) to `path`, rotated to `path`.1 ... `path`.<backups> every
+          `max_bytes`; the oldest file is dropped
+        - Sparse byte-offset index per file, so any page of the spilled
+          region is read with one seek instead of loading the files
+        - find() streams the files; memory use stays flat
+        - Spill files belong to one session and are reset on first use
+        - Spilling stops on the first file error; the history then falls
+          back to the in-memory ring
+    """
+
+    def __init__(self, path: Path, ring_size: int = LOG_RING_LINES,
+                 max_bytes: int = LOG_SPILL_BYTES, backups: int = LOG_SPILL_FILES):
+        """
+        Initialize an empty history.
+
+        Args:
+            path: Spill file (rotated copies get a numeric suffix)
+            ring_size: Lines kept in memory
+            max_bytes: Spill file size that triggers rotation
+            backups: Rotated files kept
+        """
+        self.path = path
+        self.ring_size = ring_size
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.spilled = 0
+        self._ring = deque()
+        self._segments = []  # oldest first: {"count", "size", "offsets"}
+        self._file = None
+        self._disabled = False
+
+    def __len__(self) -> int:
+        """Lines available (spilled and in memory)."""
+        return self.spilled + len(self._ring)
+
+    def append(self, line: str) -> None:
+        """
+        Add a line, spilling the oldest in-memory line if the ring is full.
+
+        Args:
+            line: Line text (with markup)
+        """
+        self._ring.append(line)
+        if len(self._ring) > self.ring_size:
+            self._spill(self._ring.popleft())
+
+    def _segment_path(self, segment: int) -> Path:
+        """Path of a segment (index into _segments, oldest first)."""
+        age = len(self._segments) - 1 - segment
+        return self.path if age == 0 else self.path.with_name(f"{self.path.name}.{age}")
+
+    def _spill(self, line: str) -> None:
+        """Append a line to the current spill file, rotating when full."""
+        if self._disabled:
+            return
+        try:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                for age in range(self.backups + 1):
+                    try:
+                        (self.path.with_name(f"{self.path.name}.{age}") if age else self.path).unlink()
+                    except OSError:
+                        pass
+                self._file = open(self.path, 'wb')
+                self._segments = [{"count": 0, "size": 0, "offsets": []}]
+            elif self._segments[-1]["size"] >= self.max_bytes:
+                self._rotate()
+
+            segment = self._segments[-1]
+            data = (json.dumps(line, ensure_ascii=False) + "\n").encode('utf-8', errors='replace')
+            if segment["count"] % LOG_INDEX_STRIDE == 0:
+                segment["offsets"].append(segment["size"])
+            self._file.write(data)
+            segment["size"] += len(data)
+            segment["count"] += 1
+            self.spilled += 1
+        except OSError:
+            # e.g. disk full. Later lines can no longer be spilled, so the
+            # spilled ones are dropped too: the history stays contiguous
+            self.close()
+            self._file = None
+            self._disabled = True
+            self._segments = []
+            self.spilled = 0
+
+    def _rotate(self) -> None:
+        """
+        Shift spill files up one suffix and start a new current file.
+
+        The segments and counters only change once every file has moved
+        and the new file is open.
+
+        Raises:
+            OSError: If a file could not be moved or the new one opened
+        """
+        # At capacity the oldest file is overwritten by the next one
+        for age in range(min(len(self._segments), self.backups), 0, -1):
+            source = self.path if age == 1 else self.path.with_name(f"{self.path.name}.{age - 1}")
+            os.replace(source, self.path.with_name(f"{self.path.name}.{age}"))
+        current = open(self.path, 'wb')
+        self._file.close()
+        self._file = current
+        if len(self._segments) > self.backups:
+            self.spilled -= self._segments.pop(0)["count"]
+        self._segments.append({"count": 0, "size": 0, "offsets": []})
+
+    def _read_segment(self, segment: int, first: int, count: int) -> list:
+        """Read `count` lines of a spill file starting at its line `first`."""
+        lines = []
+        with open(self._segment_path(segment), 'rb') as f:
+            f.seek(self._segments[segment]["offsets"][first // LOG_INDEX_STRIDE])
+            for _ in range(first % LOG_INDEX_STRIDE):
+                f.readline()
+            for _ in range(count):
+                raw = f.readline()
+                if not raw:
+                    break
+                lines.append(json.loads(raw))
+        return lines
+
+    def page(self, start: int, count: int) -> list:
+        """
+        Read a range of lines.
+
+        Args:
+            start: Index of the first line (0 = oldest available)
+            count: Number of lines
+
+        Returns:
+            Line texts, oldest first
+        """
+        start = max(start, 0)
+        end = min(start + count, len(self))
+        lines = []
+        if start < self.spilled:
+            if self._file is not None:
+                self._file.flush()
+            base = 0
+            for segment, info in enumerate(self._segments):
+                if start < base + info["count"] and base < end:
+                    first = max(start - base, 0)
+                    lines.extend(self._read_segment(segment, first, min(end - base, info["count"]) - first))
+                base += info["count"]
+        ring_start = max(start - self.spilled, 0)
+        lines.extend(itertools.islice(self._ring, ring_start, max(end - self.spilled, ring_start)))
+        return lines
+
+    def find(self, needle: str, before: int = None):
+        """
+        Find the newest line containing `needle` (case-insensitive) above a
+        position.
+
+        Args:
+            needle: Text to look for
+            before: Only consider lines with a smaller index (default: all)
+
+        Returns:
+            Line index, or None if there is no match
+        """
+        needle = needle.lower()
+        before = len(self) if before is None else min(before, len(self))
+        ring = list(self._ring)
+        for index in range(before - 1, self.spilled - 1, -1):
+            if needle in ring[index - self.spilled].lower():
+                return index
+
+        if self._file is not None:
+            self._file.flush()
+        base = self.spilled
+        for segment in range(len(self._segments) - 1, -1, -1):
+            info = self._segments[segment]
+            base -= info["count"]
+            if base >= before:
+                continue
+            found = None
+            try:
+                with open(self._segment_path(segment), 'rb') as f:
+                    for offset, raw in enumerate(f):
+                        if base + offset >= before:
+                            break
+                        if needle in json.loads(raw).lower():
+                            found = base + offset
+            except (OSError, ValueError):
+                pass
+            if found is not None:
+                return found
+        return None
+
+    def close(self) -> None:
+        """Close the current spill file."""
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+
+
+# =============================================
+# PREVIEW SERVER
+# =============================================
+
+# Hugo's startup line, e.g. "Web Server is available at http://localhost:1313/"
+PREVIEW_READY_RE = re.compile(r"Web Server is available at (?:https?:)?//([^/\s:]+):(\d+)")
+
+
+def open_in_browser(url: str) -> bool:
+    """
+    Open a URL in a graphical browser.
+
+    Args:
+        url: Page to open
+
+    Returns:
+        True if a browser was asked to open it; False without a display,
+        where webbrowser would start a text browser inside the TUI's terminal
+    """
+    if sys.platform not in ("darwin", "win32") and not (
+            os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")):
+        return False
+    try:
+        import webbrowser
+        return webbrowser.open(url)
+    except Exception:
+        return False
+
+
+class PreviewServer:
+    """
+    The Hugo preview server, run and supervised by the TUI.
+
+    Features:
+        - Runs `hugo server` as a job in its own process group (same flags
+          and .env settings as preview.sh), so stopping it never touches
+          other Hugo servers on the machine
+        - State from a health probe of the server's port rather than a
+          guess: starting, ready, unhealthy, restarting, stopped, failed
+        - Follows the port hugo reports if the configured one was taken
+        - Restarts in place when site configuration (PREVIEW_CONFIG_FILES)
+          or a theme changes; content edits rely on livereload
+        - URL of a content file computed from its path and front matter,
+          and opened once the server is ready
+    """
+
+    def __init__(self, app: App, root: Path = PROJECT_ROOT):
+        """
+        Args:
+            app: Application (jobs and notifications)
+            root: Hugo project root
+        """
+        self.app = app
+        self.root = root
+        self.job = None
+        self.state = "stopped"
+        self.host = "127.0.0.1"
+        self.port = 1313
+        self.on_output = None
+        self.on_state = None
+        self._announced = False
+        self._port_was_free = True
+        self._config_key = None
+        self._restart_reason = None
+        self._pending_page = None
+        self._supervisor = None
+
+    @property
+    def running(self) -> bool:
+        """True while the server job is queued or running."""
+        return self.job is not None and not self.job.finished
+
+    @property
+    def base_url(self) -> str:
+        """Root URL of the preview site."""
+        host = "localhost" if self.host in ("127.0.0.1", "0.0.0.0", "::") else self.host
+        return f"http://{host}:{self.port}"
+
+    def settings(self) -> tuple:
+        """
+        Read preview settings the way preview.sh does (.env over the environment).
+
+        Returns:
+            (bind address, port, minify)
+        """
+        values = {**os.environ, **read_env_file(self.root / ".env")}
+        bind = values.get("BUILD_PREVIEW_BIND") or "127.0.0.1"
+        try:
+            port = int(values.get("BUILD_PREVIEW_PORT") or 1313)
+        except ValueError:
+            port = 1313
+        return bind, port, (values.get("BUILD_MINIFY") or "true") == "true"
+
+    def _config_state(self) -> tuple:
+        """Modification times of the site configuration files."""
+        key = []
+        for name in PREVIEW_CONFIG_FILES:
+            try:
+                key.append(os.stat(self.root / name).st_mtime_ns)
+            except OSError:
+                key.append(None)
+        return tuple(key)
+
+    def _set_state(self, state: str) -> None:
+        """Change state and tell the listener."""
+        if state != self.state:
+            self.state = state
+            if self.on_state:
+                self.on_state(state)
+
+    def start(self, on_output=None, on_state=None):
+        """
+        Start the server (no-op if it is already running).
+
+        Args:
+            on_output: Callback for server output lines
+            on_state: Callback(state) on state changes
+
+        Returns:
+            The server's Job
+        """
+        if self.running:
+            return self.job
+        self.on_output = on_output
+        self.on_state = on_state
+        bind, self.port, minify = self.settings()
+        self.host = "127.0.0.1" if bind in ("0.0.0.0", "::", "") else bind
+        self._announced = False
+        self._config_key = self._config_state()
+
+        command = ["hugo", "server", "-D", "--bind", bind, "--port", str(self.port)]
+        if minify:
+            command.append("--minify")
+        task = BackgroundTask(command, cwd=str(self.root), on_output=self._output, on_complete=None)
+        job = Job("preview", "preview", "Preview server", task, interactive=False, series="preview-start")
+        task.on_complete = lambda code: self._finished(job, code)
+        self.job = self.app.jobs.submit(job)
+        self._set_state("starting")
+        self._stop_supervisor()
+        self._supervisor = asyncio.ensure_future(self._supervise(job))
+        self._supervisor.add_done_callback(self._supervisor_done)
+        return self.job
+
+    def _stop_supervisor(self) -> None:
+        """Cancel the health probe loop of the current server, if any."""
+        if self._supervisor is not None and not self._supervisor.done():
+            self._supervisor.cancel()
+        self._supervisor = None
+
+    def _supervisor_done(self, task: asyncio.Task) -> None:
+        """Report a probe loop that died instead of finishing or being cancelled."""
+        if task.cancelled() or task.exception() is None:
+            return
+        error = task.exception()
+        self.app.log.error(f"preview supervisor failed: {error!r}")
+        if self.on_output:
+            self.on_output(f"[red]✗ Preview health checks stopped: {escape(str(error))}[/red]")
+        if task is self._supervisor and self.running:
+            self._set_state("unhealthy")
+
+    def stop(self) -> None:
+        """Stop the server's process group."""
+        self._restart_reason = None
+        self._pending_page = None
+        self._stop_supervisor()
+        if self.running:
+            self.app.jobs.cancel(self.job)
+
+    def request_restart(self, reason: str) -> None:
+        """
+        Restart the running server (repeated requests coalesce).
+
+        Args:
+            reason: Shown in the log, e.g. "hugo.toml changed"
+        """
+        if not self.running or self._restart_reason is not None:
+            return
+        self._restart_reason = reason
+        if self.on_output:
+            self.on_output(f"[cyan]↻ {escape(reason)}: restarting preview server...[/cyan]")
+        self._set_state("restarting")
+        self._stop_supervisor()
+        self.app.jobs.cancel(self.job)
+
+    def config_changed(self, paths) -> None:
+        """
+        Restart if a batch of watcher changes touched a theme.
+
+        Args:
+            paths: Changed paths
+        """
+        themes = self.root / "themes"
+        for path in paths:
+            if Path(path).is_relative_to(themes):
+                self.request_restart(f"Theme changed ({Path(path).relative_to(themes).parts[0]})")
+                return
+
+    def _output(self, line: str) -> None:
+        """Pass output on, picking up the port hugo actually serves on."""
+        match = PREVIEW_READY_RE.search(line)
+        if match:
+            self.port = int(match.group(2))
+            self._announced = True
+        if self.on_output:
+            self.on_output(line)
+
+    def _finished(self, job: Job, code: int) -> None:
+        """Report the end of the server; start again if this was a restart."""
+        if job is not self.job:
+            return
+        if self._restart_reason is not None:
+            self._restart_reason = None
+            self.job = None
+            # The job is finished only once its JobManager future is done
+            job.future.add_done_callback(lambda _: self.start(self.on_output, self.on_state))
+            return
+        self._pending_page = None
+        self._set_state("stopped" if code == 0 or job.task.cancelled else "failed")
+
+    async def probe(self) -> bool:
+        """
+        Check that an HTTP server answers on the preview port.
+
+        Returns:
+            True if it returned an HTTP status line in time
+        """
+        writer = None
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), PREVIEW_PROBE_TIMEOUT)
+            writer.write(b"HEAD / HTTP/1.0\r\nHost: localhost\r\n\r\n")
+            await writer.drain()
+            line = await asyncio.wait_for(reader.readline(), PREVIEW_PROBE_TIMEOUT)
+            return line.startswith(b"HTTP/")
+        except Exception:
+            return False
+        finally:
+            if writer is not None:
+                writer.close()
+
+    async def _supervise(self, job: Job) -> None:
+        """Probe the server until its job ends; restart on config changes."""
+        # Something else on the port means hugo moves to another one:
+        # only trust the probe once hugo has said where it listens
+        self._port_was_free = not await self.probe()
+        started = time.monotonic()
+        while self.job is job and not job.finished and self._restart_reason is None:
+            healthy = await self.probe() and (self._announced or self._port_was_free)
+            if self.job is not job or self._restart_reason is not None:
+                break
+            if healthy and self.state != "ready":
+                self.app.jobs.record(job)  # startup time, once
+                self._set_state("ready")
+                if self._pending_page is not None:
+                    self.open(self._pending_page)
+            elif not healthy and self.state == "starting":
+                if time.monotonic() - started < PREVIEW_START_TIMEOUT:
+                    await asyncio.sleep(PREVIEW_START_PROBE)
+                    continue
+                self._set_state("unhealthy")
+            elif not healthy:
+                self._set_state("unhealthy")
+            if self._config_state() != self._config_key:
+                self.request_restart("Site configuration changed")
+                break
+            await asyncio.sleep(PREVIEW_PROBE_INTERVAL)
+
+    def url_for(self, path) -> str:
+        """
+        URL of a content file on the preview server.
+
+        Follows Hugo's defaults: page bundles (index.md) and sections
+        (_index.md) map to their directory, other files to their name;
+        `url` and `slug` front matter override the path. Paths are
+        lowercased with spaces as dashes. [permalinks] patterns are not
+        applied.
+
+        Args:
+            path: Content file (absolute or relative to the project root)
+
+        Returns:
+            Absolute URL, or the site root for files outside content/
+        """
+        try:
+            path = Path(path)
+            if not path.is_absolute():
+                path = self.root / path
+            parts = list(path.relative_to(self.root / "content").parts)
+        except ValueError:
+            return self.base_url + "/"
+
+        name = parts.pop()
+        if Path(name).stem not in ("index", "_index"):
+            parts.append(Path(name).stem)
+        try:
+            fields = read_frontmatter(path).fields
+        except Exception:
+            fields = {}
+        if fields.get("url"):
+            return self.base_url + "/" + str(fields["url"]).strip("/") + "/"
+        if fields.get("slug") and parts:
+            parts[-1] = str(fields["slug"])
+        slug = "/".join(part.lower().replace(" ", "-") for part in parts)
+        return self.base_url + "/" + (slug + "/" if slug else "")
+
+    def open(self, path=None) -> None:
+        """
+        Open a page now if the server is ready, else once it is.
+
+        Args:
+            path: Content file to open (None for the site root); its URL
+                is computed when it opens, after hugo has picked its port
+        """
+        if self.state != "ready":
+            self._pending_page = path or ""
+            return
+        self._pending_page = None
+        url = self.url_for(path) if path else self.base_url + "/"
+        if not open_in_browser(url):
+            try:
+                self.app.notify(f"Preview: {url}")
+            except Exception:
+                pass
+
+
+# =============================================
+# FILE OPERATIONS
+# =============================================
+
+class OperationCancelled(Exception):
+    """Raised inside an operation's worker when it has been cancelled."""
+
+
+class Operation:
+    """
+    A filesystem operation (create, rename, delete) run off the UI thread.
+
+    Features:
+        - Runs in a worker thread via OperationManager
+        - Progress (done/total) reported back on the UI thread
+        - Cooperative cancellation, checked between steps; a running
+          subprocess is terminated
+        - Declares the paths it touches, so operations on overlapping
+          paths run one after another in submission order
+    """
+
+    def __init__(self, description: str, paths, func, on_progress=None, on_done=None):
+        """
+        Initialize an operation.
+
+        Args:
+            description: Short label shown in progress messages
+            paths: Paths the operation reads or modifies
+            func: Callable(op) doing the work in the worker thread; its
+                  return value becomes op.result
+            on_progress: Callback(op) on the UI thread as progress changes
+            on_done: Callback(op) on the UI thread when the operation ends
+        """
+        self.description = description
+        self.paths = tuple(os.path.abspath(path) for path in paths)
+        self.func = func
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.state = "queued"  # queued, running, done, failed, cancelled
+        self.done = 0
+        self.total = 0
+        self.result = None
+        self.error = None
+        self.process = None
+        self._manager = None
+        self._cancel = threading.Event()
+        self._last_report = 0.0
+
+    @property
+    def cancelled(self) -> bool:
+        """True once cancel() has been called."""
+        return self._cancel.is_set()
+
+    @property
+    def finished(self) -> bool:
+        """True once the operation has completed, failed or been cancelled."""
+        return self.state in ("done", "failed", "cancelled")
+
+    @property
+    def progress_text(self) -> str:
+        """Human-readable progress, e.g. 'Delete bgp… 120/4000'."""
+        if self.state == "queued":
+            return f"{self.description}: waiting for another operation on this path…"
+        if self.total:
+            return f"{self.description}… {self.done}/{self.total}"
+        return f"{self.description}…"
+
+    def cancel(self) -> None:
+        """Request cancellation (safe to call from any thread)."""
+        self._cancel.set()
+        process = self.process
+        if process is not None and process.poll() is None:
+            try:
+                process.terminate()
+            except Exception:
+                pass
+        if self._manager is not None:
+            self._manager.wake()
+
+    def check_cancelled(self) -> None:
+        """
+        Raise if the operation was cancelled (call between steps).
+
+        Raises:
+            OperationCancelled: If cancel() has been called
+        """
+        if self._cancel.is_set():
+            raise OperationCancelled()
+
+    def report(self, done: int, total: int = None) -> None:
+        """
+        Record progress from the worker thread.
+
+        Updates are forwarded to the UI at most every
+        OPERATION_PROGRESS_INTERVAL seconds.
+
+        Args:
+            done: Steps completed
+            total: Total number of steps, if known
+        """
+        self.done = done
+        if total is not None:
+            self.total = total
+        now = time.monotonic()
+        if self._manager is not None and now - self._last_report >= OPERATION_PROGRESS_INTERVAL:
+            self._last_report = now
+            self._manager.notify(self)
+
+    def overlaps(self, other: "Operation") -> bool:
+        """True if either operation touches a path at or below one of the other's."""
+        return any(_is_under(a, b) or _is_under(b, a) for a in self.paths for b in other.paths)
+
+
+class OperationManager:
+    """
+    Runs Operations in Textual thread workers.
+
+    Operations whose paths overlap an earlier, unfinished operation wait
+    for it, so e.g. deleting a post while its category is being deleted
+    is serialized. Independent operations run concurrently.
+    """
+
+    def __init__(self, app: App):
+        """
+        Args:
+            app: Application used to start workers and reach the UI thread
+        """
+        self.app = app
+        self._queue = []  # unfinished operations, in submission order
+        self._cond = threading.Condition()
+
+    @property
+    def active(self) -> list[Operation]:
+        """Unfinished operations, oldest first."""
+        with self._cond:
+            return list(self._queue)
+
+    def submit(self, op: Operation) -> Operation:
+        """
+        Queue an operation and start its worker.
+
+        Args:
+            op: Operation to run
+
+        Returns:
+            The same operation (for cancel() and progress inspection)
+        """
+        op._manager = self
+        with self._cond:
+            self._queue.append(op)
+        self.app.run_worker(lambda: self._run(op), thread=True, group="operations")
+        return op
+
+    def cancel_all(self) -> None:
+        """Cancel every unfinished operation."""
+        for op in self.active:
+            op.cancel()
+
+    def wake(self) -> None:
+        """Wake operations waiting for a path (e.g. after a cancel)."""
+        with self._cond:
+            self._cond.notify_all()
+
+    def notify(self, op: Operation) -> None:
+        """Deliver a progress update on the UI thread."""
+        if op.on_progress:
+            self._call_ui(op.on_progress, op)
+
+    def _call_ui(self, callback, op: Operation) -> None:
+        """Run a callback on the UI thread, ignoring widgets that are gone."""
+        def invoke():
+            try:
+                callback(op)
+            except Exception:
+                pass
+        try:
+            self.app.call_from_thread(invoke)
+        except Exception:
+            pass
+
+    def _run(self, op: Operation) -> None:
+        """Worker body: wait for conflicting operations, then run."""
+        def blocked() -> bool:
+            earlier = self._queue[:self._queue.index(op)]
+            return not op.cancelled and any(op.overlaps(other) for other in earlier)
+
+        try:
+            # Report the wait outside the lock: the UI thread may need it
+            with self._cond:
+                waiting = blocked()
+            if waiting:
+                self.notify(op)
+            with self._cond:
+                while blocked():
+                    self._cond.wait()
+            op.check_cancelled()
+
+            op.state = "running"
+            self.notify(op)
+            op.result = op.func(op)
+            op.state = "done"
+        except OperationCancelled:
+            op.state = "cancelled"
+        except Exception as e:
+            op.error = e
+            op.state = "failed"
+        finally:
+            op.process = None
+            with self._cond:
+                self._queue.remove(op)
+                self._cond.notify_all()
+            if op.on_done:
+                self._call_ui(op.on_done, op)
+
+
+def delete_path(op: Operation, path: Path) -> int:
+    """
+    Delete a file or directory tree, reporting progress per entry.
+
+    Symlinks are removed, never followed. A cancelled delete stops
+    between entries and leaves the remaining entries in place.
+
+    Args:
+        op: Operation to report progress to
+        path: File or directory to delete
+
+    Returns:
+        Number of entries removed
+    """
+    if path.is_symlink() or not path.is_dir():
+        op.report(0, 1)
+        path.unlink()
+        op.report(1, 1)
+        return 1
+
+    total = 1
+    for _, dirs, files in os.walk(path):
+        op.check_cancelled()
+        total += len(dirs) + len(files)
+
+    removed = 0
+    op.report(removed, total)
+    for root, dirs, files in os.walk(path, topdown=False):
+        for name in files:
+            op.check_cancelled()
+            os.unlink(os.path.join(root, name))
+            removed += 1
+            op.report(removed, total)
+        for name in dirs:
+            op.check_cancelled()
+            dir_path = os.path.join(root, name)
+            if os.path.islink(dir_path):
+                os.unlink(dir_path)
+            else:
+                os.rmdir(dir_path)
+            removed += 1
+            op.report(removed, total)
+
+    os.rmdir(path)
+    removed += 1
+    op.report(removed, total)
+    return removed
+
+
+def rename_path(op: Operation, source: Path, target: Path) -> Path:
+    """
+    Rename a file or directory, refusing to overwrite.
+
+    Args:
+        op: Operation being run
+        source: Existing path
+        target: New path
+
+    Returns:
+        The new path
+
+    Raises:
+        FileExistsError: If the target already exists
     """
-    Calculate blog statistics.
-    
-    Returns:
-        Dictionary containing:
-        - drafts: Total number of draft posts
-        - published: Total number of published posts
-        - categories: Dict mapping category names to post counts
-        - last_commit: Human-readable time of last git commit
+    op.check_cancelled()
+    if target.exists():
+        raise FileExistsError(f"{target.name} already exists")
+    source.rename(target)
+    return target
+
+
+def run_command_op(op: Operation, cmd: list, cwd: str = None) -> tuple[int, str, str]:
     """
-    stats = {
-        'drafts': 0,
-        'published': 0,
-        'categories': {},
-        'last_commit': 'N/A'
-    }
+    Run a command for an operation; cancel() terminates it.
 
-    try:
-        # Count posts by category
-        for cat_dir in CONTENT_DIR.iterdir():
-            if cat_dir.is_dir():
-                cat_name = cat_dir.name
-                stats['categories'][cat_name] = {'drafts': 0, 'published': 0}
-
-                for post_dir in cat_dir.iterdir():
-                    index_file = post_dir / "index.md"
-                    if index_file.exists():
-                        with open(index_file) as f:
-                            content = f.read()
-                            if 'draft = true' in content:
-                                stats['drafts'] += 1
-                                stats['categories'][cat_name]['drafts'] += 1
-                            else:
-                                stats['published'] += 1
-                                stats['categories'][cat_name]['published'] += 1
-
-        # Get last commit timestamp
-        code, out, _ = run_command(['git', 'log', '-1', '--format=%cr'])
-        if code == 0:
-            stats['last_commit'] = out.strip()
+    Args:
+        op: Operation being run
+        cmd: Command arguments
+        cwd: Working directory (default: project root)
 
-    except Exception as e:
-        pass
+    Returns:
+        Tuple of (exit_code, stdout, stderr)
 
-    return stats
+    Raises:
+        OperationCancelled: If the operation was cancelled
+    """
+    op.check_cancelled()
+    op.process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        cwd=cwd or str(PROJECT_ROOT)
+    )
+    while True:
+        try:
+            out, err = op.process.communicate(timeout=0.1)
+            break
+        except subprocess.TimeoutExpired:
+            if op.cancelled:
+                op.process.kill()
+                op.process.communicate()
+                raise OperationCancelled()
+    op.check_cancelled()
+    return op.process.returncode, out, err
 
 
 # =============================================
-# BACKGROUND TASK SYSTEM
+# FILESYSTEM WATCHER
 # =============================================
 
-class BackgroundTask:
+# Directories watched for changes made outside the TUI
+WATCH_DIRS = ["content", "scripts", "themes", "static"]
+
+# Directory names never watched (large, generated or irrelevant)
+WATCH_IGNORED_DIRS = {"node_modules", "__pycache__", "public", "resources"}
+
+# Quiet period that closes a batch of events, and the longest a batch
+# may keep growing before it is delivered
+WATCH_BATCH_WINDOW = 0.05
+WATCH_BATCH_MAX = 0.25
+
+
+class FileWatcher:
     """
-    Async background task runner for non-blocking operations.
+    Recursive inotify watcher delivering batched change sets.
 
     Features:
-        - Run shell commands asynchronously
-        - Stream output to callback
-        - Update status during execution
-        - Handle timeouts
+        - Watches every non-hidden directory below the given roots
+        - Picks up newly created or moved-in directories automatically
+        - Batches create/modify/delete/rename events into one delivery
+        - Separates structural changes (create/delete/rename) from
+          content modifications
+        - Reports queue overflows so callers can fall back to a rescan
+
+    Linux only; on other platforms `start()` returns False and the TUI
+    keeps relying on manual refresh (Ctrl+R).
     """
 
-    def __init__(self, command: list, cwd: str = None, on_output=None, on_complete=None):
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ONLYDIR = 0x01000000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+                  | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+    STRUCTURE_MASK = IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, roots: list, on_changes):
         """
-        Initialize background task.
+        Initialize the watcher.
 
         Args:
-            command: Command list to execute
-            cwd: Working directory
-            on_output: Callback for output lines (stdout, stderr)
-            on_complete: Callback when task completes (exit_code)
+            roots: Directories to watch recursively
+            on_changes: Callback(changed, structural, overflow) invoked
+                        from the watcher thread with sets of Paths
         """
-        self.command = command
-        self.cwd = cwd or str(PROJECT_ROOT)
-        self.on_output = on_output
-        self.on_complete = on_complete
-        self.process = None
-        self.running = False
-
-    async def run(self):
-        """Run the command asynchronously."""
-        self.running = True
+        self.roots = [Path(root) for root in roots]
+        self.on_changes = on_changes
+        self._fd = None
+        self._libc = None
+        self._watches = {}  # watch descriptor -> directory Path
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self) -> bool:
+        """
+        Start watching in a background thread.
 
+        Returns:
+            True if inotify is available and the watcher is running
+        """
         try:
-            self.process = await asyncio.create_subprocess_exec(
-                *self.command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.STDOUT,
-                cwd=self.cwd
-            )
-
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        except (OSError, AttributeError):
+            return False
+        if fd < 0:
+            return False
+
+        self._libc = libc
+        self._fd = fd
+        for root in self.roots:
+            self._add_tree(root)
+
+        self._thread = threading.Thread(target=self._run, name="file-watcher", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        """Stop the watcher thread and release the inotify descriptor."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=1)
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _add_tree(self, directory: Path) -> None:
+        """Add watches for a directory and all its watchable subdirectories."""
+        for dirpath, dirnames, _ in os.walk(directory):
+            dirnames[:] = [d for d in dirnames
+                           if not d.startswith('.') and d not in WATCH_IGNORED_DIRS]
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(dirpath), self.WATCH_MASK)
+            if wd >= 0:
+                self._watches[wd] = Path(dirpath)
+
+    def _drop_tree(self, wd: int) -> None:
+        """Remove the watches of a moved directory and its subdirectories."""
+        moved = self._watches.get(wd)
+        if moved is None:
+            return
+        for other_wd, directory in list(self._watches.items()):
+            if directory.is_relative_to(moved):
+                self._libc.inotify_rm_watch(self._fd, other_wd)
+                self._watches.pop(other_wd, None)
+
+    def _run(self) -> None:
+        """Read events, batch them and hand each batch to the callback."""
+        while not self._stop.is_set():
+            ready, _, _ = select.select([self._fd], [], [], 0.5)
+            if not ready:
+                continue
+
+            changed, structural = set(), set()
+            overflow = False
+            batch_start = time.monotonic()
             while True:
-                line = await self.process.stdout.readline()
-                if not line:
+                overflow |= self._read_events(changed, structural)
+                if time.monotonic() - batch_start >= WATCH_BATCH_MAX:
+                    break
+                ready, _, _ = select.select([self._fd], [], [], WATCH_BATCH_WINDOW)
+                if not ready:
                     break
 
-                output = line.decode('utf-8', errors='ignore')
-                if self.on_output:
-                    self.on_output(output.rstrip())
-
-            await self.process.wait()
+            if changed or overflow:
+                try:
+                    self.on_changes(changed, structural, overflow)
+                except Exception:
+                    pass
 
-            if self.on_complete:
-                self.on_complete(self.process.returncode)
+    def _read_events(self, changed: set, structural: set) -> bool:
+        """
+        Drain pending events into the change sets.
 
-        except Exception as e:
-            if self.on_output:
-                self.on_output(f"[red]Error: {str(e)}[/red]")
-            if self.on_complete:
-                self.on_complete(-1)
-        finally:
-            self.running = False
+        Returns:
+            True if the kernel queue overflowed (events were lost)
+        """
+        try:
+            data = os.read(self._fd, 65536)
+        except BlockingIOError:
+            return False
+        except OSError:
+            return True
+
+        overflow = False
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, name_len = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + name_len].rstrip(b"\0"))
+            offset += name_len
+
+            if mask & self.IN_Q_OVERFLOW:
+                overflow = True
+                continue
+            if mask & self.IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            if mask & self.IN_MOVE_SELF:
+                self._drop_tree(wd)
+
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+            path = directory / name if name else directory
+            if name.startswith('.'):
+                continue
+
+            changed.add(path)
+            if mask & self.STRUCTURE_MASK:
+                structural.add(path)
+            if mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                if name not in WATCH_IGNORED_DIRS:
+                    self._add_tree(path)
+
+        return overflow
 
 
 # =============================================
@@ -378,20 +5165,45 @@ class StatusBar(Static):
     """
     
     def compose(self) -> ComposeResult:
-        """Compose the status bar with live statistics."""
-        stats = get_stats()
-        yield Static(
-            f"[bold cyan]{stats['drafts'] + stats['published']}[/bold cyan] posts | "
-            f"[green]{stats['published']} published[/green] | "
-            f"[yellow]{stats['drafts']} drafts[/yellow] | "
-            f"[dim]{stats['last_commit']}[/dim]",
-            id="status-left"
-        )
+        """Compose the status bar from the cached post index."""
+        stats = get_stats(refresh=False)
+        self.last_commit = stats['last_commit']
+        yield Static(self._format_stats(stats), id="status-left")
         yield Static(
             "[dim]^Q Quit | ^N New Post | ^V View Posts | ^K New Category | ^R Refresh[/dim]",
             id="status-right"
         )
 
+    def _format_stats(self, counts: dict) -> str:
+        """Format post counts and last commit for the left side."""
+        return (
+            f"[bold cyan]{counts['drafts'] + counts['published']}[/bold cyan] posts | "
+            f"[green]{counts['published']} published[/green] | "
+            f"[yellow]{counts['drafts']} drafts[/yellow] | "
+            f"[dim]{self.last_commit}[/dim]"
+        )
+
+    def update_counts(self) -> None:
+        """Refresh the post counters from the post index (no I/O, no git call)."""
+        try:
+            self.query_one("#status-left", Static).update(self._format_stats(get_post_counts(refresh=False)))
+        except Exception:
+            pass
+
+    def update_git(self) -> bool:
+        """
+        Show the latest cached git metadata (no git call).
+
+        Returns:
+            True if the displayed value changed
+        """
+        last_commit = GIT_INFO.last_commit
+        if last_commit == self.last_commit:
+            return False
+        self.last_commit = last_commit
+        self.update_counts()
+        return True
+
 
 class TopNav(Static):
     """
@@ -495,11 +5307,28 @@ class FileTree(Static):
 
     Features:
         - Hierarchical file tree
-        - Recursive directory browsing
+        - Lazy directory browsing (listed on first expand)
         - File type filtering
         - File open in editor on click
+        - Diff-based refresh that keeps expansion state, coalesced to
+          one pass per event-loop tick
     """
 
+    # File types shown in the explorer
+    ALLOWED_EXTENSIONS = ['.md', '.sh', '.py', '.toml', '.yaml', '.yml', '.txt', '.json']
+
+    # Label of the stand-in child that gives unlisted directories an expand arrow
+    PLACEHOLDER_LABEL = "[dim]…[/dim]"
+
+    def __init__(self):
+        super().__init__()
+        self._dir_nodes = {}       # directory Path -> tree node
+        self._loaded_dirs = set()  # directories whose children have been listed
+        self._listings = {}        # directory Path -> (mtime_ns, subdir names, file names)
+        self._pending_paths = set()
+        self._pending_full = False
+        self._refresh_scheduled = False
+
     def compose(self) -> ComposeResult:
         """Compose the file tree sidebar."""
         yield Label("EXPLORER", id="sidebar-title")
@@ -518,12 +5347,15 @@ class FileTree(Static):
             root: Root tree node to populate
 
         Structure:
-            - Main directories (content, scripts, themes, etc.)
+            - Main directories (content, scripts, themes, etc.),
+              listed lazily when expanded
             - Configuration files
         """
         # Clear existing children before repopulating
         if hasattr(root, '_children'):
             root._children.clear()
+        self._dir_nodes.clear()
+        self._loaded_dirs.clear()
 
         # Add main directories
         dirs_to_show = [
@@ -537,52 +5369,209 @@ class FileTree(Static):
         for dir_name, label in dirs_to_show:
             dir_path = PROJECT_ROOT / dir_name
             if dir_path.exists():
-                dir_node = root.add(label, expand=False, data=dir_path)
-                self.add_directory_contents_recursive(dir_node, dir_path)
+                self._add_directory_node(root, dir_path, label)
 
         # Add config files (leaf nodes, no expand arrow)
         root.add("hugo.toml", data=PROJECT_ROOT / "hugo.toml", allow_expand=False)
         root.add(".env", data=PROJECT_ROOT / ".env", allow_expand=False)
         root.add("CLAUDE.md", data=PROJECT_ROOT / "CLAUDE.md", allow_expand=False)
 
-    def add_directory_contents_recursive(self, parent, dir_path: Path) -> None:
+    def _add_directory_node(self, parent, dir_path: Path, label: str, before: int = None):
         """
-        Recursively add directory contents to tree.
-        
+        Add a collapsed, not yet listed directory node.
+
         Args:
             parent: Parent tree node
-            dir_path: Path to directory to scan
-            
+            dir_path: Directory the node represents
+            label: Node label
+            before: Optional child index to insert at (default: append)
+
+        Returns:
+            The new tree node
+        """
+        dir_node = parent.add(label, data=dir_path, before=before, expand=False)
+        dir_node.add(self.PLACEHOLDER_LABEL, allow_expand=False)
+        self._dir_nodes[dir_path] = dir_node
+        return dir_node
+
+    def list_directory(self, dir_path: Path) -> tuple[tuple, tuple]:
+        """
+        List a directory's visible subdirectories and files.
+
+        Args:
+            dir_path: Directory to list
+
+        Returns:
+            Tuple of (subdirectory names, file names), both sorted
+
         Features:
-            - Alphabetically sorted
-            - Directories first, then files
+            - Single os.scandir pass (no per-entry stat on most filesystems)
+            - Cached per directory and reused while its mtime is unchanged
             - File type filtering (md, sh, py, toml, yaml, yml, txt, json)
             - Hides hidden files (starting with .)
         """
         try:
-            # Get all items in directory
-            items = sorted(dir_path.iterdir())
+            mtime = os.stat(dir_path).st_mtime_ns
+        except OSError:
+            self._listings.pop(dir_path, None)
+            return (), ()
+
+        cached = self._listings.get(dir_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1], cached[2]
+
+        dirs, files = [], []
+        try:
+            with os.scandir(dir_path) as it:
+                for item in it:
+                    if item.name.startswith('.'):
+                        continue
+                    if item.is_dir():
+                        dirs.append(item.name)
+                    elif item.is_file() and os.path.splitext(item.name)[1] in self.ALLOWED_EXTENSIONS:
+                        files.append(item.name)
+        except OSError:
+            return (), ()
+
+        listing = (tuple(sorted(dirs)), tuple(sorted(files)))
+        self._listings[dir_path] = (mtime, *listing)
+        return listing
+
+    def load_directory(self, node, dir_path: Path) -> None:
+        """
+        Replace a directory node's children with its current listing.
+
+        Args:
+            node: Directory tree node
+            dir_path: Directory the node represents
 
-            # Separate directories and files
-            dirs = [item for item in items if item.is_dir() and not item.name.startswith('.')]
-            files = [item for item in items if item.is_file() and not item.name.startswith('.')]
+        Features:
+            - Alphabetically sorted
+            - Directories first (each with a placeholder child), then files
+        """
+        for stale in [p for p in self._dir_nodes if p != dir_path and p.is_relative_to(dir_path)]:
+            del self._dir_nodes[stale]
+            self._loaded_dirs.discard(stale)
 
-            # Filter files by extension
-            allowed_extensions = ['.md', '.sh', '.py', '.toml', '.yaml', '.yml', '.txt', '.json']
-            files = [f for f in files if f.suffix in allowed_extensions]
+        node.remove_children()
+        dirs, files = self.list_directory(dir_path)
 
-            # Add subdirectories first
-            for item in dirs:
-                dir_node = parent.add(f"{item.name}/", data=item, expand=False)
-                # Recursively populate subdirectories
-                self.add_directory_contents_recursive(dir_node, item)
+        # Add subdirectories first
+        for name in dirs:
+            self._add_directory_node(node, dir_path / name, f"{name}/")
 
-            # Then add files (leaf nodes, no expand arrow)
-            for item in files:
-                parent.add(f"{item.name}", data=item, allow_expand=False)
+        # Then add files (leaf nodes, no expand arrow)
+        for name in files:
+            node.add(name, data=dir_path / name, allow_expand=False)
 
-        except Exception:
-            pass
+        self._loaded_dirs.add(dir_path)
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        """List a directory the first time it is expanded."""
+        dir_path = event.node.data
+        if isinstance(dir_path, Path) and dir_path in self._dir_nodes and dir_path not in self._loaded_dirs:
+            self.load_directory(event.node, dir_path)
+
+    def request_refresh(self, paths=None) -> None:
+        """
+        Schedule a diff-based refresh of the tree.
+
+        Requests made in the same event-loop tick are merged and applied
+        in a single pass.
+
+        Args:
+            paths: Created, deleted or renamed paths, or None to
+                   reconcile every listed directory
+        """
+        if paths is None:
+            self._pending_full = True
+        else:
+            self._pending_paths.update(Path(path) for path in paths)
+
+        if not self._refresh_scheduled:
+            self._refresh_scheduled = True
+            self.call_later(self._flush_refresh)
+
+    def _flush_refresh(self) -> None:
+        """Apply all pending refresh requests in one reconciliation pass."""
+        paths, self._pending_paths = self._pending_paths, set()
+        full, self._pending_full = self._pending_full, False
+        self._refresh_scheduled = False
+
+        if full:
+            for dir_path, node in list(self._dir_nodes.items()):
+                if dir_path.parent == PROJECT_ROOT:
+                    self.reconcile_directory(node, dir_path, recursive=True)
+            return
+
+        dirs = set()
+        for path in paths:
+            self._listings.pop(path, None)
+            self._listings.pop(path.parent, None)
+            if path.name.startswith('.'):
+                continue
+            for candidate in (path.parent, path):
+                if candidate in self._loaded_dirs:
+                    dirs.add(candidate)
+
+        # Parents first, so removed subtrees are dropped before they are visited
+        for dir_path in sorted(dirs, key=lambda p: len(p.parts)):
+            node = self._dir_nodes.get(dir_path)
+            if node is not None and dir_path in self._loaded_dirs:
+                self.reconcile_directory(node, dir_path)
+
+    def reconcile_directory(self, node, dir_path: Path, recursive: bool = False) -> None:
+        """
+        Update a listed directory node to match the directory on disk.
+
+        Only children that appeared or disappeared are added or removed;
+        untouched children keep their nodes, expansion state and listed
+        subtrees.
+
+        Args:
+            node: Directory tree node
+            dir_path: Directory the node represents
+            recursive: Also reconcile listed subdirectories
+        """
+        if dir_path not in self._loaded_dirs:
+            return
+
+        dirs, files = self.list_directory(dir_path)
+        desired = [(dir_path / name, True) for name in dirs]
+        desired += [(dir_path / name, False) for name in files]
+        wanted = dict(desired)
+
+        # Remove children that no longer exist (or changed kind)
+        for child in list(node.children):
+            path = child.data
+            is_dir = path is not None and self._dir_nodes.get(path) is child
+            if path is None or wanted.get(path) != is_dir:
+                if is_dir:
+                    self._forget_directory(path)
+                child.remove()
+
+        # Insert new children at their sorted position
+        for index, (path, is_dir) in enumerate(desired):
+            children = node.children
+            if index < len(children) and children[index].data == path:
+                continue
+            before = index if index < len(children) else None
+            if is_dir:
+                self._add_directory_node(node, path, f"{path.name}/", before=before)
+            else:
+                node.add(path.name, data=path, before=before, allow_expand=False)
+
+        if recursive:
+            for path, is_dir in desired:
+                if is_dir and path in self._loaded_dirs:
+                    self.reconcile_directory(self._dir_nodes[path], path, recursive=True)
+
+    def _forget_directory(self, dir_path: Path) -> None:
+        """Drop all bookkeeping for a directory and its descendants."""
+        for path in [p for p in self._dir_nodes if p.is_relative_to(dir_path)]:
+            del self._dir_nodes[path]
+            self._loaded_dirs.discard(path)
+            self._listings.pop(path, None)
 
     def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:
         """
@@ -642,7 +5631,7 @@ class AIAgentTab(Static):
 
             # Log Output Section
             yield Static("💬 AI Output", id="ai-log-title")
-            yield RichLog(id="ai-log", wrap=True, markup=True, auto_scroll=True)
+            yield BoundedLog("ai", id="ai-log", wrap=True, markup=True, auto_scroll=True)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle AI Agent button presses."""
@@ -687,15 +5676,17 @@ class AIAgentTab(Static):
 
         file_path = self.app.current_open_file
 
+        output = OutputSink(log)
+
         def on_output(line):
-            log.write(line + "\n")
+            output.write(line + "\n")
 
         def on_complete(exit_code):
             if exit_code == 0:
-                log.write("[green]✓ Tag suggestions generated[/green]\n")
+                output.write("[green]✓ Tag suggestions generated[/green]\n")
             else:
-                log.write("[yellow]Select a post and run manually:[/yellow]")
-                log.write("[dim]./scripts/ai-content-manager.sh info <post-path>[/dim]\n")
+                output.write("[yellow]Select a post and run manually:[/yellow]")
+                output.write("[dim]./scripts/ai-content-manager.sh info <post-path>[/dim]\n")
             status_text.update("Status: Ready")
 
         task = BackgroundTask(
@@ -703,7 +5694,7 @@ class AIAgentTab(Static):
             on_output=on_output,
             on_complete=on_complete
         )
-        asyncio.create_task(task.run())
+        self.app.jobs.submit(Job(f"ai-tags:{file_path}", "ai", f"Tag suggestions: {Path(file_path).name}", task))
 
     def _ai_improve_content(self, log, status_text):
         """Get AI suggestions to improve content."""
@@ -719,24 +5710,30 @@ class AIAgentTab(Static):
         file_path = self.app.current_open_file
         log.write(f"[dim]Post: {file_path.name}[/dim]\n")
 
-        # Run quality gate
-        def on_output(line):
-            log.write(line + "\n")
-
-        def on_complete(exit_code):
+        # Run the quality gate and turn its findings into suggestions
+        def on_complete(lines, result):
+            output = OutputSink(log)
+            for line in lines:
+                output.write(line + "\n")
+            output.flush()
             log.write("\n[cyan]Suggestions:[/cyan]")
-            log.write("[green]•[/green] Check word count (min 500)")
-            log.write("[green]•[/green] Add frontmatter summary")
-            log.write("[green]•[/green] Include featured image")
-            log.write("[green]•[/green] Add relevant tags")
+            findings = quality_findings(result) if result else []
+            if not findings:
+                log.write("[green]•[/green] No issues found")
+            for level, message in findings:
+                color = "red" if level == "ERROR" else "yellow"
+                log.write(f"[{color}]•[/{color}] {escape(message)}")
             status_text.update("Status: Ready")
 
-        task = BackgroundTask(
-            ["bash", "scripts/quality-gate.sh", "validate", str(file_path)],
-            on_output=on_output,
-            on_complete=on_complete
-        )
-        asyncio.create_task(task.run())
+        def run_validate():
+            try:
+                result, = QUALITY_GATE.validate_files([str(file_path)])
+                lines = QUALITY_GATE.format_entries(result.entries)
+            except Exception as e:
+                result, lines = None, [f"[red]Error: {str(e)}[/red]"]
+            self.app.call_from_thread(on_complete, lines, result)
+
+        self.app.run_worker(run_validate, thread=True, group="quality-gate")
 
     def _ai_analyze_post(self, log, status_text):
         """Analyze current post."""
@@ -752,31 +5749,24 @@ class AIAgentTab(Static):
         file_path = self.app.current_open_file
 
         try:
-            content = file_path.read_text()
-            lines = content.split('\n')
-
-            # Basic stats
-            word_count = len(content.split())
-            line_count = len(lines)
-            has_frontmatter = '+++' in content
+            document = DOCUMENTS.load(file_path)
+            frontmatter = document.frontmatter
+            has_frontmatter = bool(frontmatter.format)
 
             log.write(f"[green]File:[/green] {file_path.name}\n")
-            log.write(f"[green]Words:[/green] {word_count}\n")
-            log.write(f"[green]Lines:[/green] {line_count}\n")
+            log.write(f"[green]Words:[/green] {document.word_count} [dim](code excluded)[/dim]\n")
+            log.write(f"[green]Lines:[/green] {len(document.lines)}\n")
+            log.write(f"[green]Headings:[/green] {len(document.headings)}\n")
+            log.write(f"[green]Code blocks:[/green] {len(document.code_blocks)}\n")
+            log.write(f"[green]Images:[/green] {len(document.images)}\n")
+            log.write(f"[green]Links:[/green] {len(document.links) - len(document.images)}\n")
             log.write(f"[green]Frontmatter:[/green] {'✓' if has_frontmatter else '✗'}\n")
 
             # Check frontmatter
             if has_frontmatter:
                 log.write("\n[dim]Frontmatter fields:[/dim]\n")
-                in_frontmatter = False
-                for line in lines:
-                    if '+++' in line:
-                        in_frontmatter = not in_frontmatter
-                        if not in_frontmatter:
-                            break
-                    elif in_frontmatter and '=' in line:
-                        field = line.split('=')[0].strip()
-                        log.write(f"[cyan]•[/cyan] {field}")
+                for field in frontmatter.fields:
+                    log.write(f"[cyan]•[/cyan] {field}")
 
             log.write("\n[green]✓ Analysis complete[/green]\n")
 
@@ -828,13 +5818,14 @@ class AutomationTab(Static):
         - Quick actions (quality gate, preview, tests, build)
         - Live log viewer
         - Background task execution
-        - Status indicators
+        - Status indicators, with live CPU/RSS/I/O of running jobs
+        - Median/p95 duration trends from the job history and an ETA
+          bar for running jobs with a history
     """
 
     def __init__(self):
         super().__init__()
-        self.preview_process = None
-        self.preview_running = False
+        self.trends_text = None
 
     def compose(self) -> ComposeResult:
         """Compose the automation tab."""
@@ -847,15 +5838,83 @@ class AutomationTab(Static):
                 yield Button("⏹ Stop", id="btn-stop", variant="error")
                 yield Button("⚙ Tests", id="btn-tests", variant="default")
                 yield Button("🔨 Build", id="btn-build", variant="default")
+                yield Button("☰ Jobs", id="btn-jobs", variant="default")
 
             # Status Section
             with Horizontal(id="automation-status"):
                 yield Static("Status: Ready", id="status-text")
                 yield Static("", id="status-indicator")
+                yield Static("", id="job-usage")
+            with Horizontal(id="job-eta"):
+                yield Static("", id="job-eta-label")
+                yield ProgressBar(id="job-eta-bar", show_eta=False)
+            yield Static("", id="job-trends")
 
             # Log Output Section
             yield Static("📋 Output", id="log-title")
-            yield RichLog(id="automation-log", wrap=True, markup=True, auto_scroll=True)
+            yield BoundedLog("automation", id="automation-log", wrap=True, markup=True, auto_scroll=True)
+
+    def on_mount(self) -> None:
+        """Show resource usage and progress of running jobs while any run."""
+        self.refresh_jobs()
+        self.set_interval(JOB_SAMPLE_INTERVAL, self.refresh_jobs)
+
+    def refresh_jobs(self) -> None:
+        """Update the job usage line, ETA bar and trends."""
+        self.refresh_usage()
+        self.refresh_eta()
+        self.refresh_trends()
+
+    def refresh_usage(self) -> None:
+        """Update the job usage line from the latest /proc samples."""
+        running = [job for job in self.app.jobs.jobs if job.state == "running" and job.task.usage.samples]
+        if not running:
+            text = ""
+        elif len(running) == 1:
+            text = f"{running[0].kind}: {running[0].task.usage.live_text()}"
+        else:
+            usages = [job.task.usage for job in running]
+            text = (f"{len(running)} jobs: CPU {sum(u.cpu_rate for u in usages) * 100:.0f}% · "
+                    f"RSS {format_bytes(sum(u.rss for u in usages))}")
+        self.query_one("#job-usage", Static).update(f"[dim]{text}[/dim]" if text else "")
+
+    def refresh_eta(self) -> None:
+        """Show progress of the oldest running job against its median duration."""
+        history = self.app.jobs.history
+        eta = self.query_one("#job-eta")
+        for job in self.app.jobs.jobs:
+            if job.state != "running" or job.recorded or not job.series or history is None:
+                continue
+            stats = history.stats(job.series)
+            if not stats:
+                continue
+            elapsed, median = job.elapsed, stats["median"]
+            if elapsed <= median:
+                label = f"{job.title}: ~{median - elapsed:.0f}s left (median {median:.1f}s)"
+            elif elapsed <= stats["p95"]:
+                label = f"{job.title}: running long (p95 {stats['p95']:.1f}s)"
+            else:
+                label = f"[yellow]{job.title}: slower than p95 ({stats['p95']:.1f}s)[/yellow]"
+            self.query_one("#job-eta-label", Static).update(label)
+            self.query_one("#job-eta-bar", ProgressBar).update(total=median, progress=min(elapsed, median))
+            eta.display = True
+            return
+        eta.display = False
+
+    def refresh_trends(self) -> None:
+        """Show median/p95 durations of each job series with a history."""
+        history = self.app.jobs.history
+        if history is None:
+            return
+        parts = []
+        for series in ("quality-gate", "tests", "build", "preview-start"):
+            stats = history.stats(series)
+            if stats:
+                parts.append(f"{series} {stats['median']:.1f}s / {stats['p95']:.1f}s")
+        text = "[dim]Median / p95: " + " · ".join(parts) + "[/dim]" if parts else ""
+        if text != self.trends_text:
+            self.trends_text = text
+            self.query_one("#job-trends", Static).update(text)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle automation button presses."""
@@ -877,94 +5936,95 @@ class AutomationTab(Static):
         elif event.button.id == "btn-build":
             self._run_build(log, status_text)
 
+        elif event.button.id == "btn-jobs":
+            self.app.push_screen(JobsScreen())
+
     def _run_quality_gate(self, log, status_text):
         """Run quality gate validation."""
         status_text.update("Status: Running quality gate...")
         log.write("[cyan]Running quality gate validation...[/cyan]\n")
 
+        output = OutputSink(log)
+
         def on_output(line):
-            log.write(line + "\n")
+            output.write(line + "\n")
 
         def on_complete(exit_code):
             if exit_code == 0:
-                log.write("[green]✓ Quality gate passed[/green]\n")
+                output.write("[green]✓ Quality gate passed[/green]\n")
             else:
-                log.write(f"[red]✗ Quality gate failed (exit code: {exit_code})[/red]\n")
+                output.write(f"[red]✗ Quality gate failed (exit code: {exit_code})[/red]\n")
             status_text.update("Status: Ready")
 
-        task = BackgroundTask(
-            ["bash", "scripts/quality-gate.sh", "validate-drafts"],
+        # Native engine: same output and exit code as quality-gate.sh
+        task = ThreadTask(
+            lambda emit, cancelled: QUALITY_GATE.run(["validate-drafts"], emit, cancelled),
             on_output=on_output,
             on_complete=on_complete
         )
-        asyncio.create_task(task.run())
+        self.app.jobs.submit(Job("quality-gate", "quality", "Quality gate", task, series="quality-gate"))
 
     def _run_preview(self, log, status_text):
         """Start preview server."""
-        if self.preview_running:
-            log.write("[yellow]Preview server is already running[/yellow]\n")
+        preview = self.app.preview
+        if preview.running:
+            log.write(f"[yellow]Preview server is already {preview.state} ({preview.base_url})[/yellow]\n")
             log.write("[dim]Click ⏹ Stop first to restart[/dim]\n")
             return
 
         status_text.update("Status: Starting preview...")
         log.write("[cyan]Starting Hugo preview server...[/cyan]\n")
-        self.preview_running = True
+
+        output = OutputSink(log)
 
         def on_output(line):
-            log.write(line + "\n")
+            output.write(line + "\n")
 
-        def on_complete(exit_code):
-            if exit_code == 0:
-                log.write("[green]✓ Preview server started on http://localhost:1313[/green]\n")
-                log.write("[dim]Click ⏹ Stop to stop the server[/dim]\n")
+        def on_state(state):
+            if state == "ready":
+                output.write(f"[green]✓ Preview server ready on {preview.base_url}[/green]\n")
+                output.write("[dim]Click ⏹ Stop to stop the server[/dim]\n")
                 status_text.update("Status: Preview running")
-            else:
-                log.write(f"[red]✗ Failed to start preview (exit code: {exit_code})[/red]\n")
-                self.preview_running = False
+            elif state == "unhealthy":
+                output.write(f"[yellow]⚠ Preview server not responding on {preview.base_url}[/yellow]\n")
+                status_text.update("Status: Preview not responding")
+            elif state == "restarting":
+                status_text.update("Status: Restarting preview...")
+            elif state == "stopped":
+                output.write("[green]✓ Preview server stopped[/green]\n")
+                status_text.update("Status: Ready")
+            elif state == "failed":
+                output.write(f"[red]✗ Preview server exited (exit code: {preview.job.task.returncode})[/red]\n")
                 status_text.update("Status: Ready")
 
-        task = BackgroundTask(
-            ["bash", "scripts/preview.sh"],
-            on_output=on_output,
-            on_complete=on_complete
-        )
-        self.preview_task = task
-        asyncio.create_task(task.run())
+        preview.start(on_output, on_state)
 
     def _stop_preview(self, log, status_text):
         """Stop preview server."""
-        if not self.preview_running:
+        if not self.app.preview.running:
             log.write("[yellow]No preview server running[/yellow]\n")
             return
 
         status_text.update("Status: Stopping preview...")
         log.write("[cyan]Stopping Hugo preview server...[/cyan]\n")
-
-        try:
-            import subprocess
-            # Kill Hugo server
-            subprocess.run(["pkill", "-f", "hugo server"], timeout=5)
-            self.preview_running = False
-            log.write("[green]✓ Preview server stopped[/green]\n")
-            status_text.update("Status: Ready")
-        except Exception as e:
-            log.write(f"[red]Error stopping server: {str(e)}[/red]\n")
-            log.write("[dim]Try running: pkill -f 'hugo server'[/dim]\n")
-            status_text.update("Status: Error")
+        # Stops only the server's own process group; on_state reports it
+        self.app.preview.stop()
 
     def _run_tests(self, log, status_text):
         """Run test suites."""
         status_text.update("Status: Running tests...")
         log.write("[cyan]Running Phase 2 test suite...[/cyan]\n")
 
+        output = OutputSink(log)
+
         def on_output(line):
-            log.write(line + "\n")
+            output.write(line + "\n")
 
         def on_complete(exit_code):
             if exit_code == 0:
-                log.write("[green]✓ All tests passed[/green]\n")
+                output.write("[green]✓ All tests passed[/green]\n")
             else:
-                log.write(f"[red]✗ Some tests failed (exit code: {exit_code})[/red]\n")
+                output.write(f"[red]✗ Some tests failed (exit code: {exit_code})[/red]\n")
             status_text.update("Status: Ready")
 
         task = BackgroundTask(
@@ -972,22 +6032,24 @@ class AutomationTab(Static):
             on_output=on_output,
             on_complete=on_complete
         )
-        asyncio.create_task(task.run())
+        self.app.jobs.submit(Job("tests", "tests", "Phase 2 tests", task, series="tests"))
 
     def _run_build(self, log, status_text):
         """Build Hugo site."""
         status_text.update("Status: Building site...")
         log.write("[cyan]Building Hugo site...[/cyan]\n")
 
+        output = OutputSink(log)
+
         def on_output(line):
-            log.write(line + "\n")
+            output.write(line + "\n")
 
         def on_complete(exit_code):
             if exit_code == 0:
-                log.write("[green]✓ Site built successfully[/green]\n")
-                log.write("[dim]Output: public/ directory[/dim]\n")
+                output.write("[green]✓ Site built successfully[/green]\n")
+                output.write("[dim]Output: public/ directory[/dim]\n")
             else:
-                log.write(f"[red]✗ Build failed (exit code: {exit_code})[/red]\n")
+                output.write(f"[red]✗ Build failed (exit code: {exit_code})[/red]\n")
             status_text.update("Status: Ready")
 
         task = BackgroundTask(
@@ -995,7 +6057,168 @@ class AutomationTab(Static):
             on_output=on_output,
             on_complete=on_complete
         )
-        asyncio.create_task(task.run())
+        self.app.jobs.submit(Job("build", "hugo", "Site build", task, series="build"))
+
+
+# =============================================
+# CUSTOM WIDGETS - LIVE PREVIEW
+# =============================================
+
+# Lines whose edit can change how the rest of the document parses (code
+# fences, HTML blocks, link reference definitions); these force a full update
+PREVIEW_REFLOW_RE = re.compile(r'\s{0,3}(```|~~~|<|\[[^\]]+\]:)')
+
+# Private Markdown attributes the block-incremental path reads and writes
+MARKDOWN_INTERNALS = ("_markdown", "_parser_factory", "_theme", "_table_of_contents")
+
+
+def _markdown_block_updates_supported() -> bool:
+    """
+    Check that Textual's Markdown has the API LivePreview._update_blocks
+    builds on (Textual 5.0.1+): Markdown.source, one-argument
+    _parse_markdown(tokens) and MarkdownBlock.source_range.
+
+    Returns:
+        True if block updates can be used
+    """
+    try:
+        parse = inspect.signature(Markdown._parse_markdown).parameters
+        block = inspect.signature(MarkdownBlock.__init__).parameters
+        return hasattr(Markdown, "source") and list(parse) == ["self", "tokens"] and "source_range" in block
+    except Exception:
+        return False
+
+
+# False on Textual versions without that API: every preview update is full
+PREVIEW_BLOCK_UPDATES = _markdown_block_updates_supported()
+
+
+class LivePreview(Markdown):
+    """
+    Markdown preview that follows an editor buffer.
+
+    Features:
+        - schedule() coalesces keystrokes into one update per
+          PREVIEW_FRAME_BUDGET
+        - Only the top-level blocks around the edited lines are re-parsed
+          and re-rendered; widgets of unchanged blocks are kept (and just
+          shifted when lines are inserted or removed above them)
+        - Falls back to a full update when an edit can reflow the rest of
+          the document or the incremental path fails
+        - Block updates use Markdown internals; they are switched off if
+          this Textual version lacks them (see PREVIEW_BLOCK_UPDATES)
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.incremental = PREVIEW_BLOCK_UPDATES and all(hasattr(self, name) for name in MARKDOWN_INTERNALS)
+        self._pending = None
+        self._flush_timer = None
+        self._flushing = False
+        self.full_updates = 0
+        self.block_updates = 0
+
+    def schedule(self, text: str) -> None:
+        """
+        Queue the preview for new editor text.
+
+        Args:
+            text: Current editor content
+        """
+        self._pending = text
+        if self._flush_timer is None and not self._flushing:
+            self._flush_timer = self.set_timer(PREVIEW_FRAME_BUDGET, self._flush)
+
+    async def _flush(self) -> None:
+        """Render the latest queued text, then re-arm if more arrived meanwhile."""
+        self._flush_timer = None
+        text, self._pending = self._pending, None
+        # Markdown.source only exists on Textual >= 5.0.1; without it every
+        # flush is a full update
+        if text is None or text == getattr(self, "source", None):
+            return
+        self._flushing = True
+        try:
+            try:
+                applied = self.incremental and await self._update_blocks(text)
+            except Exception:
+                applied = False
+            if not applied:
+                self.full_updates += 1
+                await self.update(text)
+        finally:
+            self._flushing = False
+        if self._pending is not None:
+            self._flush_timer = self.set_timer(PREVIEW_FRAME_BUDGET, self._flush)
+
+    async def _update_blocks(self, text: str) -> bool:
+        """
+        Re-render only the top-level blocks touched by an edit.
+
+        Args:
+            text: New document text
+
+        Returns:
+            True if applied, False if a full update is needed
+        """
+        old = self.source.split('\n')
+        new = text.split('\n')
+        blocks = [child for child in self.children if isinstance(child, MarkdownBlock)]
+        if not blocks or '\r' in text or '\r' in self.source:
+            return False
+
+        # Changed line span: [prefix, len - suffix) in both versions
+        limit = min(len(old), len(new))
+        prefix = 0
+        while prefix < limit and old[prefix] == new[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old[-1 - suffix] == new[-1 - suffix]:
+            suffix += 1
+        old_end = len(old) - suffix
+        new_end = len(new) - suffix
+        if any(PREVIEW_REFLOW_RE.match(line) for line in old[prefix:old_end] + new[prefix:new_end]):
+            return False
+
+        # Blocks overlapping the edit plus one neighbour each side, widened
+        # until the span is bounded by blank lines
+        first = next((i for i, block in enumerate(blocks) if block.source_range[1] > prefix), len(blocks) - 1)
+        last = max((i for i, block in enumerate(blocks) if block.source_range[0] < max(old_end, prefix + 1)), default=first)
+        first = max(min(first, last) - 1, 0)
+        last = min(last + 1, len(blocks) - 1)
+        while first and old[blocks[first].source_range[0] - 1].strip():
+            first -= 1
+        while last < len(blocks) - 1 and blocks[last].source_range[1] < len(old) and old[blocks[last].source_range[1]].strip():
+            last += 1
+        start = 0 if first == 0 else min(blocks[first].source_range[0], prefix)
+        end = len(old) if last == len(blocks) - 1 else max(blocks[last].source_range[1], old_end)
+        shift = len(new) - len(old)
+
+        parser = MarkdownIt("gfm-like") if self._parser_factory is None else self._parser_factory()
+        tokens = parser.parse('\n'.join(new[start:end + shift]))
+        fresh = list(self._parse_markdown(tokens))
+        for block in fresh:
+            block.source_range = (block.source_range[0] + start, block.source_range[1] + start)
+
+        stale = blocks[first:last + 1]
+        async with self.lock:
+            self._markdown = text
+            self._theme = self.app.theme
+            for block in blocks[last + 1:]:
+                block.source_range = (block.source_range[0] + shift, block.source_range[1] + shift)
+            with self.app.batch_update():
+                await self.remove_children(stale)
+                if fresh:
+                    if last + 1 < len(blocks):
+                        await self.mount_all(fresh, before=blocks[last + 1])
+                    else:
+                        await self.mount_all(fresh)
+        self.block_updates += 1
+
+        if any(block.name == "heading_open" for block in stale + fresh):
+            self._table_of_contents = None
+            self.post_message(Markdown.TableOfContentsUpdated(self, self.table_of_contents).set_sender(self))
+        return True
 
 
 # =============================================
@@ -1011,6 +6234,8 @@ class ContentArea(Static):
         - Integrated markdown editor
         - Live preview mode
         - File editing capabilities
+        - Quality gate findings for the open post, refreshed in the
+          background on save and after typing pauses
     """
 
     def compose(self) -> ComposeResult:
@@ -1019,6 +6244,7 @@ class ContentArea(Static):
             # Title bar with file actions
             with Horizontal(id="content-header"):
                 yield Static("", id="file-name")
+                yield Static("", id="lint-status")
                 yield Static("✏ Edit", id="action-edit")
                 yield Static("💾 Save", id="action-save")
                 yield Static("👁 Preview", id="action-preview")
@@ -1032,7 +6258,7 @@ class ContentArea(Static):
             # Editor and preview container for split view
             with Horizontal(id="editor-preview-container"):
                 yield TextArea(id="inline-editor", language="markdown")
-                yield Markdown(id="inline-preview")
+                yield LivePreview(id="inline-preview")
 
     def on_mount(self) -> None:
         """
@@ -1112,6 +6338,9 @@ class ContentArea(Static):
             # Store file path for saving
             self.current_file_path = file_path
 
+            # Validate the opened post in the background
+            self.lint_current_file()
+
             # Scroll to top and focus after render
             def scroll_to_top():
                 try:
@@ -1160,12 +6389,17 @@ class ContentArea(Static):
         """
         if event.text_area.id == "inline-editor":
             try:
-                preview = self.query_one("#inline-preview", Markdown)
+                preview = self.query_one("#inline-preview", LivePreview)
                 if preview.visible:
-                    preview.update(event.text_area.text)
+                    preview.schedule(event.text_area.text)
             except:
                 pass
 
+            # Revalidate once typing pauses
+            if getattr(self, '_lint_timer', None):
+                self._lint_timer.stop()
+            self._lint_timer = self.set_timer(LINT_IDLE_DELAY, self.lint_current_file)
+
     def save_current_file(self) -> None:
         """
         Save the current file being edited.
@@ -1188,6 +6422,7 @@ class ContentArea(Static):
 
             # Show success message briefly
             file_name.update(f"[green]✓ Saved![/green]")
+            self.lint_current_file()
 
             import asyncio
             async def restore_title():
@@ -1199,6 +6434,66 @@ class ContentArea(Static):
         except Exception as e:
             pass
 
+    def lint_current_file(self) -> None:
+        """
+        Revalidate the open post in a background worker.
+
+        Behavior:
+            - Only posts below content/ are checked
+            - A newer run supersedes (and cancels) any run in progress
+            - Findings appear in the header status line when done
+        """
+        self._cancel_lint()
+        file_path = getattr(self, 'current_file_path', None)
+        lint_status = self.query_one("#lint-status", Static)
+        if not file_path or file_path.suffix != '.md' or not _is_under(str(file_path), str(CONTENT_ROOT)):
+            lint_status.update("")
+            return
+
+        generation = self._lint_generation
+        text = self.query_one("#inline-editor", TextArea).text
+        self.run_worker(
+            lambda: self._lint_worker(generation, str(file_path), text),
+            thread=True, group="lint", exclusive=True
+        )
+
+    def _cancel_lint(self) -> None:
+        """Stop the idle timer and invalidate any lint run in progress."""
+        if getattr(self, '_lint_timer', None):
+            self._lint_timer.stop()
+            self._lint_timer = None
+        self._lint_generation = getattr(self, '_lint_generation', 0) + 1
+
+    def _lint_worker(self, generation: int, file: str, text: str) -> None:
+        """Worker body for lint_current_file (runs in a thread)."""
+        worker = get_current_worker()
+        result = QUALITY_LINTER.lint(
+            file, text,
+            cancelled=lambda: worker.is_cancelled or generation != self._lint_generation
+        )
+        if result is not None:
+            self.app.call_from_thread(self._show_lint, generation, result)
+
+    def _show_lint(self, generation: int, result: QualityResult) -> None:
+        """Show a lint result unless a newer run has started."""
+        if generation != self._lint_generation:
+            return
+        lint_status = self.query_one("#lint-status", Static)
+        findings = quality_findings(result)
+        if not findings:
+            lint_status.update("[green]✓ Quality gate passed[/green]")
+            lint_status.tooltip = None
+            return
+
+        level, message = findings[0]
+        color = "red" if level == "ERROR" else "yellow"
+        more = f" [dim](+{len(findings) - 1})[/dim]" if len(findings) > 1 else ""
+        lint_status.update(
+            f"[red]✗ {result.errors}[/red] [yellow]⚠ {result.warnings}[/yellow]  "
+            f"[{color}]{escape(message)}[/{color}]{more}"
+        )
+        lint_status.tooltip = "\n".join(f"{level}: {message}" for level, message in findings)
+
     def preview_current_file(self) -> None:
         """
         Toggle preview mode - show split editor and preview.
@@ -1253,7 +6548,9 @@ class ContentArea(Static):
         # Clear current file tracking
         if hasattr(self, 'current_file_path'):
             delattr(self, 'current_file_path')
+        self._cancel_lint()
         self.app.current_open_file = None
+        self.app.rendered_view = None
 
         # Clear log
         content_log.clear()
@@ -1314,6 +6611,83 @@ class NiceStatus(Static):
         self.update("")
 
 
+class BoundedLog(RichLog):
+    """
+    RichLog with bounded memory and a browsable, searchable history.
+
+    Features:
+        - At most LOG_RING_LINES rendered lines kept by the widget
+        - Every written line is recorded in a LogHistory (ring in memory,
+          overflow spilled to logs/tui-<name>.log*), so lines trimmed off
+          the screen can still be read back
+        - Ctrl+F, or scrolling up past the top once lines were trimmed,
+          opens the history browser
+    """
+
+    BINDINGS = [Binding("ctrl+f", "history", "Log history", show=False)]
+
+    def __init__(self, name: str, **kwargs):
+        """
+        Initialize the log.
+
+        Args:
+            name: Short name for the history spill file
+            **kwargs: RichLog arguments
+        """
+        kwargs.setdefault("max_lines", LOG_RING_LINES)
+        super().__init__(**kwargs)
+        self.history_name = name
+        self.history = LogHistory(PROJECT_ROOT / "logs" / f"tui-{name}.log")
+        self._replaying = False
+
+    def write(self, content, *args, **kwargs):
+        """Write to the log and record the written lines in the history."""
+        if isinstance(content, str) and not self.highlight:
+            content = Text.from_markup(content) if self.markup else Text(content)
+        if not self._replaying:
+            self.record(content)
+        return super().write(content, *args, **kwargs)
+
+    def on_resize(self, event) -> None:
+        """RichLog replays writes made before its size was known; record them once."""
+        self._replaying = True
+        try:
+            super().on_resize(event)
+        finally:
+            self._replaying = False
+
+    def record(self, content) -> None:
+        """
+        Add content to the history without rendering it.
+
+        Args:
+            content: Text, or a string with markup
+        """
+        if isinstance(content, str):
+            try:
+                content = Text.from_markup(content) if self.markup else Text(content)
+            except MarkupError:
+                content = Text(content)
+        if isinstance(content, Text):
+            for line in content.split("\n", allow_blank=True):
+                self.history.append(line.markup if self.markup else line.plain)
+        else:
+            self.history.append(f"<{type(content).__name__}>")
+
+    def action_history(self) -> None:
+        """Open the history browser."""
+        self.app.push_screen(LogHistoryScreen(self.history, self.history_name))
+
+    def on_mouse_scroll_up(self, event) -> None:
+        """Scrolling up at the top leads into the trimmed history."""
+        if self.scroll_y <= 0 and len(self.history) > self.max_lines:
+            self.action_history()
+
+    def on_unmount(self) -> None:
+        """Close the history spill file."""
+        self.history.close()
+
+
 # =============================================
 # MODAL SCREENS - BASE CLASS
 # =============================================
@@ -1355,6 +6729,9 @@ class NiceModal(ModalScreen):
     def on_key(self, event) -> None:
         """Close modal on Escape key."""
         if event.key == "escape":
+            # Handled here; the app's Escape binding must not pop again
+            event.stop()
+            event.prevent_default()
             try:
                 self.app.pop_screen()
             except Exception:
@@ -1499,9 +6876,7 @@ draft = true
                 # Refresh file tree immediately
                 try:
                     file_tree = self.app.query_one(FileTree)
-                    tree = file_tree.query_one("#file-tree", Tree)
-                    file_tree.populate_tree(tree.root)
-                    tree.refresh()
+                    file_tree.request_refresh([full_path])
                 except Exception as refresh_error:
                     pass
 
@@ -1526,6 +6901,7 @@ class RenameItemModal(ModalScreen):
         super().__init__()
         self.item_path = item_path
         self.item_type = "folder" if item_path.is_dir() else "file"
+        self.operation = None
 
     def compose(self) -> ComposeResult:
         """Compose the rename modal."""
@@ -1553,6 +6929,7 @@ class RenameItemModal(ModalScreen):
                     Button("Cancel", id="btn-cancel"),
                     id="actions"
                 )
+                yield NiceStatus("", id="status")
 
     def on_click(self, event) -> None:
         """Handle clicks on close link."""
@@ -1567,38 +6944,50 @@ class RenameItemModal(ModalScreen):
             event: Button press event
         """
         if event.button.id == "btn-cancel":
+            if self.operation and not self.operation.finished:
+                self.operation.cancel()
+                return
             self.app.pop_screen()
             return
 
         if event.button.id == "btn-rename":
+            if self.operation and not self.operation.finished:
+                return
+
             name_input = self.query_one("#input-new-name", Input)
             new_name = name_input.value.strip()
 
             if not new_name:
                 return
 
-            try:
-                new_path = self.item_path.parent / new_name
-
-                if new_path.exists():
-                    return
-
-                self.item_path.rename(new_path)
-
-                # Refresh file tree immediately
-                try:
-                    file_tree = self.app.query_one(FileTree)
-                    tree = file_tree.query_one("#file-tree", Tree)
-                    file_tree.populate_tree(tree.root)
-                    tree.refresh()
-                except Exception as refresh_error:
-                    pass
-
-                # Close modal
-                self.app.pop_screen()
+            new_path = self.item_path.parent / new_name
+            if new_path.exists():
+                self.query_one("#status", NiceStatus).show_error(f"{new_name} already exists")
+                return
 
-            except Exception:
+            # Rename in a worker; serialized with other operations on these paths
+            self.operation = self.app.operations.submit(Operation(
+                f"Rename {self.item_path.name}",
+                [self.item_path, new_path],
+                lambda op: rename_path(op, self.item_path, new_path),
+                on_progress=lambda op: self.query_one("#status", NiceStatus).show_info(op.progress_text),
+                on_done=self._on_renamed
+            ))
+
+    def _on_renamed(self, op: Operation) -> None:
+        """Refresh the tree and close once the rename has finished."""
+        if op.state == "done":
+            try:
+                file_tree = self.app.query_one(FileTree)
+                file_tree.request_refresh([self.item_path, op.result])
+            except Exception as refresh_error:
                 pass
+            if self.app.screen is self:
+                self.app.pop_screen()
+        elif op.state == "cancelled":
+            self.query_one("#status", NiceStatus).show_warning("Rename cancelled")
+        else:
+            self.query_one("#status", NiceStatus).show_error(f"Rename failed: {op.error}")
 
 
 class DeleteItemModal(ModalScreen):
@@ -1616,6 +7005,7 @@ class DeleteItemModal(ModalScreen):
         super().__init__()
         self.item_path = item_path
         self.item_type = "folder" if item_path.is_dir() else "file"
+        self.operation = None
 
     def compose(self) -> ComposeResult:
         """Compose the delete confirmation modal."""
@@ -1654,6 +7044,7 @@ class DeleteItemModal(ModalScreen):
                     Button("Cancel", id="btn-cancel"),
                     id="actions"
                 )
+                yield NiceStatus("", id="status")
 
     def on_click(self, event) -> None:
         """Handle clicks on close link."""
@@ -1668,37 +7059,48 @@ class DeleteItemModal(ModalScreen):
             event: Button press event
         """
         if event.button.id == "btn-cancel":
+            if self.operation and not self.operation.finished:
+                self.operation.cancel()
+                return
             self.app.pop_screen()
             return
 
         if event.button.id == "btn-delete":
+            if self.operation and not self.operation.finished:
+                return
+
             confirm_input = self.query_one("#input-confirm", Input)
             confirmation = confirm_input.value.strip()
 
             if confirmation != "DELETE":
                 return
 
-            try:
-                if self.item_type == "file":
-                    self.item_path.unlink()
-                else:
-                    import shutil
-                    shutil.rmtree(self.item_path)
-
-                # Refresh file tree immediately
-                try:
-                    file_tree = self.app.query_one(FileTree)
-                    tree = file_tree.query_one("#file-tree", Tree)
-                    file_tree.populate_tree(tree.root)
-                    tree.refresh()
-                except Exception as refresh_error:
-                    pass
+            # Delete in a worker, entry by entry, so large folders can be cancelled
+            self.operation = self.app.operations.submit(Operation(
+                f"Delete {self.item_path.name}",
+                [self.item_path],
+                lambda op: delete_path(op, self.item_path),
+                on_progress=lambda op: self.query_one("#status", NiceStatus).show_info(op.progress_text),
+                on_done=self._on_deleted
+            ))
+
+    def _on_deleted(self, op: Operation) -> None:
+        """Refresh the tree and close once the delete has finished."""
+        try:
+            file_tree = self.app.query_one(FileTree)
+            file_tree.request_refresh([self.item_path])
+        except Exception as refresh_error:
+            pass
 
-                # Close modal
+        if op.state == "done":
+            if self.app.screen is self:
                 self.app.pop_screen()
-
-            except Exception:
-                pass
+        elif op.state == "cancelled":
+            self.query_one("#status", NiceStatus).show_warning(
+                f"Delete cancelled after {op.done} of {op.total} item(s)"
+            )
+        else:
+            self.query_one("#status", NiceStatus).show_error(f"Delete failed: {op.error}")
 
 
 # =============================================
@@ -1719,6 +7121,7 @@ class CreatePostScreen(NiceModal):
         super().__init__("Create New Post")
         self.category = None
         self.post_created = False
+        self.operation = None
 
     def compose(self) -> ComposeResult:
         """Compose the full-screen create post interface."""
@@ -1741,9 +7144,9 @@ class CreatePostScreen(NiceModal):
                     seen_ids = set()
                     all_categories = []  # List of (display_name, cat_id, button_id)
 
-                    # Collect categories from each parent section
-                    for parent in ["routing", "junos", "projects"]:
-                        parent_dir = PROJECT_ROOT / "content" / parent
+                    # Collect categories from each main section
+                    for parent in POST_INDEX.sections:
+                        parent_dir = CONTENT_ROOT / parent
                         if parent_dir.exists() and parent_dir.is_dir():
                             try:
                                 for cat_dir in parent_dir.iterdir():
@@ -1850,6 +7253,9 @@ class CreatePostScreen(NiceModal):
 
         # Cancel
         elif event.button.id == "btn_cancel":
+            if self.operation and not self.operation.finished:
+                self.operation.cancel()
+                return
             try:
                 self.app.pop_screen()
             except:
@@ -1858,6 +7264,8 @@ class CreatePostScreen(NiceModal):
 
         # Create post
         elif event.button.id == "btn_create":
+            if self.operation and not self.operation.finished:
+                return
             if not self.category:
                 status.show_error("Please select a category")
                 return
@@ -1872,62 +7280,14 @@ class CreatePostScreen(NiceModal):
             content = content_editor.text
 
             status.show_info("Creating post...")
-            script = SCRIPT_DIR / "create-post.sh"
             # self.category now includes parent (e.g., "routing/ospf" or "projects/automation")
-            code, out, err = run_command([str(script), self.category, title])
-
-            if code == 0:
-                status.show_success(f"✓ Created: {title}")
-
-                # Add content if provided
-                if content.strip():
-                    try:
-                        # Find the created file
-                        import glob
-                        pattern = f"content/{self.category}/*/index.md"
-                        files = glob.glob(str(PROJECT_ROOT / pattern))
-                        if files:
-                            newest = max(files, key=os.path.getctime)
-                            with open(newest, 'w') as f:
-                                f.write(content)
-                            status.show_success(f"✓ Content added")
-                    except Exception as e:
-                        status.show_error(f"✗ Content not added: {e}")
-
-                # Refresh file tree
-                try:
-                    file_tree = self.app.query_one(FileTree)
-                    tree = file_tree.query_one("#file-tree", Tree)
-                    file_tree.populate_tree(tree.root)
-                    tree.refresh()
-                except:
-                    pass
-
-                # Show success modal with options
-                self.post_created = True
-                self.post_title = title
-                self.post_category = self.category
-
-                # Find the created file
-                import glob
-                pattern = f"content/{self.category}/*/index.md"
-                files = glob.glob(str(PROJECT_ROOT / pattern))
-                if files:
-                    self.post_file = Path(max(files, key=os.path.getctime))
-                else:
-                    self.post_file = None
-
-                # Push success screen with options
-                self.app.push_screen(PostCreatedSuccessScreen(
-                    title=title,
-                    category=self.category,
-                    file_path=self.post_file
-                ))
-                return
-            else:
-                # Show detailed error message
-                error_msg = err if err else out
-                status.show_error(f"Failed: {error_msg.strip() if error_msg else 'Unknown error'}")
+            category = self.category
+            self.operation = self.app.operations.submit(Operation(
+                f"Create {title}",
+                [get_post_dir(category, generate_slug(title))],
+                lambda op: create_post(category, title, body=content),
+                on_done=lambda op: self._on_post_created(op, category, title)
+            ))
 
         elif event.button.id == "btn_close_modal":
             try:
@@ -1935,6 +7295,43 @@ class CreatePostScreen(NiceModal):
             except Exception:
                 pass
 
+    def _on_post_created(self, op: Operation, category: str, title: str) -> None:
+        """Show the outcome of a post creation."""
+        status = self.query_one("#status", NiceStatus)
+        if op.state == "cancelled":
+            status.show_warning("Post creation cancelled")
+            return
+        if op.state == "failed":
+            status.show_error(f"Failed: {op.error}")
+            return
+
+        success, message, post_file = op.result
+        if not success:
+            status.show_error(f"Failed: {message}")
+            return
+
+        status.show_success(f"✓ Created: {title}")
+
+        # Refresh file tree
+        try:
+            file_tree = self.app.query_one(FileTree)
+            file_tree.request_refresh([post_file.parent])
+        except:
+            pass
+
+        # Show success modal with options
+        self.post_created = True
+        self.post_title = title
+        self.post_category = category
+        self.post_file = post_file
+
+        # Push success screen with options
+        self.app.push_screen(PostCreatedSuccessScreen(
+            title=title,
+            category=category,
+            file_path=self.post_file
+        ))
+
 class PostCreatedSuccessScreen(NiceModal):
     """
     Success modal shown after creating a new post.
@@ -2010,6 +7407,7 @@ class DeleteCategoryScreen(ModalScreen):
     def __init__(self, on_success=None):
         super().__init__()
         self.on_success = on_success
+        self.operation = None
 
     def compose(self) -> ComposeResult:
         """Compose the delete category modal."""
@@ -2027,8 +7425,8 @@ class DeleteCategoryScreen(ModalScreen):
                 # Get all categories from filesystem
                 categories = []
                 try:
-                    for parent in ["routing", "junos", "projects"]:
-                        parent_dir = PROJECT_ROOT / "content" / parent
+                    for parent in POST_INDEX.sections:
+                        parent_dir = CONTENT_ROOT / parent
                         if parent_dir.exists():
                             for cat_dir in parent_dir.iterdir():
                                 if cat_dir.is_dir():
@@ -2072,52 +7470,73 @@ class DeleteCategoryScreen(ModalScreen):
         status = self.query_one("#status", NiceStatus)
 
         if event.button.id == "btn_delete":
+            if self.operation and not self.operation.finished:
+                return
             try:
                 select = self.query_one("#select-category", Select)
                 category_path = select.value
 
-                if not category_path:
+                if not category_path or category_path == Select.BLANK:
                     status.show_error("Please select a category")
                     return
 
-                # Delete the directory
-                import shutil
+                # Delete the directory in a worker (may hold many posts)
                 category_dir = Path(category_path)
                 if category_dir.exists():
-                    shutil.rmtree(category_dir)
-                    status.show_success(f"✓ Deleted: {category_dir.name}")
-
-                    # Refresh file tree
-                    try:
-                        file_tree = self.app.query_one(FileTree)
-                        tree = file_tree.query_one("#file-tree", Tree)
-                        file_tree.populate_tree(tree.root)
-                        tree.refresh()
-                    except:
-                        pass
-
-                    # Call success callback if provided
-                    if self.on_success:
-                        self.on_success()
-
-                    # Close modal after short delay
-                    def close_modal():
-                        try:
-                            self.app.pop_screen()
-                        except:
-                            pass
-                    self.set_timer(1, close_modal)
+                    self.operation = self.app.operations.submit(Operation(
+                        f"Delete {category_dir.name}",
+                        [category_dir],
+                        lambda op: delete_path(op, category_dir),
+                        on_progress=lambda op: status.show_info(op.progress_text),
+                        on_done=lambda op: self._on_deleted(op, category_dir)
+                    ))
                 else:
                     status.show_error("Category not found")
             except Exception as e:
                 status.show_error(f"Failed: {str(e)}")
 
         elif event.button.id == "btn_cancel":
+            if self.operation and not self.operation.finished:
+                self.operation.cancel()
+                return
             try:
                 self.app.pop_screen()
             except Exception:
                 pass
 
+    def _on_deleted(self, op: Operation, category_dir: Path) -> None:
+        """Report the result of a category delete and close on success."""
+        status = self.query_one("#status", NiceStatus)
+
+        # Refresh file tree (also after a partial delete)
+        try:
+            file_tree = self.app.query_one(FileTree)
+            file_tree.request_refresh([category_dir])
+        except:
+            pass
+
+        if op.state == "cancelled":
+            status.show_warning(f"Cancelled after {op.done} of {op.total} item(s)")
+            return
+        if op.state == "failed":
+            status.show_error(f"Failed: {op.error}")
+            return
+
+        status.show_success(f"✓ Deleted: {category_dir.name}")
+
+        # Call success callback if provided
+        if self.on_success:
+            self.on_success()
+
+        # Close modal after short delay
+        def close_modal():
+            try:
+                if self.app.screen is self:
+                    self.app.pop_screen()
+            except:
+                pass
+        self.set_timer(1, close_modal)
+
 
 class PostPreviewScreen(NiceModal):
     """
@@ -2139,11 +7558,7 @@ class PostPreviewScreen(NiceModal):
         yield from super().compose()
 
         # Extract title from content
-        title = self.post_path.split('/')[-2]
-        for line in self.content.split('\n'):
-            if line.strip().startswith('title ='):
-                title = line.split('=')[1].strip().strip("'\"")
-                break
+        title = DOCUMENTS.parse(self.post_path, self.content).frontmatter.title or self.post_path.split('/')[-2]
 
         yield Static(f"[bold cyan]Title:[/bold cyan] {title}", id="preview-title")
         yield Static(f"[dim]Path: {self.post_path}[/dim]", id="preview-path")
@@ -2185,11 +7600,7 @@ class EditorPreview(NiceModal):
         yield from super().compose()
 
         # Extract title from content
-        title = self.post_path.split('/')[-2]
-        for line in self.content.split('\n'):
-            if line.strip().startswith('title ='):
-                title = line.split('=')[1].strip().strip("'\"")
-                break
+        title = DOCUMENTS.parse(self.post_path, self.content).frontmatter.title or self.post_path.split('/')[-2]
 
         yield Static(f"[bold cyan]Editing:[/bold cyan] {title}", id="edit-title")
         yield Static(f"[dim]Path: {self.post_path}[/dim]", id="edit-path")
@@ -2204,7 +7615,7 @@ class EditorPreview(NiceModal):
                 yield TextArea(self.content, id="editor", language="markdown")
             with Vertical(id="preview-pane"):
                 yield Static("[bold]PREVIEW[/bold]", id="pane-label-preview")
-                yield Markdown(self.content, id="live-preview")
+                yield LivePreview(self.content, id="live-preview")
         yield NiceStatus("", id="status")
 
     def on_mount(self) -> None:
@@ -2221,8 +7632,8 @@ class EditorPreview(NiceModal):
         """
         if event.text_area.id == "editor":
             try:
-                preview = self.query_one("#live-preview", Markdown)
-                preview.update(event.text_area.text)
+                preview = self.query_one("#live-preview", LivePreview)
+                preview.schedule(event.text_area.text)
             except:
                 pass
 
@@ -2260,7 +7671,7 @@ class EditorPreview(NiceModal):
                 # Refresh file tree if exists
                 try:
                     file_tree = self.app.query_one(FileTree)
-                    file_tree.populate_tree(file_tree.query_one("#file-tree", Tree).root)
+                    file_tree.request_refresh([full_path])
                 except:
                     pass
 
@@ -2289,62 +7700,33 @@ class DeletePostScreen(ModalScreen):
     def __init__(self):
         super().__init__("Delete Post")
         self.posts = []
+        self.operation = None
         self._load_posts()
 
     def _load_posts(self):
-        """Load all posts from the content directory."""
+        """Load all posts from the shared post index."""
         try:
-            content_dir = PROJECT_ROOT / "content"
-            if not content_dir.exists():
-                return
-
-            # Find all index.md files
-            for index_file in content_dir.rglob("index.md"):
-                try:
-                    # Read frontmatter
-                    with open(index_file, 'r') as f:
-                        content = f.read()
-                        lines = content.split('\n')
-
-                    title = "Untitled"
-                    date = "Unknown"
-                    category = "Unknown"
-                    draft = True
-
-                    # Parse TOML frontmatter
-                    in_frontmatter = False
-                    for line in lines:
-                        if line.startswith("+++"):
-                            in_frontmatter = not in_frontmatter
-                            continue
-                        if in_frontmatter:
-                            if line.startswith("title ="):
-                                title = line.split("=", 1)[1].strip().strip('"')
-                            elif line.startswith("date ="):
-                                date = line.split("=", 1)[1].strip().strip('"')
-                            elif line.startswith("draft ="):
-                                draft = "true" in line.lower()
-
-                    # Get category from path
-                    rel_path = index_file.relative_to(content_dir)
-                    parts = list(rel_path.parts[:-1])  # Remove 'index.md'
-                    if len(parts) >= 2:
-                        category = f"{parts[0]}/{parts[1]}"
-                    elif len(parts) == 1:
-                        category = parts[0]
-
-                    self.posts.append({
-                        "path": index_file,
-                        "title": title,
-                        "date": date,
-                        "category": category,
-                        "draft": draft
-                    })
-                except Exception as e:
-                    pass
-
-            # Sort by date (newest first)
-            self.posts.sort(key=lambda x: x["date"], reverse=True)
+            # Newest first, ordered by parsed date rather than the raw string;
+            # runs on the UI thread, so read the snapshot the watcher keeps current
+            for entry in POST_INDEX.query(under=CONTENT_ROOT, sort='date', reverse=True, refresh=False):
+                index_file = entry.path
+
+                # Get category from path
+                category = "Unknown"
+                rel_path = index_file.relative_to(CONTENT_ROOT)
+                parts = list(rel_path.parts[:-1])  # Remove 'index.md'
+                if len(parts) >= 2:
+                    category = f"{parts[0]}/{parts[1]}"
+                elif len(parts) == 1:
+                    category = parts[0]
+
+                self.posts.append({
+                    "path": index_file,
+                    "title": entry.title or "Untitled",
+                    "date": entry.date or "Unknown",
+                    "category": category,
+                    "draft": entry.draft
+                })
 
         except Exception as e:
             pass
@@ -2397,10 +7779,16 @@ class DeletePostScreen(ModalScreen):
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button clicks."""
         if event.button.id == "btn_close" or event.button.id == "btn_cancel":
+            if self.operation and not self.operation.finished:
+                self.operation.cancel()
+                return
             self.app.pop_screen()
             return
 
         elif event.button.id == "btn_delete":
+            if self.operation and not self.operation.finished:
+                return
+
             # Get selected post
             table = self.query_one("#posts-table", DataTable)
             if table.cursor_row is None:
@@ -2416,39 +7804,46 @@ class DeletePostScreen(ModalScreen):
                 self._delete_post(post_path)
 
     def _delete_post(self, post_path: Path):
-        """Delete the selected post."""
+        """Delete the selected post in a worker."""
+        # Get the post directory (parent of index.md)
+        post_dir = post_path.parent
+
+        def show_progress(op):
+            self.query_one("#modal-title", Static).update(f"[#ebcb8b]{op.progress_text}[/#ebcb8b]")
+
+        self.operation = self.app.operations.submit(Operation(
+            f"Delete {post_dir.name}",
+            [post_dir],
+            lambda op: delete_path(op, post_dir),
+            on_progress=show_progress,
+            on_done=lambda op: self._on_post_deleted(op, post_dir)
+        ))
+
+    def _on_post_deleted(self, op: Operation, post_dir: Path):
+        """Close and report once the post directory has been deleted."""
+        # Refresh file tree
         try:
-            # Get the post directory (parent of index.md)
-            post_dir = post_path.parent
+            file_tree = self.app.query_one(FileTree)
+            file_tree.request_refresh([post_dir])
+        except:
+            pass
 
-            # Delete the directory
-            import shutil
-            shutil.rmtree(post_dir)
+        if op.state != "done":
+            message = "Cancelled" if op.state == "cancelled" else f"Error: {op.error}"
+            self.query_one("#modal-title", Static).update(f"[#bf616a]✗ {message}[/#bf616a]")
+            return
 
-            # Show success and close
+        # Show success and close
+        if self.app.screen is self:
             self.app.pop_screen()
 
-            # Refresh file tree
-            try:
-                file_tree = self.app.query_one(FileTree)
-                tree = file_tree.query_one("#file-tree", Tree)
-                file_tree.populate_tree(tree.root)
-                tree.refresh()
-            except:
-                pass
-
-            # Show success message in AI log
-            try:
-                ai_tab = self.app.query_one(AIAgentTab)
-                log = ai_tab.query_one("#ai-log", RichLog)
-                log.write(f"[green]✓ Deleted: {post_dir.name}[/green]\n")
-            except:
-                pass
-
-        except Exception as e:
-            self.app.query_one("#modal-title", Static).update(
-                f"[#bf616a]✗ Error: {str(e)}[/#bf616a]"
-            )
+        # Show success message in AI log
+        try:
+            ai_tab = self.app.query_one(AIAgentTab)
+            log = ai_tab.query_one("#ai-log", RichLog)
+            log.write(f"[green]✓ Deleted: {post_dir.name}[/green]\n")
+        except:
+            pass
 
 
 class CreateCategoryScreen(ModalScreen):
@@ -2458,14 +7853,14 @@ class CreateCategoryScreen(ModalScreen):
     Features:
         - Shows existing categories
         - Name input with validation
-        - Parent section selection (routing, junos, projects)
+        - Parent section selection (the site's main sections)
         - Creates directory in selected parent section
     """
 
     def __init__(self, on_success=None):
         super().__init__()
         self.on_success = on_success
-        self.parent_section = "routing"  # Default to routing
+        self.parent_section = POST_INDEX.sections[0]
 
     def compose(self) -> ComposeResult:
         """Compose the create category modal."""
@@ -2481,12 +7876,8 @@ class CreateCategoryScreen(ModalScreen):
                 # Parent section dropdown
                 yield Label("Parent Section:", classes="field-label")
                 yield Select(
-                    [
-                        ("Routing", "routing"),
-                        ("Junos", "junos"),
-                        ("Projects", "projects"),
-                    ],
-                    value="routing",
+                    [(section.capitalize(), section) for section in POST_INDEX.sections],
+                    value=self.parent_section,
                     id="select-parent",
                     classes="field-select"
                 )
@@ -2677,8 +8068,9 @@ class HelpScreen(NiceModal):
   • [cyan]Ctrl+S[/cyan] - Save current file
   • [cyan]Ctrl+K[/cyan] - Create new category
   • [cyan]Ctrl+V[/cyan] - View all posts
-  • [cyan]Ctrl+Shift+P[/cyan] - Preview site
+  • [cyan]Ctrl+Shift+P[/cyan] - Preview open post (or site)
   • [cyan]Esc[/cyan] - Close editor/modal
+  • [cyan]Ctrl+F[/cyan] - Browse/search full output history (in a log)
 
 [bold yellow]💡 TIPS & TRICKS[/bold yellow]
 
@@ -2719,6 +8111,181 @@ class HelpScreen(NiceModal):
         yield Static(help_text, id="help-content")
 
 
+class LogHistoryScreen(NiceModal):
+    """
+    Browser for a log's full history, including lines spilled to disk.
+
+    Features:
+        - Pages of LOG_PAGE_LINES lines read on demand (older, newer, latest)
+        - Search (Enter) jumps to the next older line containing the text;
+          repeat Enter to keep going back
+        - Only the visible page is loaded
+    """
+
+    def __init__(self, history: LogHistory, name: str):
+        super().__init__(f"Log History: {name}")
+        self.history = history
+        self.start = max(len(history) - LOG_PAGE_LINES, 0)
+        self.match = None
+
+    def compose(self) -> ComposeResult:
+        """Compose the history browser."""
+        yield from super().compose()
+        yield Input(placeholder="Search older lines (Enter)", id="history-search")
+        yield Static("", id="history-position")
+        yield RichLog(id="history-log", wrap=True, markup=True, auto_scroll=False)
+        yield Horizontal(
+            Button("◀ Older", id="btn_history_older"),
+            Button("Newer ▶", id="btn_history_newer"),
+            Button("Latest", id="btn_history_latest"),
+            id="history-actions"
+        )
+
+    def on_mount(self) -> None:
+        """Show the newest page."""
+        self.show_page()
+
+    def show_page(self, note: str = "") -> None:
+        """
+        Render the current page.
+
+        Args:
+            note: Extra text for the position line
+        """
+        log = self.query_one("#history-log", RichLog)
+        log.clear()
+        lines = self.history.page(self.start, LOG_PAGE_LINES)
+        output = OutputSink(log)
+        match_y = None
+        for index, line in enumerate(lines, self.start):
+            if index == self.match:
+                output.flush()
+                match_y = len(log.lines)
+                line = f"[reverse]{line}[/reverse]"
+            output.write(line)
+        output.flush()
+        if match_y is not None:
+            log.scroll_to(y=max(match_y - 3, 0), animate=False)
+        else:
+            log.scroll_end(animate=False)
+
+        total = len(self.history)
+        end = self.start + len(lines)
+        position = f"Lines {self.start + 1 if lines else 0}–{end} of {total} ({self.history.spilled} on disk)"
+        self.query_one("#history-position", Static).update(
+            f"[dim]{position}[/dim]" + (f"  {escape(note)}" if note else ""))
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """A new search starts from the current page."""
+        self.match = None
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """Find the next older line containing the search text."""
+        needle = event.value.strip()
+        if not needle:
+            return
+        before = self.match if self.match is not None else self.start + LOG_PAGE_LINES
+        found = self.history.find(needle, before)
+        if found is None:
+            self.show_page(f"No older match for '{needle}'")
+            return
+        self.match = found
+        self.start = max(found - LOG_PAGE_LINES // 2, 0)
+        self.show_page()
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        """Handle paging buttons."""
+        last_page = max(len(self.history) - LOG_PAGE_LINES, 0)
+        if event.button.id == "btn_history_older":
+            self.start = max(self.start - LOG_PAGE_LINES, 0)
+        elif event.button.id == "btn_history_newer":
+            self.start = min(self.start + LOG_PAGE_LINES, last_page)
+        elif event.button.id == "btn_history_latest":
+            self.start = last_page
+        else:
+            super().on_button_pressed(event)
+            return
+        self.show_page()
+
+
+class JobsScreen(NiceModal):
+    """
+    Running, queued and recently finished background jobs.
+
+    Features:
+        - State, kind, elapsed time, CPU time and peak RSS per job,
+          refreshed every second
+        - Cancel: SIGTERM to the job's process group (SIGKILL after
+          JOB_KILL_GRACE seconds); queued jobs are dropped
+        - Kill: SIGKILL to the process group right away
+    """
+
+    STATE_STYLES = {
+        "queued": "dim", "running": "cyan", "done": "green",
+        "failed": "red", "cancelled": "yellow",
+    }
+
+    def __init__(self):
+        super().__init__("Background Jobs")
+
+    def compose(self) -> ComposeResult:
+        """Compose the job list."""
+        yield from super().compose()
+        yield DataTable(id="jobs-table", cursor_type="row", zebra_stripes=True)
+        yield Horizontal(
+            Button("⏹ Cancel", id="btn_job_cancel", variant="warning"),
+            Button("☠ Kill", id="btn_job_kill", variant="error"),
+            id="jobs-actions"
+        )
+
+    def on_mount(self) -> None:
+        """Fill the table and keep it current."""
+        table = self.query_one("#jobs-table", DataTable)
+        table.add_columns("Job", "Kind", "State", "Time", "CPU", "Peak RSS")
+        self.refresh_jobs()
+        self.set_interval(1.0, self.refresh_jobs)
+
+    def refresh_jobs(self) -> None:
+        """Re-render the job list, newest first, keeping the selected row."""
+        table = self.query_one("#jobs-table", DataTable)
+        selected = self._selected()
+        table.clear()
+        for job in reversed(self.app.jobs.jobs):
+            style = self.STATE_STYLES.get(job.state, "")
+            usage = job.task.usage
+            table.add_row(escape(job.title), job.kind, f"[{style}]{job.state}[/{style}]",
+                          f"{job.elapsed:.1f}s", f"{usage.cpu:.1f}s" if usage.samples else "—",
+                          format_bytes(usage.peak_rss) if usage.peak_rss else "—", key=str(id(job)))
+        if selected is not None:
+            try:
+                table.move_cursor(row=table.get_row_index(str(id(selected))))
+            except Exception:
+                pass
+
+    def _selected(self):
+        """The job on the cursor row (or None)."""
+        table = self.query_one("#jobs-table", DataTable)
+        if not table.row_count:
+            return None
+        try:
+            key = table.coordinate_to_cell_key(table.cursor_coordinate).row_key.value
+        except Exception:
+            return None
+        return next((job for job in self.app.jobs.jobs if str(id(job)) == key), None)
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        """Cancel or kill the selected job."""
+        if event.button.id in ("btn_job_cancel", "btn_job_kill"):
+            job = self._selected()
+            if job is None or job.finished:
+                self.app.notify("Select a queued or running job")
+                return
+            self.app.jobs.cancel(job, kill=event.button.id == "btn_job_kill")
+            self.refresh_jobs()
+        else:
+            super().on_button_pressed(event)
+
+
 # =============================================
 # MAIN APPLICATION
 # =============================================
@@ -2755,10 +8322,179 @@ class BlogAutomationApp(App):
     def __init__(self):
         super().__init__()
         self.current_open_file = None
+        self.watcher = None
+        self.rendered_view = None
+        self.operations = OperationManager(self)
+        self.jobs = JobManager(self)
+        self.preview = PreviewServer(self)
 
     def on_mount(self) -> None:
         """Initialize application on mount."""
-        pass
+        # Revalidate the (possibly cached) post index without blocking the UI
+        self.scan_posts()
+
+        # Fetch git metadata in the background; later polls only stat HEAD
+        self.refresh_git_info()
+        self.set_interval(GIT_POLL_INTERVAL, self.refresh_git_info)
+
+        # Watch the project so external edits show up without Ctrl+R
+        self.watcher = FileWatcher(
+            [PROJECT_ROOT / name for name in WATCH_DIRS if (PROJECT_ROOT / name).exists()],
+            on_changes=lambda *batch: self.call_from_thread(self.apply_fs_changes, *batch)
+        )
+        if not self.watcher.start():
+            self.watcher = None
+
+        # Load scripts/lib into a shell worker before the first script run;
+        # what the libraries print while loading goes to the app log once
+        SHELL_WORKERS.on_preamble = lambda lines: self.log.info("shell worker: " + "\n".join(lines))
+        self.run_worker(SHELL_WORKERS.warm(), group="shell-workers")
+
+    def on_unmount(self) -> None:
+        """Stop background watchers, file operations, jobs and shell workers on exit."""
+        if self.watcher:
+            self.watcher.stop()
+        self.operations.cancel_all()
+        self.jobs.cancel_all()
+        SHELL_WORKERS.close()
+
+    def scan_posts(self) -> None:
+        """
+        Revalidate the post index in a background thread.
+
+        Partial counts are pushed to the status bar (and the dashboard,
+        if shown) while the scan runs; views are re-rendered with final
+        counts when it completes. The section of the open file is
+        scanned first. Does nothing if a scan is running.
+        """
+        if POST_INDEX.sweeping:
+            return
+        self.run_worker(self._scan_posts_worker, thread=True, group="post-scan")
+
+    def _scan_posts_worker(self) -> None:
+        """Worker body for scan_posts (runs in a thread)."""
+        def report(scanned):
+            self.call_from_thread(self._on_scan_progress, False, True)
+
+        changed = POST_INDEX.refresh(force=True, on_progress=report, first=self.current_section())
+        self.call_from_thread(self._on_scan_progress, True, changed)
+
+    def refresh_git_info(self) -> None:
+        """Update git metadata in a background thread."""
+        self.run_worker(self._git_info_worker, thread=True, group="git-info", exclusive=True)
+
+    def _git_info_worker(self) -> None:
+        """Worker body for refresh_git_info (runs in a thread)."""
+        GIT_INFO.refresh()
+        self.call_from_thread(self._on_git_info)
+
+    def _on_git_info(self) -> None:
+        """Show fetched git metadata in the status bar and dashboard."""
+        try:
+            if not self.query_one(StatusBar).update_git():
+                return
+        except Exception:
+            return
+
+        if self.rendered_view == "dashboard" and self.current_open_file is None:
+            try:
+                self.show_dashboard(self.query_one("#content-log", RichLog), scanning=POST_INDEX.sweeping)
+            except Exception:
+                pass
+
+    def current_section(self) -> str:
+        """
+        Return the site section the user is working in.
+
+        Returns:
+            Section of the open content file, else the first main section
+        """
+        try:
+            rel_path = Path(self.current_open_file).relative_to(CONTENT_ROOT)
+            if rel_path.parts[0] in POST_INDEX.sections:
+                return rel_path.parts[0]
+        except Exception:
+            pass
+        return POST_INDEX.sections[0]
+
+    def _on_scan_progress(self, finished: bool, changed: bool) -> None:
+        """
+        Show scan results as they arrive.
+
+        Args:
+            finished: True for the final report of a scan
+            changed: True if post metadata changed
+        """
+        if not changed:
+            return
+
+        try:
+            self.query_one(StatusBar).update_counts()
+        except Exception:
+            pass
+
+        if self.current_open_file is not None:
+            return
+        try:
+            log = self.query_one("#content-log", RichLog)
+        except Exception:
+            return
+
+        if self.rendered_view == "dashboard":
+            self.show_dashboard(log, scanning=not finished)
+        elif self.rendered_view == "posts" and finished:
+            self.show_posts(log)
+
+    def apply_fs_changes(self, changed: set, structural: set, overflow: bool) -> None:
+        """
+        Apply a batch of filesystem changes as deltas.
+
+        Args:
+            changed: All paths touched in the batch
+            structural: Paths created, deleted or renamed
+            overflow: True if events were lost and a rescan is required
+
+        Behavior:
+            - Updates post metadata for changed content only, in a worker
+              thread (re-reads frontmatter, may sweep a section and
+              rewrites its cache shard)
+            - Updates StatusBar counters if post metadata changed
+            - Rebuilds only the affected FileTree directories
+            - Restarts the preview server after theme changes
+        """
+        content_paths = [p for p in changed if p.is_relative_to(CONTENT_ROOT)]
+        if overflow or content_paths:
+            self.run_worker(partial(self._fs_index_worker, content_paths, overflow),
+                            thread=True, group="fs-changes")
+
+        # Theme edits need a preview restart (hugo.toml is polled by the server)
+        self.preview.config_changed(changed)
+
+        try:
+            file_tree = self.query_one(FileTree)
+            if overflow:
+                file_tree.request_refresh()
+            elif structural:
+                file_tree.request_refresh(structural)
+        except Exception:
+            pass
+
+    def _fs_index_worker(self, content_paths: list, overflow: bool) -> None:
+        """Worker body for apply_fs_changes: update the post index (runs in a thread)."""
+        if overflow:
+            POST_INDEX.refresh(force=True)
+            posts_changed = True
+        else:
+            posts_changed = POST_INDEX.apply_changes(content_paths)
+        if posts_changed:
+            self.call_from_thread(self._on_fs_index_changed)
+
+    def _on_fs_index_changed(self) -> None:
+        """Show post counters updated by _fs_index_worker."""
+        try:
+            self.query_one(StatusBar).update_counts()
+        except Exception:
+            pass
 
     def compose(self) -> ComposeResult:
         """Compose the main application layout."""
@@ -2817,6 +8553,8 @@ class BlogAutomationApp(App):
             delattr(content_area_widget, 'current_file_path')
         self.current_open_file = None
 
+        self.rendered_view = None
+
         # Handle automation view - show sidebar
         if view == "automation" and automation_tab:
             content_log.clear()
@@ -2877,8 +8615,14 @@ class BlogAutomationApp(App):
         }
 
         if view in views:
+            self.rendered_view = view
             views[view](content_log)
 
+        # Views render from the post index snapshot; revalidate it in the
+        # background and re-render if anything changed
+        if view in ("dashboard", "posts"):
+            self.scan_posts()
+
     def open_file_in_content(self, file_path: Path) -> None:
         """
         Open a file in the main content area.
@@ -2894,6 +8638,7 @@ class BlogAutomationApp(App):
 
         # Track current file
         self.current_open_file = file_path
+        self.rendered_view = None
 
         # For markdown files, open directly in edit mode
         if file_path.suffix == '.md':
@@ -2948,24 +8693,28 @@ class BlogAutomationApp(App):
         """Refresh current view (Ctrl+R)."""
         log = self.query_one("#content-log", RichLog)
         log.write("\n[dim]Refreshing...[/dim]\n")
-        # Force re-render current view
+        # Force re-render current view (also revalidates the post index
+        # in the background: stat sweep, re-reads changed posts only)
         nav = self.query_one(TopNav)
         self.change_view(nav.current_view)
+        self.refresh_git_info()
 
     def action_create_post(self) -> None:
         """Open create post modal (Ctrl+N)."""
         self.push_screen(CreatePostScreen())
 
     def action_preview(self) -> None:
-        """Preview the site (Ctrl+Shift+P)."""
+        """Preview the open post, or the site, in the preview server (Ctrl+Shift+P)."""
+        if not self.preview.running:
+            automation_tab = self.query_one(AutomationTab)
+            automation_tab._run_preview(automation_tab.query_one("#automation-log", RichLog),
+                                        automation_tab.query_one("#status-text", Static))
+
+        url = self.preview.url_for(self.current_open_file) if self.current_open_file else self.preview.base_url + "/"
         log = self.query_one("#content-log", RichLog)
-        log.write(
-            "\n[bold cyan]Starting preview server...[/bold cyan]\n\n"
-            "Open [bold]http://localhost:1313[/bold] in your browser\n\n"
-            "[yellow]Press Ctrl+C to stop the server[/yellow]\n\n"
-            "[dim]Note: Server runs in background[/dim]\n"
-            "[dim]Stop with: pkill hugo[/dim]\n"
-        )
+        state = "ready" if self.preview.state == "ready" else "opens when the server is ready"
+        log.write(Text.from_markup(f"\n[bold cyan]Preview:[/bold cyan] [link={url}]{url}[/link] [dim]({state})[/dim]\n"))
+        self.preview.open(self.current_open_file)
 
     def action_create_category(self) -> None:
         """Create a new category (Ctrl+K)."""
@@ -2979,12 +8728,13 @@ class BlogAutomationApp(App):
     # VIEW RENDERERS
     # =============================================
 
-    def show_dashboard(self, log: RichLog) -> None:
+    def show_dashboard(self, log: RichLog, scanning: bool = False) -> None:
         """
         Render the dashboard view.
         
         Args:
             log: RichLog widget to render content into
+            scanning: Counts are partial (a content scan is running)
             
         Content:
             - Blog statistics
@@ -2995,7 +8745,7 @@ class BlogAutomationApp(App):
         log.clear()
         log.visible = True
 
-        stats = get_stats()
+        stats = get_stats(refresh=False)
         total_posts = stats['drafts'] + stats['published']
 
         # Dashboard header
@@ -3006,7 +8756,8 @@ class BlogAutomationApp(App):
         # Blog Statistics
         log.write("[bold yellow]📊 BLOG STATISTICS[/bold yellow]")
         log.write("─" * 65)
-        log.write(f"  [bold]Total Posts:[/bold]         [cyan]{total_posts}[/cyan]")
+        scan_note = " [dim](scanning…)[/dim]" if scanning else ""
+        log.write(f"  [bold]Total Posts:[/bold]         [cyan]{total_posts}[/cyan]{scan_note}")
         log.write(f"  [bold]Published Posts:[/bold]     [green]{stats['published']}[/green] ✅")
         log.write(f"  [bold]Draft Posts:[/bold]         [yellow]{stats['drafts']}[/yellow] 📋")
         log.write(f"  [bold]Last Git Commit:[/bold]     [dim]{stats['last_commit']}[/dim]\n")
@@ -3074,72 +8825,37 @@ class BlogAutomationApp(App):
         except:
             pass
 
-        # Scan for all posts
-        posts = []
+        # Collect posts per category from the shared index (sorted by title)
+        by_category = {}
 
         try:
-            for cat_dir in CONTENT_DIR.iterdir():
-                if cat_dir.is_dir():
-                    for post_dir in cat_dir.iterdir():
-                        index_file = post_dir / "index.md"
-                        if index_file.exists():
-                            # Read post metadata
-                            title = post_dir.name
-                            is_draft = True
-                            summary = ""
-
-                            try:
-                                with open(index_file, 'r') as f:
-                                    content = f.read()
-                                    # Parse frontmatter
-                                    if 'draft = false' in content:
-                                        is_draft = False
-                                    # Extract title
-                                    for line in content.split('\n'):
-                                        if line.strip().startswith('title ='):
-                                            title = line.split('=')[1].strip().strip("'\"")
-                                            break
-                                        if line.strip() == '+++':
-                                            break
-                                    # Extract summary
-                                    for line in content.split('\n'):
-                                        if line.strip().startswith('summary ='):
-                                            summary = line.split('=')[1].strip().strip("'\"")
-                                            break
-                            except:
-                                pass
-
-                            posts.append({
-                                'path': index_file,
-                                'title': title,
-                                'category': cat_dir.name,
-                                'draft': is_draft,
-                                'summary': summary
-                            })
+            for category in POST_INDEX.categories():
+                cat_posts = [
+                    {
+                        'path': entry.path,
+                        'title': entry.title or entry.path.parent.name,
+                        'draft': entry.draft,
+                        'summary': entry.summary
+                    }
+                    for entry in POST_INDEX.query(category=category, sort='title')
+                ]
+                if cat_posts:
+                    by_category[category.upper()] = cat_posts
         except Exception as e:
             log.write(f"[red]Error scanning posts:[/red] {str(e)}")
             return
 
-        # Sort by title
-        posts.sort(key=lambda p: p['title'])
+        total = sum(len(cat_posts) for cat_posts in by_category.values())
 
         # Display posts in a nice format
         log.write("[bold cyan]╔═══════════════════════════════════════════════════════════════╗[/bold cyan]")
-        log.write(f"[bold cyan]║                      ALL POSTS ({len(posts)})                          ║[/bold cyan]")
+        log.write(f"[bold cyan]║                      ALL POSTS ({total})                          ║[/bold cyan]")
         log.write("[bold cyan]╚═══════════════════════════════════════════════════════════════╝[/bold cyan]\n")
 
-        if not posts:
+        if not by_category:
             log.write("[yellow]No posts found. Create your first post with Ctrl+N[/yellow]")
             return
 
-        # Group by category
-        by_category = {}
-        for post in posts:
-            cat = post['category'].upper()
-            if cat not in by_category:
-                by_category[cat] = []
-            by_category[cat].append(post)
-
         # Display posts by category
         for category, cat_posts in sorted(by_category.items()):
             log.write(f"[bold yellow]📁 {category}[/bold yellow] ({len(cat_posts)} posts)")
@@ -3226,8 +8942,12 @@ class BlogAutomationApp(App):
             f"[dim]Configuration and preferences[/dim]\n\n"
             f"[bold]Configuration:[/bold]\n"
             f"  • Site URL: https://ngeranio.com\n"
-            f"  • Main sections: routing\n"
+            f"  • Main sections: {escape(', '.join(POST_INDEX.sections))}\n"
             f"  • Pagination: 6 posts per page\n\n"
+            f"[bold]Post Index:[/bold]\n"
+            f"  • Indexed posts: {len(POST_INDEX)}\n"
+            f"  • Memory per post: ~{POST_INDEX.bytes_per_post():.0f} B "
+            f"(budget {POST_RECORD_BUDGET} B)\n\n"
             f"[bold]Environment:[/bold]\n"
             f"  • Hugo Extended: [green]✓ Installed[/green]\n"
             f"  • Git: [green]✓ Available[/green]\n"
@@ -0,0 +1,73 @@
+"""
+Shared fixtures for the automation TUI tests.
+
+automation-tui.py is a script, not a package: it is loaded once from its
+path and registered as the module "tui".
+"""
+
+import importlib.util
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+def _load_tui():
+    """Import scripts/automation-tui.py as the module "tui"."""
+    if "tui" in sys.modules:
+        return sys.modules["tui"]
+    spec = importlib.util.spec_from_file_location("tui", SCRIPTS_DIR / "automation-tui.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["tui"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def tui():
+    """The automation TUI module."""
+    return _load_tui()
+
+
+@pytest.fixture
+def site(tmp_path):
+    """
+    A throwaway Hugo project holding the fixture posts.
+
+    Returns:
+        Project root (content/ copied from tests/fixtures)
+    """
+    shutil.copytree(FIXTURES_DIR / "content", tmp_path / "content")
+    return tmp_path
+
+
+def _write_post(root: Path, rel: str, title: str = "Post", date: str = "2025-01-01T00:00:00Z",
+                draft: bool = False, tags: tuple = (), body: str = "## Overview\n\nText.\n") -> Path:
+    """
+    Write a page bundle with TOML front matter.
+
+    Args:
+        root: Content root
+        rel: Bundle directory relative to root, e.g. "routing/bgp/rr"
+
+    Returns:
+        Path of the bundle's index.md
+    """
+    path = root / rel / "index.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tag_list = ", ".join(f'"{tag}"' for tag in tags)
+    path.write_text(
+        f'+++\ntitle = "{title}"\ndate = "{date}"\ndraft = {str(draft).lower()}\n'
+        f'tags = [{tag_list}]\n+++\n\n{body}'
+    )
+    return path
+
+
+@pytest.fixture
+def write_post():
+    """Writer for page bundles: write_post(root, rel, title=..., date=..., draft=..., tags=..., body=...)."""
+    return _write_post
@@ -0,0 +1,126 @@
+"""Tests for the content helpers that create categories and posts."""
+
+import os
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+from textual.app import App
+from textual.widgets import Select
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+
+# Front matter date line, which differs between two runs
+DATE_LINE_RE = re.compile(r'^date = .*$', re.MULTILINE)
+
+
+@pytest.fixture
+def sections(tui, tmp_path, monkeypatch):
+    """Content root with the main sections "linux" and "routing"."""
+    root = tmp_path / "content"
+    for section in ("linux", "routing"):
+        (root / section).mkdir(parents=True)
+    monkeypatch.setattr(tui, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(tui, "CONTENT_ROOT", root)
+    monkeypatch.setattr(tui, "CONTENT_DIR", root / "linux")
+    monkeypatch.setattr(tui, "POST_INDEX", tui.PostIndex(root, ["linux", "routing"]))
+    return root
+
+
+def test_create_category_in_named_section(tui, sections):
+    assert tui.create_category("routing/ISIS")[0]
+    assert (sections / "routing" / "isis").is_dir()
+
+    ok, message = tui.create_category("routing/isis")
+    assert not ok and "already exists" in message
+
+
+def test_bare_category_goes_to_first_section(tui, sections):
+    assert tui.create_category("Kernel")[0]
+    assert (sections / "linux" / "kernel").is_dir()
+    assert not (sections / "routing" / "kernel").exists()
+
+
+def test_get_categories_spans_sections(tui, sections):
+    for rel in ("linux/kernel", "routing/bgp", "routing/ospf"):
+        (sections / rel).mkdir()
+    assert tui.get_categories() == ["bgp", "kernel", "ospf"]
+
+
+@pytest.mark.asyncio
+async def test_category_modals_list_main_sections(tui, sections):
+    (sections / "routing" / "bgp").mkdir()
+    (sections / "linux" / "kernel").mkdir()
+
+    async with App().run_test() as pilot:
+        await pilot.app.push_screen(tui.CreateCategoryScreen())
+        parent = pilot.app.screen.query_one("#select-parent", Select)
+        assert [value for _, value in parent._options if value != Select.BLANK] == ["linux", "routing"]
+        assert parent.value == "linux"
+
+        pilot.app.pop_screen()
+        await pilot.app.push_screen(tui.DeleteCategoryScreen())
+        category = pilot.app.screen.query_one("#select-category", Select)
+        assert sorted(str(value) for _, value in category._options if value != Select.BLANK) == [
+            str(sections / "linux" / "kernel"), str(sections / "routing" / "bgp")]
+
+
+def make_project(root: Path) -> Path:
+    """Project with homelab, routing/ospf and junos/ospf directories."""
+    for rel in ("homelab", "routing/ospf", "routing/bgp", "junos/ospf"):
+        (root / "content" / rel).mkdir(parents=True)
+    return root
+
+
+def run_create_post_sh(project: Path, category: str, title: str, content_dir: str) -> list:
+    """Run create-post.sh with CONTENT_DIR set; returns the index.md files it created."""
+    shutil.copytree(SCRIPTS_DIR / "lib", project / "scripts" / "lib")
+    shutil.copy(SCRIPTS_DIR / "create-post.sh", project / "scripts" / "create-post.sh")
+    (project / ".env").write_text(f"CONTENT_DIR={content_dir}\n")
+    env = {key: value for key, value in os.environ.items() if key != "CONTENT_DIR"}
+    result = subprocess.run(["bash", "scripts/create-post.sh", category, title], cwd=project, env=env,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    return sorted((project / "content").rglob("index.md"))
+
+
+def masked(index_file: Path) -> str:
+    return DATE_LINE_RE.sub("date = …", index_file.read_text())
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="create-post.sh needs bash")
+@pytest.mark.parametrize("category, content_dir", [
+    ("homelab", "content/routing"),
+    ("ospf", "content/routing"),
+    # The script resolves categories below CONTENT_DIR, so a section path needs content/
+    ("routing/ospf", "content"),
+])
+def test_create_post_matches_script(tui, tmp_path, monkeypatch, category, content_dir):
+    title = "Hugo on k3s with Nix: Part 2"
+    shell = make_project(tmp_path / "shell")
+    [shell_file] = run_create_post_sh(shell, category, title, content_dir)
+
+    native = make_project(tmp_path / "native")
+    monkeypatch.setattr(tui, "PROJECT_ROOT", native)
+    monkeypatch.setattr(tui, "CONTENT_ROOT", native / "content")
+    monkeypatch.setattr(tui, "CONTENT_DIR", native / "content" / "routing")
+    monkeypatch.setattr(tui, "POST_INDEX", tui.PostIndex(native / "content", ["routing", "junos"]))
+    ok, message, native_file = tui.create_post(category, title)
+
+    assert ok, message
+    assert native_file.relative_to(native) == shell_file.relative_to(shell)
+    assert masked(native_file) == masked(shell_file)
+    assert (native_file.parent / "featured.png").exists() and (shell_file.parent / "featured.png").exists()
+
+
+def test_bare_category_resolves_against_sections(tui, sections):
+    (sections / "routing" / "bgp").mkdir()
+    ok, _, index_file = tui.create_post("bgp", "Route Reflectors")
+    assert ok and index_file == sections / "routing" / "bgp" / "route-reflectors" / "index.md"
+
+    ok, message, index_file = tui.create_post("isis", "Levels")
+    assert not ok and index_file is None
+    assert "Invalid category" in message
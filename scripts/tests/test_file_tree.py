@@ -0,0 +1,145 @@
+"""Tests for FileTree's lazy listing and diff-based refresh."""
+
+import shutil
+from contextlib import asynccontextmanager
+
+import pytest
+from textual.app import App
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def project(tui, tmp_path, monkeypatch):
+    """Project root with a small content directory."""
+    content = tmp_path / "content"
+    for name in ("bgp", "ospf"):
+        (content / name).mkdir(parents=True)
+    (content / "bgp" / "route-reflectors.md").write_text("")
+    for name in ("b.md", "d.md", "skip.png", ".hidden.md"):
+        (content / name).write_text("")
+    monkeypatch.setattr(tui, "PROJECT_ROOT", tmp_path)
+    return tmp_path
+
+
+@asynccontextmanager
+async def mounted_tree(tui):
+    """Mount a FileTree in a test app; yields (pilot, file_tree)."""
+
+    class TreeApp(App):
+        def compose(self):
+            yield tui.FileTree()
+
+    app = TreeApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        yield pilot, app.query_one(tui.FileTree)
+
+
+def labels(node):
+    return [str(child.label) for child in node.children]
+
+
+async def expand(pilot, file_tree, path):
+    node = file_tree._dir_nodes[path]
+    node.expand()
+    await pilot.pause()
+    return node
+
+
+async def refresh(pilot, file_tree, paths=None):
+    file_tree.request_refresh(paths)
+    await pilot.pause()
+
+
+async def test_directories_list_lazily_in_sorted_order(tui, project):
+    async with mounted_tree(tui) as (pilot, file_tree):
+        node = file_tree._dir_nodes[project / "content"]
+        assert labels(node) == ["…"]
+        assert project / "content" not in file_tree._loaded_dirs
+
+        await expand(pilot, file_tree, project / "content")
+        assert labels(node) == ["bgp/", "ospf/", "b.md", "d.md"]
+        assert labels(file_tree._dir_nodes[project / "content" / "bgp"]) == ["…"]
+        assert project / "content" / "bgp" not in file_tree._loaded_dirs
+
+
+async def test_reconcile_inserts_and_removes_in_sorted_position(tui, project):
+    content = project / "content"
+    async with mounted_tree(tui) as (pilot, file_tree):
+        node = await expand(pilot, file_tree, content)
+        bgp = file_tree._dir_nodes[content / "bgp"]
+
+        (content / "aaa").mkdir()
+        (content / "isis").mkdir()
+        for name in ("a.md", "c.md", "e.md"):
+            (content / name).write_text("")
+        (content / "d.md").unlink()
+        changed = [content / name for name in ("aaa", "isis", "a.md", "c.md", "e.md", "d.md")]
+        await refresh(pilot, file_tree, changed)
+
+        assert labels(node) == ["aaa/", "bgp/", "isis/", "ospf/", "a.md", "b.md", "c.md", "e.md"]
+        assert file_tree._dir_nodes[content / "bgp"] is bgp
+
+
+async def test_reconcile_keeps_expanded_subtrees(tui, project):
+    content = project / "content"
+    async with mounted_tree(tui) as (pilot, file_tree):
+        await expand(pilot, file_tree, content)
+        bgp = await expand(pilot, file_tree, content / "bgp")
+        leaf = bgp.children[0]
+
+        (content / "aaa").mkdir()
+        await refresh(pilot, file_tree, [content / "aaa"])
+
+        assert bgp.is_expanded
+        assert bgp.children[0] is leaf
+        assert labels(bgp) == ["route-reflectors.md"]
+
+
+async def test_reconcile_replaces_entry_that_changed_kind(tui, project):
+    content = project / "content"
+    async with mounted_tree(tui) as (pilot, file_tree):
+        node = await expand(pilot, file_tree, content)
+        await expand(pilot, file_tree, content / "ospf")
+
+        shutil.rmtree(content / "ospf")
+        (content / "ospf.md").mkdir()
+        (content / "b.md").unlink()
+        (content / "b.md").mkdir()
+        await refresh(pilot, file_tree, [content / "ospf", content / "ospf.md", content / "b.md"])
+
+        assert labels(node) == ["b.md/", "bgp/", "ospf.md/", "d.md"]
+        assert content / "ospf" not in file_tree._dir_nodes
+        assert content / "ospf" not in file_tree._loaded_dirs
+
+
+async def test_full_refresh_reconciles_every_listed_directory(tui, project):
+    content = project / "content"
+    async with mounted_tree(tui) as (pilot, file_tree):
+        node = await expand(pilot, file_tree, content)
+        bgp = await expand(pilot, file_tree, content / "bgp")
+
+        (content / "bgp" / "communities.md").write_text("")
+        (content / "c.md").write_text("")
+        await refresh(pilot, file_tree)
+
+        assert labels(node) == ["bgp/", "ospf/", "b.md", "c.md", "d.md"]
+        assert labels(bgp) == ["communities.md", "route-reflectors.md"]
+
+
+async def test_requests_in_one_tick_are_merged(tui, project, monkeypatch):
+    content = project / "content"
+    async with mounted_tree(tui) as (pilot, file_tree):
+        node = await expand(pilot, file_tree, content)
+        passes = []
+        flush = file_tree._flush_refresh
+        monkeypatch.setattr(file_tree, "_flush_refresh", lambda: (passes.append(1), flush()))
+
+        for name in ("a.md", "c.md"):
+            (content / name).write_text("")
+            file_tree.request_refresh([content / name])
+        await pilot.pause()
+
+        assert passes == [1]
+        assert labels(node) == ["bgp/", "ospf/", "a.md", "b.md", "c.md", "d.md"]
@@ -0,0 +1,67 @@
+"""Tests for GitInfo's HEAD-keyed commit metadata cache."""
+
+import shutil
+import subprocess
+
+import pytest
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="needs git")
+
+
+def git(repo, *args):
+    """Run git in repo with a fixed identity; returns stdout."""
+    return subprocess.run(["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+                          cwd=repo, check=True, capture_output=True, text=True).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Repository on branch main with one commit."""
+    git(tmp_path, "init", "-q", "-b", "main")
+    git(tmp_path, "commit", "-q", "--allow-empty", "-m", "first")
+    return tmp_path
+
+
+@pytest.fixture
+def git_runs(tui, monkeypatch):
+    """Commands GitInfo ran through run_command."""
+    commands = []
+    run = tui.run_command
+    monkeypatch.setattr(tui, "run_command", lambda cmd, cwd=None: (commands.append(cmd), run(cmd, cwd))[1])
+    return commands
+
+
+def test_placeholder_until_first_fetch(tui, repo):
+    info = tui.GitInfo(repo)
+    assert info.last_commit == tui.GitInfo.PLACEHOLDER
+    assert info.refresh()
+    assert (info.branch, info.head) == ("main", git(repo, "rev-parse", "HEAD"))
+    assert info.last_commit.endswith("ago")
+
+
+def test_git_runs_only_when_head_moves(tui, repo, git_runs):
+    info = tui.GitInfo(repo)
+    info.refresh()
+    assert not info.refresh()
+    assert len(git_runs) == 1
+
+    git(repo, "commit", "-q", "--allow-empty", "-m", "second")
+    assert info.refresh()
+    assert len(git_runs) == 2
+    assert info.head == git(repo, "rev-parse", "HEAD")
+
+
+def test_checkout_changes_branch(tui, repo):
+    info = tui.GitInfo(repo)
+    info.refresh()
+    git(repo, "checkout", "-q", "-b", "feature")
+
+    assert info.refresh()
+    assert info.branch == "feature"
+
+
+def test_outside_a_repository(tui, tmp_path, git_runs):
+    info = tui.GitInfo(tmp_path / "plain")
+    assert info.refresh()
+    assert info.last_commit == "N/A" and info.branch is None
+    assert git_runs == []
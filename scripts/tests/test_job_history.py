@@ -0,0 +1,123 @@
+"""Tests for JobHistory trends and slow-run warnings."""
+
+import json
+import time
+
+import pytest
+
+
+@pytest.fixture
+def history(tui, tmp_path):
+    """Empty JobHistory with a window of 5 runs."""
+    return tui.JobHistory(tmp_path / "job-history.jsonl", window=5)
+
+
+def run(series, wall, exit=0, state="done"):
+    return {"series": series, "wall": wall, "exit": exit, "state": state}
+
+
+def add_runs(history, series, walls):
+    for wall in walls:
+        history.append(run(series, wall))
+
+
+@pytest.mark.parametrize("fraction, expected", [(0.0, 1), (0.2, 1), (0.5, 3), (0.95, 5), (1.0, 5)])
+def test_percentile_is_nearest_rank(tui, fraction, expected):
+    assert tui.percentile([5, 3, 1, 4, 2], fraction) == expected
+
+
+def test_stats_use_only_successful_runs_in_window(history):
+    add_runs(history, "build", [100.0, 1.0, 2.0, 3.0, 4.0, 5.0])
+    history.append(run("build", 50.0, exit=1, state="failed"))
+    history.append(run("build", 60.0, exit=-15, state="cancelled"))
+
+    assert history.stats("build") == {"count": 5, "median": 3.0, "p95": 5.0}
+    assert history.stats("deploy") is None
+
+
+def test_regression_needs_a_baseline(tui, history):
+    add_runs(history, "build", [2.0] * (tui.JOB_BASELINE_MIN - 1))
+    assert history.regression("build", 100.0) is None
+
+    history.append(run("build", 2.0))
+    assert history.regression("build", 100.0)["median"] == 2.0
+
+
+def test_regression_margin(tui, history, monkeypatch):
+    monkeypatch.setattr(tui, "JOB_REGRESSION_MARGIN", 0.25)
+    add_runs(history, "build", [4.0] * 5)
+
+    assert history.regression("build", 5.0) is None
+    assert history.regression("build", 5.01) == {"count": 5, "median": 4.0, "p95": 4.0}
+    assert history.regression("deploy", 5.01) is None
+
+
+def test_records_survive_reload(tui, history, tmp_path):
+    add_runs(history, "build", [1.0, 2.0, 3.0])
+    history.append(run("build", 9.0, exit=1, state="failed"))
+    path = tmp_path / "job-history.jsonl"
+    lines = path.read_text().splitlines()
+    assert [json.loads(line)["wall"] for line in lines] == [1.0, 2.0, 3.0, 9.0]
+
+    # A line cut short by a crash is skipped
+    with open(path, "a") as f:
+        f.write('{"series": "build", "wall"')
+    reloaded = tui.JobHistory(path, window=5)
+    assert reloaded.stats("build") == {"count": 3, "median": 2.0, "p95": 3.0}
+
+
+def test_unwritable_file_still_tracks_runs(tui, tmp_path):
+    (tmp_path / "file").write_text("")
+    history = tui.JobHistory(tmp_path / "file" / "job-history.jsonl")
+    history.append(run("build", 1.0))
+    assert history.stats("build")["count"] == 1
+
+
+class FakeApp:
+    """Stands in for the App: records notifications."""
+
+    def __init__(self):
+        self.notices = []
+
+    def notify(self, message, **kwargs):
+        self.notices.append((message, kwargs.get("severity")))
+
+
+def finished_job(tui, series, wall, code=0):
+    """A Job that finished successfully after wall seconds; output is collected in job.output."""
+    output = []
+    task = tui.BackgroundTask(["true"], on_output=output.append)
+    task.returncode = code
+    job = tui.Job(series, "misc", series.title(), task, series=series)
+    job.state = "done" if code == 0 else "failed"
+    job.ended = time.monotonic()
+    job.started = job.ended - wall
+    job.output = output
+    return job
+
+
+def test_manager_warns_about_slow_run(tui, history, monkeypatch):
+    monkeypatch.setattr(tui, "JOB_REGRESSION_MARGIN", 0.25)
+    add_runs(history, "build", [2.0] * 5)
+    manager = tui.JobManager(FakeApp(), history=history)
+
+    slow = finished_job(tui, "build", 3.0)
+    manager.record(slow)
+    message = "Build took 3.0s, 50% slower than the median of the last 5 runs (2.0s)"
+    assert manager.app.notices == [(message, "warning")]
+    assert slow.output == [f"[yellow]⚠ {message}[/yellow]"]
+
+    # Recorded once, and the slow run joins the baseline
+    manager.record(slow)
+    assert history.stats("build") == {"count": 5, "median": 2.0, "p95": 3.0}
+    assert len(manager.app.notices) == 1
+
+
+def test_manager_does_not_warn_about_normal_or_failed_runs(tui, history):
+    add_runs(history, "build", [2.0] * 5)
+    manager = tui.JobManager(FakeApp(), history=history)
+
+    manager.record(finished_job(tui, "build", 2.1))
+    manager.record(finished_job(tui, "build", 30.0, code=1))
+    assert manager.app.notices == []
+    assert history.stats("build")["count"] == 5
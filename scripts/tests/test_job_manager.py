@@ -0,0 +1,210 @@
+"""Tests for JobManager scheduling and cancellation."""
+
+import asyncio
+import os
+import signal
+import time
+
+import pytest
+
+pytestmark = [
+    pytest.mark.skipif(not os.path.isdir("/proc"), reason="process groups are inspected via /proc"),
+    pytest.mark.asyncio,
+]
+
+
+class FakeApp:
+    """Stands in for the App: records notifications."""
+
+    def __init__(self):
+        self.notices = []
+
+    def notify(self, message, **kwargs):
+        self.notices.append(message)
+
+
+@pytest.fixture
+def manager(tui):
+    """Factory for a JobManager without a history store."""
+    def make(**kwargs):
+        return tui.JobManager(FakeApp(), history=None, **kwargs)
+    return make
+
+
+def job(tui, key, command, kind="misc", interactive=True):
+    """A Job running a command, collecting its output and exit code."""
+    output, codes = [], []
+    task = tui.BackgroundTask(command, on_output=output.append, on_complete=codes.append)
+    result = tui.Job(key, kind, key, task, interactive=interactive)
+    result.output, result.codes = output, codes
+    return result
+
+
+async def finished(*jobs, timeout: float = 10.0):
+    """
+    Wait until every job has finished.
+
+    Tests await all their jobs: closing the event loop while a job is
+    still spawning its process can leave it waiting forever.
+    """
+    deadline = time.monotonic() + timeout
+    while not all(job.finished for job in jobs):
+        assert time.monotonic() < deadline, [job.state for job in jobs]
+        await asyncio.sleep(0.02)
+
+
+def group_alive(pgid: int) -> bool:
+    """
+    True if a process of the group is still running.
+
+    Zombies do not count: orphans are only reaped if the init process
+    does so, which container inits often do not.
+    """
+    for pid in filter(str.isdigit, os.listdir("/proc")):
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        if int(fields[2]) == pgid and fields[0] != "Z":
+            return True
+    return False
+
+
+async def test_kind_limit_queues_until_a_slot_frees(tui, manager):
+    jobs = manager(limits={"hugo": 1}, max_running=4)
+    first = jobs.submit(job(tui, "build", ["sleep", "0.2"], kind="hugo"))
+    second = jobs.submit(job(tui, "build-prod", ["true"], kind="hugo"))
+    other = jobs.submit(job(tui, "notes", ["true"]))
+
+    assert (first.state, second.state, other.state) == ("running", "queued", "running")
+    assert second.output[0].startswith("[dim]Queued")
+    await finished(first, second, other)
+    assert second.started >= first.ended
+    assert [first.state, second.state, other.state] == ["done", "done", "done"]
+
+
+async def test_overall_limit_caps_running_jobs(tui, manager):
+    jobs = manager(limits={}, max_running=2)
+    submitted = [jobs.submit(job(tui, f"job-{n}", ["sleep", "0.1"], kind=f"kind-{n}")) for n in range(3)]
+
+    assert [j.state for j in submitted] == ["running", "running", "queued"]
+    await finished(*submitted)
+    assert [j.state for j in submitted] == ["done", "done", "done"]
+
+
+async def test_interactive_jobs_start_before_background_jobs(tui, manager):
+    jobs = manager(max_running=1)
+    running = jobs.submit(job(tui, "running", ["sleep", "0.1"]))
+    background = jobs.submit(job(tui, "background", ["true"], interactive=False))
+    interactive = jobs.submit(job(tui, "interactive", ["true"]))
+
+    await finished(running, background, interactive)
+    assert interactive.started < background.started
+
+
+async def test_duplicate_key_returns_existing_job(tui, manager):
+    jobs = manager()
+    first = jobs.submit(job(tui, "build", ["sleep", "0.1"]))
+    again = jobs.submit(job(tui, "build", ["sleep", "0.1"]))
+
+    assert again is first
+    assert jobs.app.notices == ["build is already running"]
+    await finished(first)
+    rerun = jobs.submit(job(tui, "build", ["true"]))
+    assert rerun is not first
+    await finished(rerun)
+
+
+async def test_failed_exit_code_marks_job_failed(tui, manager):
+    jobs = manager()
+    failing = jobs.submit(job(tui, "fail", ["sh", "-c", "exit 3"]))
+    await finished(failing)
+    assert failing.state == "failed" and failing.codes == [3]
+
+
+async def test_cancel_queued_job_never_starts_it(tui, manager):
+    jobs = manager(max_running=1)
+    running = jobs.submit(job(tui, "running", ["sleep", "0.1"]))
+    queued = jobs.submit(job(tui, "queued", ["true"]))
+
+    jobs.cancel(queued)
+    assert queued.state == "cancelled" and queued.started is None
+    assert queued.codes == [-signal.SIGTERM]
+    await finished(running)
+    assert queued.started is None
+
+
+async def test_cancel_running_job_stops_its_process_group(tui, manager):
+    jobs = manager()
+    running = jobs.submit(job(tui, "sleeper", ["sh", "-c", "sleep 30 & sleep 30; wait"]))
+    while running.task.pgid is None:
+        await asyncio.sleep(0.01)
+    pgid = running.task.pgid
+
+    jobs.cancel(running)
+    await finished(running, timeout=5)
+    assert running.state == "cancelled"
+    assert "[yellow]⏹ Cancelled[/yellow]" in running.output
+    await asyncio.sleep(0.1)
+    assert not group_alive(pgid)
+
+
+async def test_cancel_escalates_to_sigkill_after_grace(tui, manager, monkeypatch):
+    monkeypatch.setattr(tui, "JOB_KILL_GRACE", 0.3)
+
+    jobs = manager()
+    stubborn = jobs.submit(job(tui, "stubborn", ["sh", "-c", "trap '' TERM; sleep 30"]))
+    while stubborn.task.pgid is None:
+        await asyncio.sleep(0.01)
+    pgid = stubborn.task.pgid
+    await asyncio.sleep(0.1)  # let the shell install its trap
+
+    jobs.cancel(stubborn)
+    await asyncio.sleep(0.1)
+    assert group_alive(pgid)
+    await finished(stubborn, timeout=5)
+    assert stubborn.state == "cancelled"
+    assert not group_alive(pgid)
+
+
+async def test_thread_task_stops_when_cancelled(tui, manager):
+    steps = []
+
+    def work(emit, cancelled):
+        for step in range(200):
+            if cancelled():
+                return 0
+            steps.append(step)
+            emit([f"step {step}"])
+            time.sleep(0.01)
+        return 0
+
+    output = []
+    task = tui.ThreadTask(work, on_output=output.append)
+    jobs = manager()
+    running = jobs.submit(tui.Job("quality", "quality", "Quality gate", task))
+    await asyncio.sleep(0.1)
+
+    jobs.cancel(running)
+    delivered = len(output)
+    await finished(running, timeout=5)
+    assert running.state == "cancelled"
+    assert task.returncode == -signal.SIGTERM
+    assert len(steps) < 200
+    late = output[delivered:]
+    assert "[yellow]⏹ Cancelled[/yellow]" in late
+    assert not any(line.startswith("step") for line in late)
+
+
+async def test_cancel_all_stops_queued_and_running_jobs(tui, manager):
+    jobs = manager(max_running=1)
+    running = jobs.submit(job(tui, "running", ["sleep", "30"]))
+    queued = jobs.submit(job(tui, "queued", ["sleep", "30"]))
+    while running.task.pgid is None:
+        await asyncio.sleep(0.01)
+
+    jobs.cancel_all()
+    await finished(running, queued, timeout=5)
+    assert (running.state, queued.state) == ("cancelled", "cancelled")
+    assert queued.started is None
@@ -0,0 +1,165 @@
+"""Tests for LivePreview's incremental rendering."""
+
+import random
+from contextlib import asynccontextmanager
+
+import pytest
+from textual.app import App
+from textual.widgets import Markdown
+from textual.widgets.markdown import MarkdownBlock
+
+pytestmark = pytest.mark.asyncio
+
+DOCUMENT = """\
+## Overview
+
+Route reflectors relax the iBGP split horizon rule so that a single
+router can re-advertise routes learned from one internal peer.
+
+- Clients peer only with their reflector
+- The cluster list prevents loops
+  between redundant reflectors
+
+> Reflection changes which paths are visible, not how they are chosen.
+
+## Configuration
+
+```
+set protocols bgp group rr type internal
+set protocols bgp group rr cluster 10.0.0.1
+```
+
+| Role      | Sessions |
+|-----------|----------|
+| Reflector | n - 1    |
+| Client    | 1        |
+
+1. Pick the reflectors
+2. Move clients one at a time
+
+## Summary
+
+Reflectors keep the number of iBGP sessions linear.
+"""
+
+# Snippets inserted by the random edits (several change the block structure)
+EDITS = ["x", " ", "\n", "\n\n", "# ", "- ", "1. ", "**", "`", "> ", "|a|b|\n|-|-|\n", "---\n"]
+
+
+def shape(markdown):
+    """Widget tree of a Markdown document with the text of each block."""
+    result = []
+
+    def walk(widget, depth):
+        for child in widget.children:
+            entry = (depth, type(child).__name__, child.name)
+            if isinstance(child, MarkdownBlock):
+                content = child.render()
+                entry += (str(content), tuple(content.spans))
+                if depth == 0:
+                    entry += (child.source_range,)
+            result.append(entry)
+            walk(child, depth + 1)
+
+    walk(markdown, 0)
+    return result
+
+
+@asynccontextmanager
+async def previews(tui):
+    """Mount a LivePreview and a plain Markdown showing DOCUMENT; yields (pilot, preview, reference)."""
+
+    class PreviewApp(App):
+        def compose(self):
+            yield tui.LivePreview(DOCUMENT, id="preview")
+            yield Markdown(DOCUMENT, id="reference")
+
+    app = PreviewApp()
+    async with app.run_test(size=(100, 60)) as pilot:
+        await pilot.pause()
+        yield pilot, app.query_one("#preview"), app.query_one("#reference")
+
+
+async def settle(pilot, preview):
+    """Wait until scheduled preview updates have been applied."""
+    await pilot.pause()
+    while preview._flushing or preview._flush_timer is not None:
+        await pilot.pause(0.01)
+
+
+async def edit(pilot, preview, reference, text):
+    """Apply text through schedule() and render it in full for comparison."""
+    preview.schedule(text)
+    await settle(pilot, preview)
+    await reference.update(text)
+    await pilot.pause()
+
+
+async def test_incremental_updates_match_full_render(tui):
+    async with previews(tui) as (pilot, preview, reference):
+        rng = random.Random(7)
+        text = DOCUMENT
+        for _ in range(40):
+            lines = text.split("\n")
+            i = rng.randrange(len(lines))
+            action = rng.random()
+            if action < 0.6:
+                j = rng.randrange(len(lines[i]) + 1)
+                lines[i] = lines[i][:j] + rng.choice(EDITS) + lines[i][j:]
+            elif action < 0.8 and len(lines) > 5:
+                del lines[i]
+            else:
+                lines.insert(i, rng.choice(["", "new paragraph words", "## New heading", "* item"]))
+            text = "\n".join(lines)
+
+            await edit(pilot, preview, reference, text)
+            assert shape(preview) == shape(reference), text
+            assert preview.source == text
+
+        assert preview.block_updates > 0
+
+
+async def test_block_edit_rerenders_only_nearby_blocks(tui):
+    async with previews(tui) as (pilot, preview, reference):
+        before = list(preview.children)
+        text = DOCUMENT.replace("which paths", "which BGP paths")
+
+        await edit(pilot, preview, reference, text)
+        assert (preview.block_updates, preview.full_updates) == (1, 0)
+        # The quote (block 3) and one neighbour on each side are replaced
+        after = list(preview.children)
+        assert after[:2] == before[:2] and after[5:] == before[5:]
+        assert not set(after[2:5]) & set(before)
+        assert shape(preview) == shape(reference)
+
+
+async def test_code_fence_edit_falls_back_to_full_update(tui):
+    async with previews(tui) as (pilot, preview, reference):
+        text = DOCUMENT.replace("```\nset", "```text\nset", 1)
+
+        await edit(pilot, preview, reference, text)
+        assert (preview.block_updates, preview.full_updates) == (0, 1)
+        assert shape(preview) == shape(reference)
+
+
+async def test_keystrokes_within_a_frame_are_coalesced(tui):
+    async with previews(tui) as (pilot, preview, reference):
+        text = DOCUMENT
+        for letter in "coalesced":
+            text = text.replace("linear.", f"linear{letter}.", 1)
+            preview.schedule(text)
+        await settle(pilot, preview)
+        await reference.update(text)
+        await pilot.pause()
+
+        assert preview.block_updates + preview.full_updates == 1
+        assert shape(preview) == shape(reference)
+
+
+async def test_missing_markdown_internals_disable_block_updates(tui, monkeypatch):
+    monkeypatch.setattr(tui, "PREVIEW_BLOCK_UPDATES", False)
+    async with previews(tui) as (pilot, preview, reference):
+        assert not preview.incremental
+        await edit(pilot, preview, reference, DOCUMENT.replace("which paths", "which BGP paths"))
+        assert (preview.block_updates, preview.full_updates) == (0, 1)
+        assert shape(preview) == shape(reference)
@@ -0,0 +1,94 @@
+"""Tests for LogHistory's ring buffer and rotating spill files."""
+
+import pytest
+
+
+@pytest.fixture
+def history(tui, tmp_path):
+    """History with a 10-line ring and small spill files (about 10 lines each)."""
+    history = tui.LogHistory(tmp_path / "logs" / "tui-test.log", ring_size=10, max_bytes=100, backups=2)
+    yield history
+    history.close()
+
+
+def fill(history, count, start=0):
+    for n in range(start, start + count):
+        history.append(f"line {n:03d}")
+
+
+def numbers(lines):
+    return [int(line.split()[1]) for line in lines]
+
+
+def test_ring_only_until_it_overflows(history):
+    fill(history, 10)
+    assert (len(history), history.spilled) == (10, 0)
+    assert not history.path.exists()
+    assert numbers(history.page(0, 10)) == list(range(10))
+
+
+def test_pages_span_spill_files_and_ring(history):
+    fill(history, 25)
+    assert (len(history), history.spilled) == (25, 15)
+    assert numbers(history.page(0, 25)) == list(range(25))
+    assert numbers(history.page(8, 6)) == list(range(8, 14))
+    assert numbers(history.page(20, 100)) == list(range(20, 25))
+    assert history.page(30, 5) == []
+
+
+def test_oldest_spill_file_is_dropped(history, tmp_path):
+    fill(history, 200)
+    files = sorted(path.name for path in (tmp_path / "logs").iterdir())
+    assert files == ["tui-test.log", "tui-test.log.1", "tui-test.log.2"]
+
+    lines = numbers(history.page(0, len(history)))
+    assert lines == list(range(200 - len(history), 200))
+    assert 10 < history.spilled <= 3 * 10
+
+
+def test_find_searches_ring_and_spill_files(history):
+    fill(history, 40)
+    history.append("Error: build failed")
+    fill(history, 20, start=41)
+
+    found = history.find("ERROR")
+    assert history.page(found, 1) == ["Error: build failed"]
+    assert history.find("error", before=found) is None
+    assert numbers(history.page(history.find("line 035"), 1)) == [35]
+    assert history.find("line 060") == len(history) - 1
+    assert history.find("missing") is None
+
+
+def test_unicode_and_markup_round_trip(history):
+    lines = ["[red]✗[/red] échec", 'quote " and \\ backslash', ""]
+    for line in lines:
+        history.append(line)
+    fill(history, 20)
+    assert history.page(0, 3) == lines
+
+
+@pytest.mark.parametrize("fail_on", [1, 2])
+def test_failed_rotation_falls_back_to_the_ring(tui, history, tmp_path, monkeypatch, fail_on):
+    fill(history, 25)  # two spill files
+    calls = []
+    replace = tui.os.replace
+
+    def flaky_replace(source, target):
+        calls.append(source)
+        if len(calls) == fail_on:
+            raise OSError("injected")
+        replace(source, target)
+
+    monkeypatch.setattr(tui.os, "replace", flaky_replace)
+    fill(history, 30, start=25)
+
+    assert len(calls) == fail_on
+    assert (len(history), history.spilled) == (10, 0)
+    assert numbers(history.page(0, 100)) == list(range(45, 55))
+    assert history.find("line 020") is None
+    assert history.find("line 054") == 9
+
+    sizes = {path.name: path.stat().st_size for path in (tmp_path / "logs").iterdir()}
+    fill(history, 30, start=55)
+    assert {path.name: path.stat().st_size for path in (tmp_path / "logs").iterdir()} == sizes
+    assert numbers(history.page(0, 100)) == list(range(75, 85))
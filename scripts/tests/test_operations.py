@@ -0,0 +1,122 @@
+"""Tests for Operation, OperationManager and the filesystem operations."""
+
+import threading
+import time
+
+import pytest
+
+
+class FakeApp:
+    """Stands in for the App: plain threads for workers, direct UI calls."""
+
+    def __init__(self):
+        self.threads = []
+
+    def run_worker(self, work, thread=False, group=None):
+        worker = threading.Thread(target=work, daemon=True)
+        self.threads.append(worker)
+        worker.start()
+
+    def call_from_thread(self, callback, *args):
+        return callback(*args)
+
+
+def wait_for(condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Directory with nested files, plus a symlink to a directory outside it."""
+    root = tmp_path / "bgp"
+    for rel in ("a/index.md", "a/featured.png", "b/index.md", "b/c/index.md"):
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_text("x")
+    (tmp_path / "outside").mkdir()
+    (tmp_path / "outside" / "keep.md").write_text("x")
+    (root / "link").symlink_to(tmp_path / "outside")
+    return root
+
+
+def test_delete_path_removes_tree_without_following_symlinks(tui, tree):
+    op = tui.Operation("Delete bgp", [tree], None)
+    assert tui.delete_path(op, tree) == 9
+    assert (op.done, op.total) == (9, 9)
+    assert not tree.exists()
+    assert (tree.parent / "outside" / "keep.md").exists()
+
+
+def test_cancelled_delete_stops_between_entries(tui, tree, monkeypatch):
+    op = tui.Operation("Delete bgp", [tree], None)
+    report = op.report
+    monkeypatch.setattr(op, "report", lambda done, total=None: (report(done, total), done >= 2 and op.cancel()))
+
+    with pytest.raises(tui.OperationCancelled):
+        tui.delete_path(op, tree)
+    assert op.done == 2
+    assert tree.exists()
+
+
+def test_rename_path_refuses_to_overwrite(tui, tree):
+    op = tui.Operation("Rename", [tree], None)
+    with pytest.raises(FileExistsError):
+        tui.rename_path(op, tree / "a", tree / "b")
+    assert tui.rename_path(op, tree / "a", tree / "d") == tree / "d"
+    assert (tree / "d" / "index.md").exists()
+
+
+def test_overlapping_operations_run_in_submission_order(tui, tmp_path):
+    manager = tui.OperationManager(FakeApp())
+    release = threading.Event()
+    events = []
+
+    def step(name, block=False):
+        def func(op):
+            events.append(f"{name} start")
+            if block:
+                release.wait(5)
+            events.append(f"{name} end")
+            return name
+        return func
+
+    category = manager.submit(tui.Operation("category", [tmp_path / "bgp"], step("category", block=True)))
+    wait_for(lambda: category.state == "running")
+    post = manager.submit(tui.Operation("post", [tmp_path / "bgp" / "rr"], step("post")))
+    other = manager.submit(tui.Operation("other", [tmp_path / "ospf"], step("other")))
+
+    wait_for(lambda: other.finished)
+    assert post.state == "queued"
+    assert "waiting for another operation" in post.progress_text
+    release.set()
+    wait_for(lambda: post.finished)
+
+    assert events.index("category end") < events.index("post start")
+    assert (category.result, post.result, other.result) == ("category", "post", "other")
+    assert manager.active == []
+
+
+def test_cancelling_a_waiting_operation_skips_it(tui, tmp_path):
+    manager = tui.OperationManager(FakeApp())
+    release = threading.Event()
+    ran, done = [], []
+
+    first = manager.submit(tui.Operation("first", [tmp_path], lambda op: release.wait(5)))
+    wait_for(lambda: first.state == "running")
+    second = manager.submit(tui.Operation("second", [tmp_path / "x"], ran.append, on_done=done.append))
+
+    second.cancel()
+    wait_for(lambda: second.finished)
+    assert second.state == "cancelled" and ran == [] and done == [second]
+    release.set()
+    wait_for(lambda: first.finished)
+
+
+def test_failed_operation_records_its_error(tui, tmp_path):
+    manager = tui.OperationManager(FakeApp())
+    op = manager.submit(tui.Operation("rename", [tmp_path],
+                                      lambda op: tui.rename_path(op, tmp_path / "missing", tmp_path / "new")))
+    wait_for(lambda: op.finished)
+    assert op.state == "failed" and isinstance(op.error, FileNotFoundError)
@@ -0,0 +1,117 @@
+"""Tests for OutputSink batching, frame budget and trimming."""
+
+import pytest
+
+
+class FakeTimer:
+    def __init__(self, callback):
+        self.callback = callback
+        self.stopped = False
+
+    def stop(self):
+        self.stopped = True
+
+    def fire(self):
+        if not self.stopped:
+            self.callback()
+
+
+class FakeLog:
+    """Stands in for a RichLog: records writes and timers."""
+
+    def __init__(self, max_lines=None, markup=True, history=False):
+        self.max_lines = max_lines
+        self.markup = markup
+        self.writes = []
+        self.timers = []
+        if history:
+            self.recorded = []
+            self.record = self.recorded.append
+
+    def set_timer(self, delay, callback):
+        timer = FakeTimer(callback)
+        self.timers.append(timer)
+        return timer
+
+    def write(self, content):
+        self.writes.append(content)
+
+    def fire(self):
+        """Fire the latest timer, as the event loop would."""
+        self.timers[-1].fire()
+
+    @property
+    def lines(self):
+        return [line for content in self.writes for line in content.plain.split("\n")]
+
+
+def test_writes_are_buffered_until_the_frame(tui):
+    log = FakeLog()
+    sink = tui.OutputSink(log, budget=10.0)
+    for n in range(200):
+        sink.write(f"line {n}")
+
+    assert log.writes == [] and len(log.timers) == 1
+    log.fire()
+    assert len(log.writes) == -(-200 // tui.OutputSink.BATCH_SIZE)
+    assert log.lines == [f"line {n}" for n in range(200)]
+
+
+def test_each_write_keeps_its_own_markup(tui):
+    log = FakeLog()
+    sink = tui.OutputSink(log)
+    sink.write("[bold]unclosed")
+    sink.write("[/bold] stray close")
+    sink.write("[red]red[/red] plain")
+    sink.flush()
+
+    [content] = log.writes
+    assert content.plain == "unclosed\n[/bold] stray close\nred plain"
+    styled = {content.plain[span.start:span.end]: str(span.style) for span in content.spans}
+    assert styled == {"unclosed": "bold", "red": "red"}
+
+
+def test_markup_disabled_writes_text_literally(tui):
+    log = FakeLog(markup=False)
+    sink = tui.OutputSink(log)
+    sink.write("[red]literal[/red]")
+    sink.flush()
+    assert log.lines == ["[red]literal[/red]"]
+
+
+def test_backlog_beyond_the_budget_carries_over(tui):
+    log = FakeLog()
+    sink = tui.OutputSink(log, budget=0)
+    for n in range(3 * tui.OutputSink.BATCH_SIZE):
+        sink.write(f"line {n}")
+
+    log.fire()
+    assert len(log.writes) == 1 and len(log.timers) == 2
+    log.fire()
+    log.fire()
+    assert len(log.writes) == 3 and len(log.timers) == 3
+    assert log.lines == [f"line {n}" for n in range(3 * tui.OutputSink.BATCH_SIZE)]
+
+
+def test_flush_writes_everything_and_cancels_the_timer(tui):
+    log = FakeLog()
+    sink = tui.OutputSink(log, budget=0)
+    for n in range(3 * tui.OutputSink.BATCH_SIZE):
+        sink.write(f"line {n}")
+
+    sink.flush()
+    assert len(log.lines) == 3 * tui.OutputSink.BATCH_SIZE
+    assert log.timers[0].stopped and len(log.timers) == 1
+
+
+@pytest.mark.parametrize("history", [False, True])
+def test_text_the_log_would_trim_is_not_rendered(tui, history):
+    log = FakeLog(max_lines=10, history=history)
+    sink = tui.OutputSink(log)
+    for n in range(25):
+        sink.write(f"line {n}")
+
+    sink.flush()
+    assert log.lines == [f"line {n}" for n in range(15, 25)]
+    if history:
+        assert log.recorded == [f"line {n}" for n in range(15)]
@@ -0,0 +1,228 @@
+"""Tests for PostIndex sweeps, its cache files and queries."""
+
+import json
+import shutil
+
+import pytest
+
+
+@pytest.fixture
+def content(tmp_path, write_post):
+    """Content root with posts in two sections."""
+    root = tmp_path / "content"
+    write_post(root, "routing/bgp/route-reflectors", "Route Reflectors", "2025-03-01T00:00:00Z",
+               tags=("BGP", "Routing"))
+    write_post(root, "routing/bgp/communities", "communities", "2024-06-01T00:00:00Z", tags=("BGP",))
+    write_post(root, "routing/ospf/stub-areas", "OSPF Stub Areas", "2025-05-01T00:00:00Z",
+               draft=True, tags=("OSPF", "Routing"))
+    write_post(root, "linux/nix/flakes", "Flakes", "", tags=("Nix",))
+    write_post(root, "linux/kernel/ebpf", "eBPF", "2025-02-01T12:00:00+02:00")
+    return root
+
+
+@pytest.fixture
+def index(tui, content, tmp_path):
+    """Swept index over the content fixture, caching to tmp_path/.cache."""
+    index = tui.PostIndex(content, ["routing", "linux"], tmp_path / ".cache")
+    index.refresh(force=True)
+    return index
+
+
+def titles(records):
+    return [record.title for record in records]
+
+
+def test_sweep_indexes_every_bundle(index):
+    assert len(index) == 5
+    assert set(titles(index.query(refresh=False))) == {
+        "Route Reflectors", "communities", "OSPF Stub Areas", "Flakes", "eBPF"}
+
+
+def test_unchanged_posts_are_not_reparsed(tui, index, content, monkeypatch):
+    parsed = []
+    parse = tui.parse_post_metadata
+    monkeypatch.setattr(tui, "parse_post_metadata", lambda path, st: (parsed.append(path), parse(path, st))[1])
+    post = content / "linux" / "kernel" / "ebpf" / "index.md"
+    post.write_text(post.read_text() + "\nMore text.\n")
+
+    assert index.refresh(force=True)
+    assert parsed == [str(post)]
+    assert not index.refresh(force=True)
+    assert parsed == [str(post)]
+
+
+def test_refresh_tracks_edits_and_deletions(index, content):
+    post = content / "routing" / "bgp" / "communities" / "index.md"
+    post.write_text(post.read_text().replace('"communities"', '"BGP Communities"'))
+    shutil.rmtree(content / "linux" / "nix")
+
+    assert index.refresh(force=True)
+    assert "BGP Communities" in titles(index.query(category="bgp"))
+    assert index.query(tag="Nix") == []
+    assert "nix" not in index.categories()
+
+
+def test_cold_start_reads_snapshot_from_cache(tui, index, content, tmp_path):
+    shutil.rmtree(content)
+
+    cold = tui.PostIndex(content, ["routing", "linux"], tmp_path / ".cache")
+    assert titles(cold.query(refresh=False)) == titles(index.query(refresh=False))
+
+    cold.refresh(force=True)
+    assert len(cold) == 0
+
+
+def test_cold_start_rereads_only_changed_posts(tui, index, content, tmp_path, monkeypatch):
+    parsed = []
+    parse = tui.parse_post_metadata
+    monkeypatch.setattr(tui, "parse_post_metadata", lambda path, st: (parsed.append(path), parse(path, st))[1])
+    post = content / "routing" / "ospf" / "stub-areas" / "index.md"
+    post.write_text(post.read_text().replace("Stub Areas", "Totally Stubby Areas"))
+
+    cold = tui.PostIndex(content, ["routing", "linux"], tmp_path / ".cache")
+    cold.refresh(force=True)
+    assert parsed == [str(post)]
+    assert "OSPF Totally Stubby Areas" in titles(cold.query(refresh=False))
+
+
+def test_outdated_cache_is_ignored(tui, index, content, tmp_path):
+    for cache_file in (tmp_path / ".cache").iterdir():
+        data = json.loads(cache_file.read_text())
+        data["version"] = tui.PostIndex.CACHE_VERSION - 1
+        cache_file.write_text(json.dumps(data))
+
+    cold = tui.PostIndex(content, ["routing", "linux"], tmp_path / ".cache")
+    assert cold.query(refresh=False) == []
+    cold.refresh(force=True)
+    assert len(cold) == 5
+
+
+def test_apply_changes_indexes_new_bundle(index, content, write_post):
+    post = write_post(content, "linux/kernel/io-uring", "io_uring", "2025-06-01T00:00:00Z")
+    assert index.apply_changes([post.parent])
+    assert titles(index.query(category="kernel", refresh=False)) == ["eBPF", "io_uring"]
+
+
+def test_apply_changes_drops_removed_bundle(index, content):
+    bundle = content / "routing" / "bgp" / "communities"
+    shutil.rmtree(bundle)
+    assert index.apply_changes([bundle])
+    assert titles(index.query(category="bgp", refresh=False)) == ["Route Reflectors"]
+
+
+def test_apply_changes_ignores_paths_outside_sections(index, content, write_post):
+    post = write_post(content, "drafts/scratch", "Scratch")
+    assert not index.apply_changes([post, post.parent])
+    assert len(index) == 5
+
+
+def test_synthetic_corpus_fits_record_budget(tui, tmp_path):
+    root = tmp_path / "corpus"
+    tags = ["BGP", "OSPF", "IS-IS", "MPLS", "EVPN", "Junos", "Linux", "Automation"]
+    for n in range(3000):
+        bundle = root / f"section-{n % 4}" / f"category-{n % 40}" / f"post-{n:04d}-configuring-feature"
+        bundle.mkdir(parents=True)
+        (bundle / "index.md").write_text(
+            f'+++\ntitle = "Configuring feature {n} on the lab routers"\n'
+            f'date = "2025-{n % 12 + 1:02d}-{n % 28 + 1:02d}T10:00:00Z"\ndraft = {str(n % 10 == 0).lower()}\n'
+            f'summary = "Step-by-step notes for feature {n}, with verification commands and gotchas."\n'
+            f'tags = ["{tags[n % 8]}", "{tags[(n + 3) % 8]}"]\n+++\n\n## Overview\n\nText.\n')
+
+    index = tui.PostIndex(root, [f"section-{n}" for n in range(4)])
+    index.refresh(force=True)
+    index.query(sort="title")
+    assert len(index) == 3000
+    assert 0 < index.bytes_per_post() <= tui.POST_RECORD_BUDGET
+
+
+def test_query_sorts_by_date_with_undated_posts_oldest(index):
+    assert titles(index.query()) == ["Flakes", "communities", "eBPF", "Route Reflectors", "OSPF Stub Areas"]
+    assert titles(index.query(reverse=True))[0] == "OSPF Stub Areas"
+
+
+def test_query_sorts_by_title_case_insensitively(index):
+    assert titles(index.query(sort="title")) == [
+        "communities", "eBPF", "Flakes", "OSPF Stub Areas", "Route Reflectors"]
+
+
+def test_query_rejects_unknown_sort(index):
+    with pytest.raises(ValueError):
+        index.query(sort="size")
+
+
+def test_query_filters_combine(index):
+    assert titles(index.query(category="bgp")) == ["communities", "Route Reflectors"]
+    assert titles(index.query(tag="Routing")) == ["Route Reflectors", "OSPF Stub Areas"]
+    assert titles(index.query(tag="Routing", draft=False)) == ["Route Reflectors"]
+    assert titles(index.query(draft=True)) == ["OSPF Stub Areas"]
+    assert titles(index.query(category="bgp", tag="Nix")) == []
+
+
+def test_query_date_range_is_half_open(index):
+    assert titles(index.query(since="2025-01-01", until="2025-03-01")) == ["eBPF"]
+    assert titles(index.query(since="2025-01-01", until="2025-03-02", sort="title")) == [
+        "eBPF", "Route Reflectors"]
+
+
+def test_query_subtree_and_depth(index, content):
+    assert titles(index.query(under=content / "routing")) == [
+        "communities", "Route Reflectors", "OSPF Stub Areas"]
+    assert titles(index.query(under=content / "routing" / "bgp", depth=2)) == [
+        "communities", "Route Reflectors"]
+    assert index.query(under=content / "routing", depth=2) == []
+
+
+def test_categories_and_tag_counts(index):
+    assert index.categories() == ["bgp", "kernel", "nix", "ospf"]
+    assert index.tags() == {"BGP": 2, "Nix": 1, "OSPF": 1, "Routing": 2}
+
+
+def test_secondary_indexes_follow_edits(index, content):
+    post = content / "routing" / "bgp" / "communities" / "index.md"
+    post.write_text(post.read_text().replace('tags = ["BGP"]', 'tags = ["Nix"]').replace("2024-06-01", "2025-07-01"))
+
+    index.refresh(force=True)
+    assert index.tags() == {"BGP": 1, "Nix": 2, "OSPF": 1, "Routing": 2}
+    assert titles(index.query(tag="Nix")) == ["Flakes", "communities"]
+    assert titles(index.query(reverse=True))[0] == "communities"
+
+
+def test_each_section_has_its_own_cache_file(index, tmp_path):
+    cache = tmp_path / ".cache"
+    assert sorted(path.name for path in cache.iterdir()) == [
+        "post-index-linux.json", "post-index-routing.json"]
+    data = json.loads((cache / "post-index-linux.json").read_text())
+    assert data["section"] == "linux"
+    assert sorted(row[1] for row in data["entries"]) == ["Flakes", "eBPF"]
+
+
+def test_only_changed_section_is_saved(tui, index, content, tmp_path):
+    linux_cache = tmp_path / ".cache" / "post-index-linux.json"
+    before = linux_cache.read_bytes()
+    post = content / "routing" / "bgp" / "route-reflectors" / "index.md"
+    post.write_text(post.read_text().replace("Route Reflectors", "BGP Route Reflectors"))
+
+    index.refresh(force=True)
+    assert linux_cache.read_bytes() == before
+
+    cold = tui.PostIndex(content, ["routing", "linux"], tmp_path / ".cache")
+    assert "BGP Route Reflectors" in titles(cold.query(refresh=False))
+
+
+def test_outdated_section_cache_is_ignored_alone(tui, index, content, tmp_path):
+    cache_file = tmp_path / ".cache" / "post-index-routing.json"
+    data = json.loads(cache_file.read_text())
+    data["version"] = tui.PostIndex.CACHE_VERSION - 1
+    cache_file.write_text(json.dumps(data))
+
+    cold = tui.PostIndex(content, ["routing", "linux"], tmp_path / ".cache")
+    assert titles(cold.query(refresh=False)) == ["Flakes", "eBPF"]
+    cold.refresh(force=True)
+    assert len(cold) == 5
+
+
+def test_visible_section_is_swept_first(tui, content, tmp_path):
+    index = tui.PostIndex(content, ["routing", "linux"], tmp_path / ".cache")
+    progress = []
+    index.refresh(force=True, first="linux", on_progress=progress.append)
+    assert progress[0] == 2
@@ -0,0 +1,139 @@
+"""Tests for PreviewServer URLs and its supervised restarts."""
+
+import asyncio
+import os
+import socket
+import sys
+import time
+
+import pytest
+
+
+class FakeApp:
+    """Stands in for the App: a JobManager and recorded notifications."""
+
+    def __init__(self, tui):
+        self.notices = []
+        self.jobs = tui.JobManager(self, history=None)
+        self.log = self
+
+    def notify(self, message, **kwargs):
+        self.notices.append(message)
+
+    def error(self, message):
+        self.notices.append(message)
+
+
+@pytest.fixture
+def project(tmp_path, write_post):
+    """Hugo project root (not PROJECT_ROOT) with a few content files."""
+    content = tmp_path / "content"
+    write_post(content, "routing/bgp/route-reflectors", "Route Reflectors")
+    (content / "routing" / "_index.md").write_text('+++\ntitle = "Routing"\n+++\n')
+    (content / "routing" / "Lab Notes.md").write_text('+++\ntitle = "Lab notes"\n+++\n')
+    (content / "routing" / "moved.md").write_text('+++\ntitle = "Moved"\nslug = "new-name"\n+++\n')
+    (content / "about.md").write_text('+++\ntitle = "About"\nurl = "/about-me/"\n+++\n')
+    return tmp_path
+
+
+@pytest.mark.parametrize("path, expected", [
+    ("content/routing/bgp/route-reflectors/index.md", "/routing/bgp/route-reflectors/"),
+    ("content/routing/_index.md", "/routing/"),
+    ("content/routing/Lab Notes.md", "/routing/lab-notes/"),
+    ("content/routing/moved.md", "/routing/new-name/"),
+    ("content/about.md", "/about-me/"),
+    ("static/logo.png", "/"),
+])
+def test_url_for_project_root(tui, project, path, expected):
+    server = tui.PreviewServer(app=None, root=project)
+    assert server.url_for(path) == "http://localhost:1313" + expected
+    assert server.url_for(project / path) == "http://localhost:1313" + expected
+
+
+def test_url_for_ignores_other_content_roots(tui, project):
+    server = tui.PreviewServer(app=None, root=project)
+    assert server.url_for(tui.CONTENT_ROOT / "routing" / "post.md") == "http://localhost:1313/"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def fake_hugo(tui, project, tmp_path, monkeypatch):
+    """A `hugo` on PATH serving the project over HTTP; returns the file logging its starts."""
+    if not os.path.isdir("/proc"):
+        pytest.skip("process groups are inspected via /proc")
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    starts = tmp_path / "starts"
+    hugo = bin_dir / "hugo"
+    # hugo server -D --bind ADDRESS --port PORT [--minify]
+    hugo.write_text(f'#!/bin/sh\necho "$@" >> {starts}\n'
+                    'echo "Web Server is available at //localhost:$6/ (bind address $4)"\n'
+                    f'exec {sys.executable} -m http.server --bind "$4" "$6"\n')
+    hugo.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    (project / ".env").write_text(f"BUILD_PREVIEW_PORT={free_port()}\nBUILD_MINIFY=false\n")
+    monkeypatch.setattr(tui, "PREVIEW_PROBE_INTERVAL", 0.05)
+    return starts
+
+
+async def wait_for(condition, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        await asyncio.sleep(0.02)
+
+
+async def stopped(server):
+    """Stop the server and wait for its job to end."""
+    job = server.job
+    server.stop()
+    await wait_for(lambda: job.finished)
+    await wait_for(lambda: server.state == "stopped")
+
+
+@pytest.mark.asyncio
+async def test_restart_starts_a_new_server(tui, project, fake_hugo):
+    states = []
+    server = tui.PreviewServer(FakeApp(tui), root=project)
+    first = server.start(on_state=states.append)
+    await wait_for(lambda: server.state == "ready")
+
+    server.request_restart("Theme changed (test)")
+    server.request_restart("Theme changed (again)")  # coalesced
+    await wait_for(lambda: server.job is not first and server.state == "ready")
+
+    assert first.state == "cancelled"
+    assert states == ["starting", "ready", "restarting", "starting", "ready"]
+    assert len(fake_hugo.read_text().splitlines()) == 2
+    await stopped(server)
+
+
+@pytest.mark.asyncio
+async def test_config_change_restarts_server(tui, project, fake_hugo):
+    server = tui.PreviewServer(FakeApp(tui), root=project)
+    first = server.start()
+    await wait_for(lambda: server.state == "ready")
+
+    (project / "hugo.toml").write_text('title = "Lab"\n')
+    await wait_for(lambda: server.job is not first and server.state == "ready")
+    assert len(fake_hugo.read_text().splitlines()) == 2
+    await stopped(server)
+
+
+@pytest.mark.asyncio
+async def test_pending_page_opens_once_ready(tui, project, fake_hugo, monkeypatch):
+    opened = []
+    monkeypatch.setattr(tui, "open_in_browser", lambda url: opened.append(url) or True)
+    server = tui.PreviewServer(FakeApp(tui), root=project)
+    server.start()
+    server.open(project / "content" / "routing" / "_index.md")
+    assert opened == []
+
+    await wait_for(lambda: opened)
+    assert opened == [f"{server.base_url}/routing/"]
+    await stopped(server)
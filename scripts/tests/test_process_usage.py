@@ -0,0 +1,150 @@
+"""Tests for ProcessUsage sampling of a process group from /proc."""
+
+import asyncio
+import os
+import subprocess
+import time
+
+import pytest
+
+pytestmark = pytest.mark.skipif(not os.path.isdir("/proc/self"), reason="needs /proc")
+
+BUSY = "while :; do :; done"
+
+
+@pytest.fixture
+def group():
+    """Start a command in a new process group; returns its pgid."""
+    processes = []
+
+    def start(script):
+        process = subprocess.Popen(["sh", "-c", script], start_new_session=True)
+        processes.append(process)
+        return process.pid
+
+    yield start
+    for process in processes:
+        try:
+            os.killpg(process.pid, 9)
+        except OSError:
+            pass
+        process.wait()
+
+
+def test_busy_group_is_cpu_bound(tui, group):
+    usage = tui.ProcessUsage()
+    pgid = group(BUSY)
+    usage.sample(pgid)
+    time.sleep(0.5)
+    usage.sample(pgid)
+
+    assert usage.samples == 2
+    assert usage.cpu_rate > 0.5 and usage.cpu > 0.2
+    assert usage.rss > 0 and usage.peak_rss >= usage.rss
+    usage.finish()
+    assert (usage.rss, usage.cpu_rate) == (0, 0.0)
+    assert usage.bound == "CPU-bound"
+    assert usage.summary()["bound"] == "CPU-bound"
+
+
+def test_idle_group_is_waiting(tui, group):
+    usage = tui.ProcessUsage()
+    pgid = group("sleep 5")
+    usage.sample(pgid)
+    time.sleep(0.3)
+    usage.sample(pgid)
+    usage.finish()
+
+    assert usage.cpu < 0.05 and usage.peak_rss > 0
+    assert usage.bound == "waiting"
+    assert usage.summary_text().endswith("· waiting")
+
+
+def test_reaped_child_is_counted_once(tui, group):
+    usage = tui.ProcessUsage()
+    # A child burns CPU for about 0.6s and is reaped by the shell, which then idles
+    pgid = group(f"({BUSY}) & sleep 0.6; kill $!; wait; sleep 5")
+    time.sleep(0.3)
+    usage.sample(pgid)
+    while_running = usage.cpu
+    time.sleep(0.8)
+    usage.sample(pgid)
+
+    assert while_running > 0.1
+    assert while_running <= usage.cpu < 0.6 * 1.5
+
+
+def test_values_keep_their_peak_after_exit(tui, group):
+    usage = tui.ProcessUsage()
+    pgid = group(f"({BUSY}) & sleep 0.4; kill $!")
+    time.sleep(0.2)
+    usage.sample(pgid)
+    peak, cpu = usage.peak_rss, usage.cpu
+    time.sleep(0.5)
+    usage.sample(pgid)
+
+    assert usage.rss == 0
+    assert usage.peak_rss == peak and usage.cpu >= cpu > 0
+
+
+@pytest.mark.asyncio
+async def test_watch_samples_until_finished(tui, group):
+    usage = tui.ProcessUsage()
+    pgid = group("sleep 5")
+    watcher = asyncio.ensure_future(usage.watch(pgid, interval=0.05))
+    await asyncio.sleep(0.3)
+    usage.finish()
+    await asyncio.wait_for(watcher, 2)
+
+    assert usage.samples >= 2
+    samples = usage.samples
+    await asyncio.sleep(0.1)
+    assert usage.samples == samples
+
+
+def finished_usage(tui, wall, cpu=0.0, read=0, write=0, peak_rss=0):
+    """A finished ProcessUsage with the given totals."""
+    usage = tui.ProcessUsage()
+    usage.finish()
+    usage.ended = usage.started + wall
+    usage.cpu, usage.read_bytes, usage.write_bytes, usage.peak_rss = cpu, read, write, peak_rss
+    return usage
+
+
+def test_bound_verdicts(tui):
+    assert finished_usage(tui, 10.0, cpu=10.0 * tui.JOB_CPU_BOUND).bound == "CPU-bound"
+    assert finished_usage(tui, 10.0, cpu=1.0, read=6 * 2**20, write=4 * 2**20).bound == "I/O-bound"
+    assert finished_usage(tui, 10.0, cpu=1.0, write=9 * 2**20).bound == "waiting"
+    # Short jobs need at least 1 MiB to count as I/O-bound
+    assert finished_usage(tui, 0.1, write=2**20).bound == "I/O-bound"
+    assert finished_usage(tui, 0.1, write=2**19).bound == "waiting"
+
+
+def test_summary_of_finished_job(tui):
+    usage = finished_usage(tui, 4.0, cpu=1.0, read=2048, write=4096, peak_rss=3 * 2**20)
+    assert usage.summary() == {"wall": 4.0, "cpu": 1.0, "peak_rss": 3 * 2**20,
+                               "read_bytes": 2048, "write_bytes": 4096, "bound": "waiting"}
+    text = usage.summary_text()
+    assert text.startswith("4.0s wall · CPU 1.0s (25%) · peak RSS ")
+    assert text.endswith("· waiting")
+    # Without a single sample there is no memory or I/O to report
+    assert finished_usage(tui, 2.0).summary_text() == "2.0s wall · CPU 0.0s (0%) · waiting"
+
+
+def test_finish_freezes_wall_time(tui):
+    usage = tui.ProcessUsage()
+    usage.rss, usage.cpu_rate = 4096, 0.5
+    usage.finish()
+    wall = usage.wall
+    time.sleep(0.05)
+    usage.finish()
+
+    assert usage.wall == wall
+    assert (usage.rss, usage.cpu_rate) == (0, 0.0)
+
+
+def test_sample_of_empty_group(tui):
+    usage = tui.ProcessUsage()
+    usage.sample(2**22 + 1)  # above the largest pid, so no process has it as group
+    assert usage.samples == 1
+    assert (usage.cpu, usage.rss, usage.read_bytes) == (0.0, 0, 0)
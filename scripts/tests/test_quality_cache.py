@@ -0,0 +1,73 @@
+"""Tests for the quality gate's content-hash result cache."""
+
+import os
+import re
+
+import pytest
+
+# Output lines without their timestamp
+LOG_LINE_RE = re.compile(r'^\[\d{4}-\d\d-\d\d \d\d:\d\d:\d\d\] (.*)$')
+
+STUB_AREAS = "content/routing/ospf/stub-areas/index.md"
+
+
+@pytest.fixture
+def project(site, monkeypatch):
+    """Fixture site with quality settings in .env."""
+    for key in ("QUALITY_MIN_WORD_COUNT", "QUALITY_REQUIRED_SECTIONS", "QUALITY_STRICT_MODE"):
+        monkeypatch.delenv(key, raising=False)
+    (site / ".env").write_text('QUALITY_MIN_WORD_COUNT=40\n'
+                               'QUALITY_REQUIRED_SECTIONS="Overview Configuration Summary"\n')
+    return site
+
+
+def validate_all(tui, project, tmp_path):
+    """Run validate-all with a fresh gate on the shared cache; returns (gate, exit code, log lines)."""
+    output = []
+    gate = tui.QualityGate(project, workers=1, cache_dir=tmp_path / ".cache")
+    code = gate.run(["validate-all"], output.extend)
+    return gate, code, [match.group(1) for match in map(LOG_LINE_RE.match, output) if match]
+
+
+def test_cached_results_give_same_output(tui, project, tmp_path):
+    first, code, lines = validate_all(tui, project, tmp_path)
+    assert (code, first.misses) == (1, 4)
+
+    again, cached_code, cached_lines = validate_all(tui, project, tmp_path)
+    assert (again.hits, again.misses) == (4, 0)
+    assert (cached_code, cached_lines) == (code, lines)
+
+
+def test_touched_file_stays_cached_and_edited_file_is_revalidated(tui, project, tmp_path):
+    validate_all(tui, project, tmp_path)
+    post = project / STUB_AREAS
+    os.utime(post, ns=(0, 0))
+    gate, _, _ = validate_all(tui, project, tmp_path)
+    assert (gate.hits, gate.misses) == (4, 0)
+
+    post.write_text(post.read_text() + "\nOne more sentence.\n")
+    gate, _, _ = validate_all(tui, project, tmp_path)
+    assert (gate.hits, gate.misses) == (3, 1)
+
+
+def test_rules_version_change_invalidates_every_result(tui, project, tmp_path, monkeypatch):
+    validate_all(tui, project, tmp_path)
+    monkeypatch.setattr(tui, "QUALITY_RULES_VERSION", tui.QUALITY_RULES_VERSION + 1)
+    gate, _, _ = validate_all(tui, project, tmp_path)
+    assert (gate.hits, gate.misses) == (0, 4)
+
+
+def test_config_change_invalidates_every_result(tui, project, tmp_path):
+    _, _, before = validate_all(tui, project, tmp_path)
+    (project / ".env").write_text('QUALITY_MIN_WORD_COUNT=5\n'
+                                  'QUALITY_REQUIRED_SECTIONS="Overview Configuration Summary"\n')
+    gate, _, after = validate_all(tui, project, tmp_path)
+    assert (gate.hits, gate.misses) == (0, 4)
+    assert after != before
+
+
+def test_file_a_rule_looked_for_invalidates_its_post(tui, project, tmp_path):
+    validate_all(tui, project, tmp_path)
+    (project / STUB_AREAS).with_name("stub-area.png").write_bytes(b"")
+    gate, _, _ = validate_all(tui, project, tmp_path)
+    assert (gate.hits, gate.misses) == (3, 1)
@@ -0,0 +1,137 @@
+"""Tests for the native quality gate against scripts/quality-gate.sh."""
+
+import os
+import re
+import shutil
+import signal
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+
+# Output lines without their timestamp
+LOG_LINE_RE = re.compile(r'^\[\d{4}-\d\d-\d\d \d\d:\d\d:\d\d\] (.*)$')
+
+# Settings read from the environment by both implementations
+CONFIG_KEYS = ("QUALITY_STRICT_MODE", "QUALITY_MIN_WORD_COUNT", "QUALITY_REQUIRE_FEATURED_IMAGE",
+               "CONTENT_VALIDATE_LINKS", "CONTENT_VALIDATE_IMAGES", "QUALITY_REQUIRED_SECTIONS")
+
+POSTS = [
+    "content/routing/bgp/route-reflectors/index.md",
+    "content/routing/ospf/stub-areas/index.md",
+    "content/automation/no-frontmatter/index.md",
+    "content/linux/short-notes/index.md",
+    "content/linux/missing/index.md",
+]
+
+
+def awk_accepts_leading_plus() -> bool:
+    """True if awk reads /^+++$/ as a literal '+++' line (gawk does, mawk fails to compile it)."""
+    result = subprocess.run(["awk", "/^+++$/"], input="+++\n", capture_output=True, text=True)
+    return result.returncode == 0 and result.stdout == "+++\n"
+
+
+@pytest.fixture
+def project(site, monkeypatch):
+    """Fixture site with .env, scripts/lib and quality-gate.sh."""
+    if shutil.which("bash") is None or shutil.which("awk") is None:
+        pytest.skip("quality-gate.sh needs bash and awk")
+    for key in CONFIG_KEYS:
+        monkeypatch.delenv(key, raising=False)
+
+    (site / ".env").write_text('QUALITY_MIN_WORD_COUNT=40\n'
+                               'QUALITY_REQUIRED_SECTIONS="Overview Configuration Summary"\n')
+    shutil.copytree(SCRIPTS_DIR / "lib", site / "scripts" / "lib")
+    script = (SCRIPTS_DIR / "quality-gate.sh").read_text()
+    if not awk_accepts_leading_plus():
+        # Same pattern spelled so that every awk compiles it
+        script = script.replace("/^+++$/", "/^[+][+][+]$/")
+    (site / "scripts" / "quality-gate.sh").write_text(script)
+    return site
+
+
+def run_shell(project, args):
+    """Run quality-gate.sh; returns (exit code, log lines)."""
+    env = {key: value for key, value in os.environ.items() if key not in CONFIG_KEYS}
+    result = subprocess.run(["bash", str(project / "scripts" / "quality-gate.sh"), *args],
+                            cwd=project, env=env, capture_output=True, text=True, timeout=120)
+    return result.returncode, log_lines(result.stderr.splitlines())
+
+
+def run_native(tui, project, args, workers=1):
+    """Run QualityGate; returns (exit code, log lines)."""
+    output = []
+    gate = tui.QualityGate(project, workers=workers)
+    code = gate.run(args, output.extend)
+    return code, log_lines(output)
+
+
+def log_lines(lines):
+    return [match.group(1) for match in map(LOG_LINE_RE.match, lines) if match]
+
+
+@pytest.fixture(scope="session")
+def importable_tui(tmp_path_factory):
+    """
+    Make the module "tui" importable in pool worker processes.
+
+    Workers unpickle validate_post_file as tui.validate_post_file. They
+    find it through a tui.py link in a directory on sys.path, which the
+    forkserver (or each spawned worker) copies when it starts.
+    """
+    path = tmp_path_factory.mktemp("importable")
+    (path / "tui.py").symlink_to(SCRIPTS_DIR / "automation-tui.py")
+    sys.path.insert(0, str(path))
+    yield path
+    sys.path.remove(str(path))
+
+
+class InProcessOnly:
+    """Stands in for DOCUMENTS: fails if a post is validated in this process."""
+
+    def __getattr__(self, name):
+        raise AssertionError("post validated in-process instead of in the worker pool")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("command", ["validate-all", "validate-drafts"])
+def test_bulk_commands_match_shell(tui, project, command, workers, request, monkeypatch):
+    if workers > 1:
+        request.getfixturevalue("importable_tui")
+        monkeypatch.setattr(tui, "DOCUMENTS", InProcessOnly())
+    native = run_native(tui, project, [command], workers=workers)
+    assert native == run_shell(project, [command])
+    assert native[1]
+
+
+@pytest.mark.parametrize("post", POSTS)
+def test_validate_matches_shell(tui, project, post):
+    args = ["validate", str(project / post)]
+    assert run_native(tui, project, args) == run_shell(project, args)
+
+
+def test_validate_without_file_matches_shell(tui, project):
+    assert run_native(tui, project, ["validate"]) == run_shell(project, ["validate"])
+
+
+def test_fixture_outcomes(tui, project):
+    passed = run_native(tui, project, ["validate", str(project / POSTS[0])])
+    failed = run_native(tui, project, ["validate", str(project / POSTS[1])])
+    assert passed[0] == 0 and passed[1][-1].endswith("Status: PASSED")
+    assert failed[0] == 1
+    assert any(line.endswith("[QualityGate] [ERROR] Unclosed code block detected") for line in failed[1])
+
+
+def test_cancelled_run_stops_between_posts(tui, project):
+    posts = []
+
+    def emit(lines):
+        if any("Validating: " in line for line in lines):
+            posts.append(lines)
+
+    gate = tui.QualityGate(project, workers=1)
+    assert gate.run(["validate-all"], emit, cancelled=lambda: len(posts) >= 2) == -signal.SIGTERM
+    assert len(posts) == 2
@@ -0,0 +1,121 @@
+"""Tests for ShellWorkerPool against running scripts with bash directly."""
+
+import asyncio
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+
+pytestmark = [
+    pytest.mark.skipif(shutil.which("bash") is None, reason="needs bash"),
+    pytest.mark.asyncio,
+]
+
+LIBRARY_SCRIPT = """\
+#!/usr/bin/env bash
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(cd "${SCRIPT_DIR}/.." && pwd)"
+source "${PROJECT_ROOT}/scripts/lib/common.sh"
+source "${PROJECT_ROOT}/scripts/lib/logger.sh"
+source "${PROJECT_ROOT}/scripts/lib/error-handler.sh"
+source "${PROJECT_ROOT}/scripts/lib/config.sh"
+printf 'arg:%s\\n' "$@"
+echo "pwd:$PWD"
+echo "slug:$(generate_slug "$1")"
+[[ "$1" == "fail" ]] && exit 3
+exit 0
+"""
+
+
+# .env with every key config.sh requires, so loading the libraries is quiet
+ENV = ('SITE_URL=https://example.com\nHUGO_VERSION=0.140.0\nGIT_AUTHOR_NAME=Test\n'
+       'GITHUB_REPO=example/site\nCONTENT_DIR=content/routing\n')
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Project with scripts/lib, a library-based script and scripts that are not."""
+    shutil.copytree(SCRIPTS_DIR / "lib", tmp_path / "scripts" / "lib")
+    (tmp_path / "scripts" / "lib-user.sh").write_text(LIBRARY_SCRIPT)
+    (tmp_path / "scripts" / "no-config.sh").write_text(
+        LIBRARY_SCRIPT.replace('source "${PROJECT_ROOT}/scripts/lib/config.sh"\n', ""))
+    (tmp_path / "scripts" / "plain.sh").write_text("#!/usr/bin/env bash\necho plain\n")
+    (tmp_path / ".env").write_text(ENV)
+    (tmp_path / "content" / "routing").mkdir(parents=True)
+    return tmp_path
+
+
+@pytest_asyncio.fixture
+async def pool(tui, project):
+    """Pool over the project; stopped after the test."""
+    pool = tui.ShellWorkerPool(project, max_workers=2)
+    yield pool
+    workers = list(pool._workers)
+    pool.close()
+    for worker in workers:
+        await worker.process.wait()
+
+
+def run_bash(project, args):
+    """Run a script with bash; returns (exit code, output lines)."""
+    result = subprocess.run(["bash", *args], cwd=project, capture_output=True, text=True, timeout=60)
+    return result.returncode, (result.stdout + result.stderr).splitlines()
+
+
+async def run_pooled(pool, project, args):
+    """Run a script in the pool; returns (exit code, output lines)."""
+    output = []
+    code = await pool.run(["bash", *args], str(project), on_output=output.append)
+    return code, output
+
+
+async def test_handles_only_library_scripts(pool):
+    assert pool.handles(["bash", "scripts/lib-user.sh", "x"])
+    assert not pool.handles(["bash", "scripts/plain.sh"])
+    assert not pool.handles(["bash", "scripts/no-config.sh"])
+    assert not pool.handles(["bash", "scripts/missing.sh"])
+    assert not pool.handles(["sh", "scripts/lib-user.sh"])
+
+
+@pytest.mark.parametrize("args", [
+    ["scripts/lib-user.sh", "BGP Route Reflectors", "two words", ""],
+    ["scripts/lib-user.sh", "fail"],
+])
+async def test_output_and_exit_code_match_bash(pool, project, args):
+    assert await run_pooled(pool, project, args) == run_bash(project, args)
+
+
+async def test_worker_is_reused_until_env_changes(pool, project):
+    await run_pooled(pool, project, ["scripts/lib-user.sh", "a"])
+    [worker] = pool._workers
+    await run_pooled(pool, project, ["scripts/lib-user.sh", "fail"])
+    assert pool._workers == [worker] and worker.alive
+
+    env = project / ".env"
+    env.write_text(ENV.replace("content/routing", "content"))
+    os.utime(env, ns=(0, 0))
+    await run_pooled(pool, project, ["scripts/lib-user.sh", "b"])
+    assert worker not in pool._workers and len(pool._workers) == 1
+    await asyncio.wait_for(worker.process.wait(), 5)
+
+
+async def test_library_load_output_is_reported_once(pool, project):
+    (project / ".env").write_text("SITE_URL=https://example.com\n")
+    preambles = []
+    pool.on_preamble = preambles.append
+
+    first = await run_pooled(pool, project, ["scripts/lib-user.sh", "a"])
+    second = await run_pooled(pool, project, ["scripts/lib-user.sh", "a"])
+    assert len(preambles) == 1
+    assert any("HUGO_VERSION" in line for line in preambles[0])
+    assert first == second and not any("HUGO_VERSION" in line for line in first[1])
+
+
+async def test_no_worker_available_returns_none(pool, project):
+    pool.max_workers = 0
+    assert await pool.run(["bash", "scripts/lib-user.sh"], str(project)) is None